@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the Multiplatform Code Generator MCP server.
+
+Reports the per-message overhead of the request loop for a few representative
+messages. Run with MULTIPLATFORM_JSON_BACKEND=json to compare against the
+standard library JSON backend.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from multiplatform_code_generator.models import (
+    GenerateMultiplatformCodeRequest,
+    ParseCppInterfaceRequest,
+)
+from multiplatform_code_generator.server import MultiplatformCodeGeneratorServer
+from multiplatform_code_generator.utils import json_codec
+
+
+def _call(request_id, name, arguments):
+    """Build a tools/call request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+PARSE_ARGUMENTS = {"cpp_interface": "int add(int a, int b);"}
+
+GENERATE_ARGUMENTS = {
+    "cpp_interface": "int add(int a, int b);",
+    "output_directory": "/tmp/multiplatform-benchmark",
+    "platforms": ["android", "ios", "harmony"],
+    "android_config": {"package_name": "com.example.math", "class_name": "MathUtils"},
+    "ios_config": {"class_prefix": "MU"},
+    "harmony_config": {"module_name": "mathutils"},
+}
+
+MESSAGES = {
+    "tools/list": {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+    "list_supported_platforms": _call(2, "list_supported_platforms", {}),
+    "parse_cpp_interface": _call(3, "parse_cpp_interface", PARSE_ARGUMENTS),
+    "batch of 200 parse_cpp_interface": [
+        _call(i, "parse_cpp_interface", PARSE_ARGUMENTS) for i in range(200)
+    ],
+}
+
+
+async def bench_message(server, message, iterations: int) -> float:
+    """Return the mean time in microseconds to handle one encoded message."""
+    data = json_codec.dumps(message)
+    # Warm up caches and worker threads
+    for _ in range(min(iterations, 50)):
+        await server.handle_message(data)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await server.handle_message(data)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_validation(model, arguments, iterations: int) -> float:
+    """Return the mean time in microseconds to validate arguments into a request."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        model.from_arguments(arguments)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+async def main() -> int:
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description="MCP server microbenchmarks")
+    parser.add_argument("-n", "--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    server = MultiplatformCodeGeneratorServer().server
+
+    print(f"⏱️  MCP server microbenchmarks (JSON backend: {json_codec.BACKEND})\n")
+    for name, message in MESSAGES.items():
+        iterations = args.iterations // 100 if isinstance(message, list) else args.iterations
+        mean_us = await bench_message(server, message, max(iterations, 1))
+        print(f"   {name:<36} {mean_us:>10.1f} µs/message")
+
+    print("\n⏱️  Argument validation\n")
+    for name, model, arguments in (
+        ("generate_multiplatform_code", GenerateMultiplatformCodeRequest, GENERATE_ARGUMENTS),
+        ("parse_cpp_interface", ParseCppInterfaceRequest, PARSE_ARGUMENTS),
+    ):
+        mean_us = bench_validation(model, arguments, args.iterations * 10)
+        print(f"   {name:<36} {mean_us:>10.2f} µs/request")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    exit(exit_code)
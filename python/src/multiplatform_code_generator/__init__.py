@@ -4,17 +4,24 @@ Multiplatform Code Generator
 A powerful MCP tool for generating cross-platform code from C++ interfaces.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "1.0.0"
 __author__ = "Multiplatform Code Generator Team"
 __license__ = "MIT"
 
-from .main import main
-from .server import MultiplatformCodeGeneratorServer
-from .parsers.cpp_parser import CppInterfaceParser
-from .generators.android_jni import AndroidJniGenerator
-from .generators.ios_oc import IosOcGenerator
-from .generators.harmony_napi import HarmonyNapiGenerator
-from .utils.file_manager import FileManager
+# Exported names and their submodules, imported on first access: the server
+# entry point should not pay for generators, request models or file I/O up front
+_LAZY_IMPORTS = {
+    "main": ".main",
+    "MultiplatformCodeGeneratorServer": ".server",
+    "CppInterfaceParser": ".parsers.cpp_parser",
+    "AndroidJniGenerator": ".generators.android_jni",
+    "IosOcGenerator": ".generators.ios_oc",
+    "HarmonyNapiGenerator": ".generators.harmony_napi",
+    "FileManager": ".utils.file_manager",
+}
 
 __all__ = [
     "main",
@@ -25,3 +32,12 @@ __all__ = [
     "HarmonyNapiGenerator",
     "FileManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
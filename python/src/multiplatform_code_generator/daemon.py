@@ -0,0 +1,255 @@
+"""
+Local daemon transport for the MCP server.
+
+Serves one SimpleMCPServer over a Unix domain socket so that many MCP clients
+share a single warm process (imports, parse cache, worker threads), and
+provides the thin stdio shim each client launches to reach the daemon.
+"""
+
+import asyncio
+import itertools
+import os
+import socket
+import struct
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from .mcp_types import SimpleMCPServer, _transport_send
+
+
+# Largest message line accepted on the socket
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+# Seconds the shim waits for a daemon it started to accept connections
+SPAWN_TIMEOUT = 10.0
+
+
+@dataclass
+class ClientStats:
+    """Request latency statistics of one connected client."""
+    client_id: int
+    pid: Optional[int] = None
+    requests: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    def record(self, latency: float) -> None:
+        """Record the latency of one answered message."""
+        self.requests += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics with latencies in milliseconds."""
+        mean = self.total_latency / self.requests if self.requests else 0.0
+        return {
+            "client_id": self.client_id,
+            "pid": self.pid,
+            "requests": self.requests,
+            "mean_latency_ms": round(mean * 1000, 3),
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+
+class MCPDaemon:
+    """Serves a SimpleMCPServer to many clients over a Unix domain socket."""
+
+    def __init__(self, server: SimpleMCPServer, socket_path: Union[str, Path]):
+        """
+        Initialize the daemon.
+        
+        Args:
+            server: MCP server shared by all clients
+            socket_path: Filesystem path of the Unix domain socket
+        """
+        self.server = server
+        self.socket_path = Path(socket_path)
+        self.clients: Dict[int, ClientStats] = {}
+        self._client_ids = itertools.count(1)
+
+    def client_stats(self) -> List[Dict[str, Any]]:
+        """Return per-client latency statistics of connected clients."""
+        return [stats.to_dict() for stats in self.clients.values()]
+
+    async def serve_forever(self) -> None:
+        """Listen on the socket until cancelled."""
+        self._remove_stale_socket()
+        unix_server = await asyncio.start_unix_server(
+            self._handle_client, path=str(self.socket_path), limit=MAX_MESSAGE_SIZE
+        )
+        os.chmod(self.socket_path, 0o600)
+        print(f"🚀 {self.server.name} MCP daemon listening on {self.socket_path}", file=sys.stderr)
+        
+        try:
+            async with unix_server:
+                await unix_server.serve_forever()
+        finally:
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            self.server.close()
+            print("🛑 MCP daemon stopped", file=sys.stderr)
+
+    def _remove_stale_socket(self) -> None:
+        """Remove a socket file left behind by a daemon that is gone."""
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+        else:
+            raise RuntimeError(f"An MCP daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection."""
+        stats = ClientStats(next(self._client_ids), _peer_pid(writer))
+        self.clients[stats.client_id] = stats
+        
+        def send(message: bytes) -> None:
+            if not writer.is_closing():
+                writer.write(message + b"\n")
+        
+        # Request tasks of this connection inherit its writer
+        _transport_send.set(send)
+        in_flight: Set[asyncio.Future] = set()
+        
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):
+                    # Reset by the client or an oversized line: nobody is
+                    # left to read the responses
+                    self.server.cancel_connection_requests("client disconnected")
+                    break
+                if not line:
+                    break
+                
+                line = line.strip()
+                if not line:
+                    continue
+                
+                task = asyncio.ensure_future(self._process_message(line, send, stats))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            
+            # The client closed its side: answer what it already sent
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+        finally:
+            del self.clients[stats.client_id]
+            writer.close()
+            summary = stats.to_dict()
+            print(
+                f"👋 client {summary['client_id']} (pid {summary['pid']}) disconnected: "
+                f"{summary['requests']} requests, mean {summary['mean_latency_ms']} ms, "
+                f"max {summary['max_latency_ms']} ms",
+                file=sys.stderr,
+            )
+
+    async def _process_message(self, line: bytes, send: Any, stats: ClientStats) -> None:
+        """Handle one message and record its latency for the client."""
+        start = time.perf_counter()
+        response = await self.server.handle_message(line)
+        if response is not None:
+            send(response)
+            stats.record(time.perf_counter() - start)
+
+
+def _peer_pid(writer: asyncio.StreamWriter) -> Optional[int]:
+    """Return the process id of the peer of a Unix socket, where supported."""
+    sock = writer.get_extra_info("socket")
+    peer_cred = getattr(socket, "SO_PEERCRED", None)
+    if sock is None or peer_cred is None:
+        return None
+    try:
+        creds = sock.getsockopt(socket.SOL_SOCKET, peer_cred, struct.calcsize("3i"))
+    except OSError:
+        return None
+    return struct.unpack("3i", creds)[0]
+
+
+def child_process_env() -> Dict[str, str]:
+    """Environment for child server processes, able to import this package."""
+    env = dict(os.environ)
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    return env
+
+
+def spawn_daemon(socket_path: Union[str, Path]) -> subprocess.Popen:
+    """Start a detached daemon process serving on ``socket_path``."""
+    log_file = open(f"{socket_path}.log", "ab")
+    try:
+        return subprocess.Popen(
+            [sys.executable, "-m", "multiplatform_code_generator.main", "--daemon", str(socket_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_file,
+            env=child_process_env(),
+            start_new_session=True,
+        )
+    finally:
+        log_file.close()
+
+
+async def _connect(socket_path: Union[str, Path], spawn: bool):
+    """Connect to the daemon, starting it first if needed and allowed."""
+    try:
+        return await asyncio.open_unix_connection(str(socket_path), limit=MAX_MESSAGE_SIZE)
+    except (FileNotFoundError, ConnectionRefusedError):
+        if not spawn:
+            raise
+    
+    spawn_daemon(socket_path)
+    deadline = time.monotonic() + SPAWN_TIMEOUT
+    while True:
+        await asyncio.sleep(0.05)
+        try:
+            return await asyncio.open_unix_connection(str(socket_path), limit=MAX_MESSAGE_SIZE)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() > deadline:
+                raise
+
+
+async def run_stdio_shim(socket_path: Union[str, Path], spawn: bool = True) -> None:
+    """
+    Forward stdio to the daemon on ``socket_path``.
+    
+    Args:
+        socket_path: Socket of the daemon
+        spawn: Start the daemon if none is listening
+    """
+    reader, writer = await _connect(socket_path, spawn)
+    loop = asyncio.get_event_loop()
+    
+    async def forward_stdin() -> None:
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.buffer.readline)
+            if not line:
+                break
+            writer.write(line if line.endswith(b"\n") else line + b"\n")
+            await writer.drain()
+        # Half-close: the daemon answers pending requests, then closes
+        writer.write_eof()
+    
+    stdin_task = asyncio.ensure_future(forward_stdin())
+    stdout = sys.stdout.buffer
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            stdout.write(line)
+            stdout.flush()
+    finally:
+        stdin_task.cancel()
+        writer.close()
@@ -2,8 +2,24 @@
 Code generators module for the Multiplatform Code Generator.
 """
 
-from .android_jni import AndroidJniGenerator
-from .ios_oc import IosOcGenerator
-from .harmony_napi import HarmonyNapiGenerator
+import importlib
+from typing import Any
+
+# Exported generators and their submodules, imported on first access so a
+# client using one platform never loads the others
+_LAZY_IMPORTS = {
+    "AndroidJniGenerator": ".android_jni",
+    "IosOcGenerator": ".ios_oc",
+    "HarmonyNapiGenerator": ".harmony_napi",
+}
 
 __all__ = ["AndroidJniGenerator", "IosOcGenerator", "HarmonyNapiGenerator"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
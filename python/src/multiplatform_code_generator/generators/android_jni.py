@@ -4,11 +4,47 @@ Android JNI Code Generator
 Generates JNI C++ code and corresponding Java/Kotlin wrapper classes.
 """
 
-from typing import Dict, List, Any
-from ..parsers.cpp_parser import ParsedFunction, Parameter
+import dataclasses
+from typing import Dict, List, Any, Optional, Union
+from ..parsers.cpp_parser import ParsedClass, ParsedFunction, Parameter
 from ..utils.file_manager import FileManager
 
 
+# Native method binding modes: exported Java_<package>_<Class>_<method>
+# symbols resolved by the runtime on first call, or a RegisterNatives table
+# filled in JNI_OnLoad with every other symbol hidden
+STATIC_REGISTRATION = "static"
+DYNAMIC_REGISTRATION = "dynamic"
+
+# Native method annotations lowering the JNI transition cost: @FastNative
+# skips the thread state change, @CriticalNative additionally drops the
+# JNIEnv and jobject/jclass arguments
+NO_ANNOTATION = "none"
+FAST_NATIVE = "fast"
+CRITICAL_NATIVE = "critical"
+
+# Types passed and returned without any conversion, the only ones allowed in
+# annotated native methods
+_PRIMITIVE_TYPES = {'boolean', 'byte', 'short', 'int', 'long', 'float', 'double'}
+
+# Array parameter bindings: a primitive array pinned for the call with
+# GetPrimitiveArrayCritical, or a direct ByteBuffer accessed in place
+ARRAY_BINDING = "array"
+DIRECT_BUFFER_BINDING = "direct_buffer"
+
+# Bytes of Modified UTF-8 copied into a stack buffer before falling back to
+# the heap when marshalling a jstring argument
+DEFAULT_STRING_BUFFER_SIZE = 256
+
+# Elements of a String[] marshalled per local reference frame, and local
+# references each element takes in it (the jstring read or created)
+LOCAL_FRAME_ELEMENTS = 256
+_LOCAL_REFS_PER_ELEMENT = {'string': 1}
+
+# Elements of the collections passed by the stress test
+STRESS_TEST_ELEMENTS = 100_000
+
+
 class AndroidJniGenerator:
     """Android JNI code generator."""
 
@@ -22,6 +58,16 @@ class AndroidJniGenerator:
         self.package_name = config["package_name"]
         self.class_name = config["class_name"]
         self.language = config.get("language", "java")
+        self.registration = config.get("registration", STATIC_REGISTRATION)
+        self.native_annotation = config.get("native_annotation", NO_ANNOTATION)
+        self.string_buffer_size = config.get("string_buffer_size", DEFAULT_STRING_BUFFER_SIZE)
+        self.benchmark = config.get("benchmark", False)
+        self.stress_test = config.get("stress_test", False)
+        self.benchmark_module = config.get("benchmark_module", False)
+        self.array_binding = config.get("array_binding", {})
+        self.batch = config.get("batch", False)
+        self.async_wrappers = config.get("async_wrappers", False)
+        self.native_thread_pool_size = config.get("native_thread_pool_size")
 
     async def generate(self, parsed_interface: ParsedFunction, file_manager: FileManager) -> List[str]:
         """
@@ -34,91 +80,738 @@ class AndroidJniGenerator:
         Returns:
             List of generated file paths
         """
-        files = []
+        files = self.render(parsed_interface)
+        for file_path, content in files.items():
+            await file_manager.write_file(file_path, content)
+        return list(files)
+
+    def render(self, parsed_interface: ParsedFunction) -> Dict[str, str]:
+        """
+        Render Android JNI code without writing it.
+        
+        Args:
+            parsed_interface: Parsed C++ interface
+            
+        Returns:
+            Mapping of relative file path to file content, in generation order
+        """
+        files: Dict[str, str] = {}
 
         # Generate JNI C++ code
         jni_cpp_code = self._generate_jni_cpp(parsed_interface)
         jni_cpp_file = f"android/jni/{parsed_interface.function_name}_jni.cpp"
-        await file_manager.write_file(jni_cpp_file, jni_cpp_code)
-        files.append(jni_cpp_file)
+        files[jni_cpp_file] = jni_cpp_code
 
         # Generate JNI header file
         jni_header_code = self._generate_jni_header(parsed_interface)
         jni_header_file = f"android/jni/{parsed_interface.function_name}_jni.h"
-        await file_manager.write_file(jni_header_file, jni_header_code)
-        files.append(jni_header_file)
+        files[jni_header_file] = jni_header_code
 
         # Generate Java/Kotlin wrapper class
         if self.language == "kotlin":
             kotlin_code = self._generate_kotlin_wrapper(parsed_interface)
             kotlin_file = f"android/src/main/kotlin/{self.package_name.replace('.', '/')}/{self.class_name}.kt"
-            await file_manager.write_file(kotlin_file, kotlin_code)
-            files.append(kotlin_file)
+            files[kotlin_file] = kotlin_code
         else:
             java_code = self._generate_java_wrapper(parsed_interface)
             java_file = f"android/src/main/java/{self.package_name.replace('.', '/')}/{self.class_name}.java"
-            await file_manager.write_file(java_file, java_code)
-            files.append(java_file)
+            files[java_file] = java_code
+
+        # Generate the microbenchmark template
+        if self.benchmark:
+            extension = "kt" if self.language == "kotlin" else "java"
+            benchmark_file = (
+                f"android/src/androidTest/{'kotlin' if self.language == 'kotlin' else 'java'}/"
+                f"{self.package_name.replace('.', '/')}/{self.class_name}Benchmark.{extension}"
+            )
+            files[benchmark_file] = self._generate_benchmark(parsed_interface)
+
+        # Generate the large collection stress test template
+        if self.stress_test and self._has_collections(parsed_interface):
+            extension = "kt" if self.language == "kotlin" else "java"
+            stress_test_file = (
+                f"android/src/androidTest/{'kotlin' if self.language == 'kotlin' else 'java'}/"
+                f"{self.package_name.replace('.', '/')}/{self.class_name}StressTest.{extension}"
+            )
+            files[stress_test_file] = self._generate_stress_test(parsed_interface)
+
+        # Generate the Jetpack Microbenchmark module
+        if self.benchmark_module:
+            files.update(self._generate_benchmark_module(parsed_interface))
 
         # Generate CMakeLists.txt
-        cmake_code = self._generate_cmake_lists(parsed_interface)
+        cmake_code = self._generate_cmake_lists(parsed_interface.function_name)
         cmake_file = "android/jni/CMakeLists.txt"
-        await file_manager.write_file(cmake_file, cmake_code)
-        files.append(cmake_file)
+        files[cmake_file] = cmake_code
 
         # Generate build.gradle configuration
         gradle_code = self._generate_gradle_config()
         gradle_file = "android/build.gradle.jni"
-        await file_manager.write_file(gradle_file, gradle_code)
-        files.append(gradle_file)
+        files[gradle_file] = gradle_code
+
+        return files
+
+    def render_class(self, parsed_class: ParsedClass) -> Dict[str, str]:
+        """
+        Render Android JNI code binding a C++ class without writing it.
+
+        The Java/Kotlin class owns a C++ instance through a ``long`` handle
+        passed to static natives, so member calls do no field or class
+        lookup. The instance is deleted by ``close()`` or, failing that, by
+        a ``Cleaner`` once the wrapper is unreachable. Batch, async and
+        benchmark options apply to functions only.
+
+        Args:
+            parsed_class: Parsed C++ class
+
+        Returns:
+            Mapping of relative file path to file content, in generation order
+        """
+        files: Dict[str, str] = {}
+        natives = self._get_class_natives(parsed_class)
+        class_name = parsed_class.class_name
+
+        files[f"android/jni/{class_name}_jni.cpp"] = self._generate_class_jni_cpp(parsed_class, natives)
+        files[f"android/jni/{class_name}_jni.h"] = self._generate_class_jni_header(parsed_class, natives)
+
+        package_path = self.package_name.replace('.', '/')
+        if self.language == "kotlin":
+            kotlin_file = f"android/src/main/kotlin/{package_path}/{self.class_name}.kt"
+            files[kotlin_file] = self._generate_kotlin_class_wrapper(parsed_class, natives)
+        else:
+            java_file = f"android/src/main/java/{package_path}/{self.class_name}.java"
+            files[java_file] = self._generate_java_class_wrapper(parsed_class, natives)
+
+        files["android/jni/CMakeLists.txt"] = self._generate_cmake_lists(class_name)
+        files["android/build.gradle.jni"] = self._generate_gradle_config(class_handles=True)
+
+        if self.benchmark_module:
+            files.update(self._generate_benchmark_module(parsed_class))
 
         return files
 
     def _generate_jni_cpp(self, parsed_interface: ParsedFunction) -> str:
         """Generate JNI C++ implementation code."""
+        includes = self._generate_jni_includes(
+            parsed_interface.function_name, parsed_interface.namespace, [parsed_interface]
+        )
+
+        if self.registration == DYNAMIC_REGISTRATION:
+            return self._generate_registered_jni_cpp(parsed_interface, includes)
+
+        jni_function_name = self._get_jni_function_name(parsed_interface.function_name)
+        return f"""{includes}
+
+namespace {{
+
+{self._generate_support_code([parsed_interface])}
+
+}} // namespace
+
+extern "C" {{
+
+JNIEXPORT {self._generate_jni_function(parsed_interface, jni_function_name)}{self._generate_exported_batch_function(parsed_interface)}
+
+}} // extern "C"
+
+{self._generate_jni_onload(parsed_interface)}"""
+
+    def _generate_jni_includes(
+        self, source_name: str, namespace: Optional[str], functions: List[ParsedFunction], batch: bool = True
+    ) -> str:
+        """Generate the includes of the JNI C++ file wrapping the functions."""
+        includes = f"""#include <jni.h>
+#include "{source_name}_jni.h"
+{f'#include "{namespace}.h"' if namespace else '// Include your C++ header file here'}"""
+        if any(self._uses_strings(function) for function in functions):
+            includes += """
+#include <cstring>
+#include <memory>
+#include <string>
+#include <string_view>"""
+        if (batch and any(self._has_batch(function) for function in functions)) or any(
+            self._is_array(param) or self._is_string_array(param.type)
+            for function in functions for param in function.parameters
+        ):
+            includes += """
+#include <cstddef>
+#include <vector>"""
+        if any(self._is_mutable_vector(param) for function in functions for param in function.parameters):
+            includes += """
+#include <algorithm>"""
+        return includes
+
+    def _generate_registered_jni_cpp(self, parsed_interface: ParsedFunction, includes: str) -> str:
+        """Generate JNI C++ code bound through RegisterNatives in JNI_OnLoad."""
+        function_name = parsed_interface.function_name
+        native_name = f"{function_name}Native"
+        register_function = self._get_register_function_name()
+        batch_function = ""
+        batch_entry = ""
+        if self._has_batch(parsed_interface):
+            batch_name = f"{function_name}BatchNative"
+            batch_function = f"\n\n{self._generate_batch_function(parsed_interface, batch_name)}"
+            batch_entry = (
+                f'\n    {{"{batch_name}", "{self._get_batch_method_signature(parsed_interface)}", '
+                f'reinterpret_cast<void *>({batch_name})}},'
+            )
+
+        return f"""{includes}
+
+namespace {{
+
+{self._generate_support_code([parsed_interface])}
+
+// Internal linkage: bound through the RegisterNatives table below instead
+// of an exported Java_ symbol looked up with dlsym on first call
+{self._generate_jni_function(parsed_interface, native_name)}{batch_function}
+
+const JNINativeMethod kNativeMethods[] = {{
+    {{"{native_name}", "{self._get_jni_method_signature(parsed_interface)}", reinterpret_cast<void *>({native_name})}},{batch_entry}
+}};
+
+}} // namespace
+
+jint {register_function}(JNIEnv *env) {{
+    return env->RegisterNatives(
+        gJniCache.nativeClass, kNativeMethods, sizeof(kNativeMethods) / sizeof(kNativeMethods[0]));
+}}
+
+{self._generate_jni_onload(parsed_interface)}"""
+
+    def _generate_support_code(self, functions: List[ParsedFunction], batch: bool = True) -> str:
+        """Generate the JNI cache and the marshalling helpers used by the wrapped functions."""
+        return (
+            f"{self._generate_jni_cache(functions)}{self._generate_string_helpers(functions)}"
+            f"{self._generate_array_helpers(functions, batch)}"
+        )
+
+    def _get_cached_classes(self, functions: List[ParsedFunction]) -> List[Dict[str, str]]:
+        """Get the classes held as global references in the JNI cache."""
+        classes = [
+            {"member": "runtimeExceptionClass", "class_path": "java/lang/RuntimeException"},
+        ]
+        if any(self._is_direct_buffer(param) for function in functions for param in function.parameters):
+            classes.append({
+                "member": "illegalArgumentExceptionClass",
+                "class_path": "java/lang/IllegalArgumentException",
+            })
+        if any(self._is_string_array(function.return_type) for function in functions):
+            # Element class of String[] results
+            classes.append({"member": "stringClass", "class_path": "java/lang/String"})
+        if self.registration == DYNAMIC_REGISTRATION:
+            classes.append({
+                "member": "nativeClass",
+                "class_path": f"{self.package_name.replace('.', '/')}/{self.class_name}",
+            })
+        return classes
+
+    def _generate_jni_cache(self, functions: List[ParsedFunction]) -> str:
+        """Generate the library's cache of global class references."""
+        classes = self._get_cached_classes(functions)
+
+        declarations = [f"    jclass {entry['member']} = nullptr;" for entry in classes]
+
+        lookups = []
+        for entry in classes:
+            lookups.append(f"""    jclass {entry['member']}Local = env->FindClass("{entry['class_path']}");
+    if ({entry['member']}Local == nullptr) {{
+        return false;
+    }}
+    gJniCache.{entry['member']} = static_cast<jclass>(env->NewGlobalRef({entry['member']}Local));
+    env->DeleteLocalRef({entry['member']}Local);
+    if (gJniCache.{entry['member']} == nullptr) {{
+        return false;
+    }}""")
+
+        releases = "\n".join(
+            f"""    if (gJniCache.{entry['member']} != nullptr) {{
+        env->DeleteGlobalRef(gJniCache.{entry['member']});
+    }}"""
+            for entry in classes
+        )
+
+        declarations_code = "\n".join(declarations)
+        lookups_code = "\n".join(lookups)
+        return f"""// Global class references, looked up once in JNI_OnLoad
+// instead of on every call
+struct JniCache {{
+{declarations_code}
+}};
+
+JniCache gJniCache;
+
+bool InitJniCache(JNIEnv *env) {{
+{lookups_code}
+    return true;
+}}
+
+void ReleaseJniCache(JNIEnv *env) {{
+{releases}
+    gJniCache = JniCache();
+}}"""
+
+    def _generate_string_helpers(self, functions: List[ParsedFunction]) -> str:
+        """Generate the jstring marshalling helpers used by the wrapper."""
+        if not any(self._uses_strings(function) for function in functions):
+            return ""
+        return f"""{self._generate_string_helper_classes()}{self._generate_string_array_helpers(functions)}"""
+
+    def _generate_string_helper_classes(self) -> str:
+        """Generate the jstring argument and result conversions."""
+        return f"""
+
+constexpr size_t kInlineStringBytes = {self.string_buffer_size};
+
+// Modified UTF-8 copy of a jstring made with GetStringUTFRegion: into an
+// inline stack buffer for short strings, a heap buffer for long ones. Unlike
+// GetStringUTFChars there is no runtime allocation and release per call.
+// Converts to whichever of std::string_view, const char * or std::string
+// the C++ function takes, so string_view parameters are never copied again
+class JniUtfString {{
+public:
+    JniUtfString(JNIEnv *env, jstring value) {{
+        if (value == nullptr) {{
+            inline_[0] = '\\0';
+            return;
+        }}
+        size_ = static_cast<size_t>(env->GetStringUTFLength(value));
+        if (size_ >= kInlineStringBytes) {{
+            heap_.reset(new char[size_ + 1]);
+            data_ = heap_.get();
+        }}
+        env->GetStringUTFRegion(value, 0, env->GetStringLength(value), data_);
+        data_[size_] = '\\0';
+    }}
+
+    JniUtfString(const JniUtfString &) = delete;
+    JniUtfString &operator=(const JniUtfString &) = delete;
+
+    operator std::string_view() const {{ return {{data_, size_}}; }}
+    operator const char *() const {{ return data_; }}
+    operator std::string() const {{ return {{data_, size_}}; }}
+
+private:
+    char inline_[kInlineStringBytes];
+    std::unique_ptr<char[]> heap_;
+    char *data_ = inline_;
+    size_t size_ = 0;
+}};
+
+// jstring from the C++ result, copying only a string_view, which is not
+// null-terminated
+jstring NewJString(JNIEnv *env, const char *value) {{
+    return env->NewStringUTF(value);
+}}
+
+jstring NewJString(JNIEnv *env, const std::string &value) {{
+    return env->NewStringUTF(value.c_str());
+}}
+
+jstring NewJString(JNIEnv *env, std::string_view value) {{
+    if (value.size() < kInlineStringBytes) {{
+        char buffer[kInlineStringBytes];
+        std::memcpy(buffer, value.data(), value.size());
+        buffer[value.size()] = '\\0';
+        return env->NewStringUTF(buffer);
+    }}
+    return env->NewStringUTF(std::string(value).c_str());
+}}"""
+
+    def _generate_string_array_helpers(self, functions: List[ParsedFunction]) -> str:
+        """
+        Generate the String[] conversions used by the wrapper.
+
+        Each element read or created is a local reference, so the loops
+        marshal the elements in local reference frames of
+        LOCAL_FRAME_ELEMENTS elements, sized from the references each
+        element takes: any number of elements stays within the local
+        reference table, and the references are released a frame at a time.
+        """
+        takes_arrays = any(
+            self._is_string_array(param.type) for function in functions for param in function.parameters
+        )
+        returns_arrays = any(self._is_string_array(function.return_type) for function in functions)
+        if not takes_arrays and not returns_arrays:
+            return ""
+
+        helpers = [f"""
+
+// String[] elements marshalled per local reference frame, and the frame
+// capacity they need: each element read or created is a local reference
+constexpr jsize kLocalFrameElements = {LOCAL_FRAME_ELEMENTS};
+constexpr jint kLocalRefsPerStringElement = {_LOCAL_REFS_PER_ELEMENT['string']};
+
+// Elements [start, end) of the next local reference frame
+jsize LocalFrameEnd(jsize start, jsize length) {{
+    return length - start < kLocalFrameElements ? length : start + kLocalFrameElements;
+}}"""]
+        if takes_arrays:
+            helpers.append("""
+
+// Copy of a String[] argument, converting to std::vector<std::string>. The
+// element references are released with their frame. Returns false with an
+// OutOfMemoryError pending when a frame cannot be allocated
+bool CopyJStringArray(JNIEnv *env, jobjectArray array, std::vector<std::string> &values) {
+    if (array == nullptr) {
+        return true;
+    }
+    const jsize length = env->GetArrayLength(array);
+    values.reserve(static_cast<size_t>(length));
+    for (jsize start = 0; start < length; start = LocalFrameEnd(start, length)) {
+        const jsize end = LocalFrameEnd(start, length);
+        if (env->PushLocalFrame((end - start) * kLocalRefsPerStringElement) != JNI_OK) {
+            return false;
+        }
+        for (jsize i = start; i < end; ++i) {
+            JniUtfString value(env, static_cast<jstring>(env->GetObjectArrayElement(array, i)));
+            std::string_view view = value;
+            values.emplace_back(view);
+        }
+        env->PopLocalFrame(nullptr);
+    }
+    return true;
+}""")
+        if returns_arrays:
+            helpers.append("""
+
+// String[] from a C++ collection of strings, the element references
+// released with their frame. Returns nullptr with an exception pending on
+// failure
+template <typename Strings>
+jobjectArray NewJStringArray(JNIEnv *env, const Strings &values) {
+    const jsize length = static_cast<jsize>(values.size());
+    jobjectArray array = env->NewObjectArray(length, gJniCache.stringClass, nullptr);
+    if (array == nullptr) {
+        return nullptr;
+    }
+    for (jsize start = 0; start < length; start = LocalFrameEnd(start, length)) {
+        const jsize end = LocalFrameEnd(start, length);
+        if (env->PushLocalFrame((end - start) * kLocalRefsPerStringElement) != JNI_OK) {
+            return nullptr;
+        }
+        for (jsize i = start; i < end; ++i) {
+            jstring value = NewJString(env, values[static_cast<size_t>(i)]);
+            if (value == nullptr) {
+                env->PopLocalFrame(nullptr);
+                return nullptr;
+            }
+            env->SetObjectArrayElement(array, i, value);
+        }
+        env->PopLocalFrame(nullptr);
+    }
+    return array;
+}""")
+        return "".join(helpers)
+
+    def _generate_array_helpers(self, functions: List[ParsedFunction], batch: bool = True) -> str:
+        """Generate the array and direct buffer access helpers used by the wrapper."""
+        array_params = [
+            param for function in functions for param in function.parameters if self._is_array(param)
+        ]
+        has_batch = batch and any(self._has_batch(function) for function in functions)
+        if not array_params and not has_batch:
+            return ""
+
+        helpers = ["""
+
+// Elements of an array argument. Converts to whichever of T * (any element
+// type of the same size) or std::vector<T> the C++ function takes
+template <typename T>
+class JniElements {
+public:
+    T *data() const { return data_; }
+    size_t size() const { return size_; }
+
+    template <typename U>
+    operator U *() const {
+        static_assert(sizeof(U) == sizeof(T), "element size mismatch");
+        return reinterpret_cast<U *>(data_);
+    }
+
+    template <typename U>
+    operator std::vector<U>() const { return std::vector<U>(data_, data_ + size_); }
+
+protected:
+    T *data_ = nullptr;
+    size_t size_ = 0;
+};"""]
+        if has_batch or any(not self._is_direct_buffer(param) for param in array_params):
+            helpers.append("""
+
+// Thrown out of a native call when a Java exception is already pending,
+// to return to Java without throwing another one
+struct JniPendingException {};
+
+// Primitive array pinned with GetPrimitiveArrayCritical, usually without a
+// copy, until the end of the scope. No JNI calls may be made meanwhile.
+template <typename T>
+class JniArrayElements : public JniElements<T> {
+public:
+    JniArrayElements(JNIEnv *env, jarray array, jint release_mode)
+        : env_(env), array_(array), release_mode_(release_mode) {
+        if (array != nullptr) {
+            this->size_ = static_cast<size_t>(env->GetArrayLength(array));
+            this->data_ = static_cast<T *>(env->GetPrimitiveArrayCritical(array, nullptr));
+        }
+    }
+
+    // False when pinning failed, with an OutOfMemoryError pending
+    bool pinned() const { return array_ == nullptr || this->data_ != nullptr; }
+
+    ~JniArrayElements() {
+        if (this->data_ != nullptr) {
+            env_->ReleasePrimitiveArrayCritical(array_, this->data_, release_mode_);
+        }
+    }
+
+    JniArrayElements(const JniArrayElements &) = delete;
+    JniArrayElements &operator=(const JniArrayElements &) = delete;
+
+private:
+    JNIEnv *env_;
+    jarray array_;
+    jint release_mode_;
+};""")
+        if any(self._is_direct_buffer(param) for param in array_params):
+            helpers.append("""
+
+// Contents of a direct java.nio.ByteBuffer, from address to capacity,
+// accessed in place without pinning or copying
+template <typename T>
+class JniDirectBuffer : public JniElements<T> {
+public:
+    JniDirectBuffer(JNIEnv *env, jobject buffer) {
+        if (buffer != nullptr) {
+            this->data_ = static_cast<T *>(env->GetDirectBufferAddress(buffer));
+            if (this->data_ != nullptr) {
+                this->size_ = static_cast<size_t>(env->GetDirectBufferCapacity(buffer)) / sizeof(T);
+            }
+        }
+    }
+
+    bool valid() const { return this->data_ != nullptr; }
+};""")
+        if any(self._is_mutable_vector(param) for param in array_params):
+            helpers.append("""
+
+// Named copy of an array argument for a C++ function taking std::vector<U> &.
+// A temporary cannot bind to that reference; the changes to the vector are
+// written back to the array, up to its length, at the end of the scope
+template <typename T, typename U>
+class JniVectorArgument {
+public:
+    explicit JniVectorArgument(JniElements<T> &elements)
+        : elements_(elements), values_(elements.data(), elements.data() + elements.size()) {}
+
+    ~JniVectorArgument() {
+        std::copy_n(values_.begin(), std::min(values_.size(), elements_.size()), elements_.data());
+    }
+
+    JniVectorArgument(const JniVectorArgument &) = delete;
+    JniVectorArgument &operator=(const JniVectorArgument &) = delete;
+
+    std::vector<U> &values() { return values_; }
+
+private:
+    JniElements<T> &elements_;
+    std::vector<U> values_;
+};""")
+        return "".join(helpers)
+
+    def _generate_jni_onload(self, parsed_interface: ParsedFunction) -> str:
+        """Generate JNI_OnLoad filling the cache and JNI_OnUnload releasing it."""
+        registration = ""
+        if self.registration == DYNAMIC_REGISTRATION:
+            registration = f"""
+    if ({self._get_register_function_name()}(env) != JNI_OK) {{
+        return JNI_ERR;
+    }}"""
+
+        return f"""extern "C" JNIEXPORT jint JNICALL JNI_OnLoad(JavaVM *vm, void * /* reserved */) {{
+    JNIEnv *env = nullptr;
+    if (vm->GetEnv(reinterpret_cast<void **>(&env), JNI_VERSION_1_6) != JNI_OK) {{
+        return JNI_ERR;
+    }}
+    if (!InitJniCache(env)) {{
+        return JNI_ERR;
+    }}{registration}
+    return JNI_VERSION_1_6;
+}}
+
+extern "C" JNIEXPORT void JNICALL JNI_OnUnload(JavaVM *vm, void * /* reserved */) {{
+    JNIEnv *env = nullptr;
+    if (vm->GetEnv(reinterpret_cast<void **>(&env), JNI_VERSION_1_6) == JNI_OK) {{
+        ReleaseJniCache(env);
+    }}
+}}
+"""
+
+    def _generate_jni_function(
+        self, parsed_interface: ParsedFunction, jni_function_name: str, receiver: Optional[str] = None
+    ) -> str:
+        """
+        Generate the JNI function wrapping the C++ call.
+
+        Args:
+            parsed_interface: Parsed C++ function
+            jni_function_name: Name of the JNI function
+            receiver: Qualified C++ class of a member function, bound as a
+                static native taking the instance's handle first (none for a
+                static member function)
+        """
         function_name = parsed_interface.function_name
         return_type = parsed_interface.return_type
         parameters = parsed_interface.parameters
         namespace = parsed_interface.namespace
 
-        jni_function_name = self._get_jni_function_name(function_name)
         jni_return_type = self._get_jni_type(return_type)
-        
-        param_declarations = ", ".join(
-            f"{self._get_jni_type(param.type)} {param.name}" 
-            for param in parameters
-        )
+        param_declarations = self._get_jni_param_declarations(parsed_interface, receiver)
+        if receiver is None:
+            target = f"{namespace + '::' if namespace else ''}{function_name}"
+        elif parsed_interface.is_static:
+            target = f"{receiver}::{function_name}"
+        else:
+            target = f"reinterpret_cast<{receiver} *>(nativeHandle)->{function_name}"
+
+        if self._get_native_annotation(parsed_interface) == CRITICAL_NATIVE:
+            return f"""// @CriticalNative: no JNIEnv and no object argument, so C++ exceptions
+// cannot be rethrown to Java; {function_name} must not throw
+{jni_return_type} JNICALL
+{jni_function_name}({param_declarations}) {{
+    {'' if return_type == 'void' else 'return '}{target}({", ".join(param.name for param in parameters)});
+}}"""
 
+        default_return = 'return;' if return_type == 'void' else f'return {self._get_default_value(return_type)};'
         param_conversions = "\n    ".join(
-            self._generate_param_conversion(param) 
-            for param in parameters
+            self._generate_param_conversion(param, default_return) 
+            for param in self._get_native_parameters(parsed_interface)
         )
 
-        param_names = ", ".join(param.name for param in parameters)
+        param_names = ", ".join(self._get_call_argument(param, parameters) for param in parameters)
         return_conversion = self._generate_return_conversion(return_type)
+        # Bind string and array results by reference: a returned reference
+        # or view is not copied before the conversion to a Java object
+        by_reference = return_type == 'string' or return_type.endswith('[]')
+        result_declaration = 'const auto &result = ' if by_reference else 'auto result = '
+        call = self._generate_pinned_call(parameters, f"{target}({param_names})")
+        this_declaration = 'jclass clazz' if receiver is not None else 'jobject thiz'
 
-        return f"""#include <jni.h>
-#include "{parsed_interface.function_name}_jni.h"
-{f'#include "{namespace}.h"' if namespace else '// Include your C++ header file here'}
-
-extern "C" {{
-
-JNIEXPORT {jni_return_type} JNICALL
-{jni_function_name}(JNIEnv *env, jobject thiz{', ' + param_declarations if param_declarations else ''}) {{
+        return f"""{jni_return_type} JNICALL
+{jni_function_name}(JNIEnv *env, {this_declaration}{', ' + param_declarations if param_declarations else ''}) {{
     {param_conversions}
     
     try {{
-        {'' if return_type == 'void' else 'auto result = '}{namespace + '::' if namespace else ''}{function_name}({param_names});
+        {'' if return_type == 'void' else result_declaration}{call};
         {return_conversion}
-    }} catch (const std::exception& e) {{
+    }}{self._generate_pending_exception_catch(parameters, default_return)} catch (const std::exception& e) {{
         // Throw Java exception
-        jclass exceptionClass = env->FindClass("java/lang/RuntimeException");
-        env->ThrowNew(exceptionClass, e.what());
-        {('return;' if return_type == 'void' else f'return {self._get_default_value(return_type)};')}
+        env->ThrowNew(gJniCache.runtimeExceptionClass, e.what());
+        {default_return}
     }}
-}}
+}}"""
+
+    def _generate_pinned_call(self, parameters: List[Parameter], call: str) -> str:
+        """Wrap a C++ call so its array arguments are pinned for the call only."""
+        pinned_params = [
+            param for param in parameters if self._is_array(param) and not self._is_direct_buffer(param)
+        ]
+        vector_params = [param for param in parameters if self._is_mutable_vector(param)]
+        if not pinned_params and not vector_params:
+            return call
+        # Pin the arrays in a lambda so they are released before the
+        # result is converted or an exception is thrown to Java, and the
+        # vector copies are written back before that
+        statements = [
+            f"JniArrayElements<{self._get_jni_type(param.type[:-2])}> {param.name}_elements("
+            f"env, {param.name}, {self._get_release_mode(param)});"
+            for param in pinned_params
+        ]
+        if pinned_params:
+            pin_failed = " || ".join(f"!{param.name}_elements.pinned()" for param in pinned_params)
+            statements.append(f"""if ({pin_failed}) {{
+                throw JniPendingException();
+            }}""")
+        statements += [
+            f"JniVectorArgument<{self._get_jni_type(param.type[:-2])}, {self._get_vector_element_type(param)}> "
+            f"{param.name}_vector({param.name}_{'buffer' if self._is_direct_buffer(param) else 'elements'});"
+            for param in vector_params
+        ]
+        body = "\n            ".join(statements)
+        return f"""[&]() -> decltype(auto) {{
+            {body}
+            return {call};
+        }}()"""
+
+    def _get_release_mode(self, param: Parameter) -> str:
+        """Get the mode releasing a pinned array: copy back changes only if it is writable."""
+        writable = not param.is_const and (param.is_pointer or param.is_reference)
+        return '0' if writable else 'JNI_ABORT'
+
+    def _generate_pending_exception_catch(self, parameters: List[Parameter], default_return: str) -> str:
+        """Generate the handler returning to Java when pinning an array failed."""
+        if not any(self._is_array(param) and not self._is_direct_buffer(param) for param in parameters):
+            return ""
+        return f""" catch (const JniPendingException &) {{
+        // The OutOfMemoryError of GetPrimitiveArrayCritical is pending
+        {default_return}
+    }}"""
+
+    def _generate_exported_batch_function(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the exported batch JNI function for static registration."""
+        if not self._has_batch(parsed_interface):
+            return ""
+        batch_name = self._get_jni_function_name(f"{parsed_interface.function_name}Batch")
+        return f"\n\nJNIEXPORT {self._generate_batch_function(parsed_interface, batch_name)}"
+
+    def _generate_batch_function(self, parsed_interface: ParsedFunction, jni_function_name: str) -> str:
+        """Generate the JNI function calling the C++ function for each element of arrays."""
+        function_name = parsed_interface.function_name
+        return_type = parsed_interface.return_type
+        parameters = parsed_interface.parameters
+        namespace = parsed_interface.namespace
 
-}} // extern "C" """
+        results_type = self._get_jni_type(f"{return_type}[]")
+        param_declarations = ", ".join(
+            f"{self._get_jni_type(f'{param.type}[]')} {param.name}" for param in parameters
+        )
+        pins = "\n            ".join(
+            f"JniArrayElements<{self._get_jni_type(param.type)}> {param.name}_elements(env, {param.name}, JNI_ABORT);"
+            for param in parameters
+        )
+        arguments = ", ".join(f"{param.name}_elements.data()[i]" for param in parameters)
+        pinned_names = [param.name for param in parameters] + ["results"]
+        pin_failed = " || ".join(f"!{name}_elements.pinned()" for name in pinned_names)
+
+        return f"""{results_type} JNICALL
+{jni_function_name}(JNIEnv *env, jobject thiz, {param_declarations}) {{
+    // One JNI transition for the whole batch: the arrays are pinned once
+    // and {function_name} is called for each element
+    const jsize count = env->GetArrayLength({parameters[0].name});
+    {results_type} results = env->New{self._get_kotlin_type(return_type)}Array(count);
+    if (results == nullptr) {{
+        return nullptr;
+    }}
+
+    try {{
+        {{
+            {pins}
+            JniArrayElements<{self._get_jni_type(return_type)}> results_elements(env, results, 0);
+            if ({pin_failed}) {{
+                // The OutOfMemoryError of GetPrimitiveArrayCritical is pending
+                return nullptr;
+            }}
+            for (jsize i = 0; i < count; ++i) {{
+                results_elements.data()[i] = {namespace + '::' if namespace else ''}{function_name}({arguments});
+            }}
+        }}
+        return results;
+    }} catch (const std::exception& e) {{
+        // Throw Java exception
+        env->ThrowNew(gJniCache.runtimeExceptionClass, e.what());
+        return nullptr;
+    }}
+}}"""
 
     def _generate_jni_header(self, parsed_interface: ParsedFunction) -> str:
         """Generate JNI header file."""
@@ -126,15 +819,42 @@ JNIEXPORT {jni_return_type} JNICALL
         return_type = parsed_interface.return_type
         parameters = parsed_interface.parameters
 
+        header_guard = f"{function_name.upper()}_JNI_H"
+
+        if self.registration == DYNAMIC_REGISTRATION:
+            return f"""#ifndef {header_guard}
+#define {header_guard}
+
+#include <jni.h>
+
+/**
+ * Register the native methods of {self.package_name}.{self.class_name}
+ * Called from the generated JNI_OnLoad
+ */
+jint {self._get_register_function_name()}(JNIEnv *env);
+
+#endif // {header_guard}"""
+
         jni_function_name = self._get_jni_function_name(function_name)
         jni_return_type = self._get_jni_type(return_type)
         
         param_declarations = ", ".join(
-            f"{self._get_jni_type(param.type)} {param.name}" 
-            for param in parameters
+            f"{self._get_param_jni_type(param)} {param.name}" 
+            for param in self._get_native_parameters(parsed_interface)
         )
 
-        header_guard = f"{function_name.upper()}_JNI_H"
+        batch_declaration = ""
+        if self._has_batch(parsed_interface):
+            batch_param_declarations = ", ".join(
+                f"{self._get_jni_type(f'{param.type}[]')} {param.name}" for param in parameters
+            )
+            batch_declaration = f"""
+
+/**
+ * JNI batch wrapper for {function_name}
+ */
+JNIEXPORT {self._get_jni_type(f'{return_type}[]')} JNICALL
+{self._get_jni_function_name(f'{function_name}Batch')}(JNIEnv *env, jobject thiz, {batch_param_declarations});"""
 
         return f"""#ifndef {header_guard}
 #define {header_guard}
@@ -147,7 +867,7 @@ extern "C" {{
  * JNI wrapper for {function_name}
  */
 JNIEXPORT {jni_return_type} JNICALL
-{jni_function_name}(JNIEnv *env, jobject thiz{', ' + param_declarations if param_declarations else ''});
+{jni_function_name}(JNIEnv *env, jobject thiz{', ' + param_declarations if param_declarations else ''});{batch_declaration}
 
 }} // extern "C"
 
@@ -157,19 +877,40 @@ JNIEXPORT {jni_return_type} JNICALL
         """Generate Java wrapper class."""
         function_name = parsed_interface.function_name
         return_type = parsed_interface.return_type
-        parameters = parsed_interface.parameters
+        parameters = self._get_native_parameters(parsed_interface)
 
         java_return_type = self._get_java_type(return_type)
         
         param_declarations = ", ".join(
-            f"{self._get_java_type(param.type)} {param.name}" 
+            f"{self._get_param_java_type(param)} {param.name}" 
             for param in parameters
         )
 
         param_names = ", ".join(param.name for param in parameters)
+        annotation = self._get_native_annotation(parsed_interface)
+        imports = ""
+        native_modifiers = "private native"
+        if annotation == FAST_NATIVE:
+            imports = "\nimport dalvik.annotation.optimization.FastNative;\n"
+            native_modifiers = "@FastNative\n    private native"
+        elif annotation == CRITICAL_NATIVE:
+            imports = "\nimport dalvik.annotation.optimization.CriticalNative;\n"
+            native_modifiers = "@CriticalNative\n    private static native"
+        java_imports = []
+        if any(self._is_direct_buffer(param) for param in parameters):
+            java_imports.append("import java.nio.ByteBuffer;")
+        if self.async_wrappers:
+            java_imports += [
+                "import java.util.concurrent.CompletableFuture;",
+                "import java.util.concurrent.ExecutorService;",
+                "import java.util.concurrent.Executors;",
+                "import java.util.concurrent.atomic.AtomicInteger;",
+            ]
+        if java_imports:
+            imports = "\n" + "\n".join(java_imports) + f"\n{imports}"
 
         return f"""package {self.package_name};
-
+{imports}
 /**
  * JNI wrapper class for {function_name}
  * Generated automatically - do not modify
@@ -178,38 +919,78 @@ public class {self.class_name} {{
     
     static {{
         System.loadLibrary("{self.class_name.lower()}");
-    }}
+    }}{self._generate_java_executor()}
     
     /**
      * Native method declaration
      */
-    private native {java_return_type} {function_name}Native({param_declarations});
+    {native_modifiers} {java_return_type} {function_name}Native({param_declarations});
     
     /**
      * Public wrapper method
      */
     public {java_return_type} {function_name}({param_declarations}) {{
         {'' if return_type == 'void' else 'return '}{function_name}Native({param_names});
-    }}
+    }}{self._generate_java_async_method(parsed_interface)}{self._generate_java_batch_methods(parsed_interface)}
 }}"""
 
     def _generate_kotlin_wrapper(self, parsed_interface: ParsedFunction) -> str:
         """Generate Kotlin wrapper class."""
         function_name = parsed_interface.function_name
         return_type = parsed_interface.return_type
-        parameters = parsed_interface.parameters
+        parameters = self._get_native_parameters(parsed_interface)
 
         kotlin_return_type = self._get_kotlin_type(return_type)
         
         param_declarations = ", ".join(
-            f"{param.name}: {self._get_kotlin_type(param.type)}" 
+            f"{param.name}: {self._get_param_kotlin_type(param)}" 
             for param in parameters
         )
 
         param_names = ", ".join(param.name for param in parameters)
+        annotation = self._get_native_annotation(parsed_interface)
+        native_declaration = f"private external fun {function_name}Native({param_declarations}): {kotlin_return_type}"
+        imports = ""
+        companion_natives = ""
+        instance_natives = f"""
+    
+    /**
+     * Native method declaration
+     */
+    {native_declaration}"""
+        if annotation == FAST_NATIVE:
+            imports = "\nimport dalvik.annotation.optimization.FastNative\n"
+            instance_natives = instance_natives.replace(native_declaration, f"@FastNative\n    {native_declaration}")
+        elif annotation == CRITICAL_NATIVE:
+            # @CriticalNative methods must be static: declare the native in
+            # the companion object
+            imports = "\nimport dalvik.annotation.optimization.CriticalNative\n"
+            instance_natives = ""
+            companion_natives = f"""
+        
+        /**
+         * Native method declaration
+         */
+        @JvmStatic
+        @CriticalNative
+        {native_declaration}"""
 
-        return f"""package {self.package_name}
+        java_imports = []
+        if any(self._is_direct_buffer(param) for param in parameters):
+            java_imports.append("import java.nio.ByteBuffer")
+        if self.async_wrappers:
+            java_imports += [
+                "import java.util.concurrent.Executors",
+                "import java.util.concurrent.atomic.AtomicInteger",
+                "import kotlinx.coroutines.CoroutineDispatcher",
+                "import kotlinx.coroutines.asCoroutineDispatcher",
+                "import kotlinx.coroutines.withContext",
+            ]
+        if java_imports:
+            imports = "\n" + "\n".join(java_imports) + f"\n{imports}"
 
+        return f"""package {self.package_name}
+{imports}
 /**
  * JNI wrapper class for {function_name}
  * Generated automatically - do not modify
@@ -219,90 +1000,1577 @@ class {self.class_name} {{
     companion object {{
         init {{
             System.loadLibrary("{self.class_name.lower()}")
-        }}
-    }}
-    
-    /**
-     * Native method declaration
-     */
-    private external fun {function_name}Native({param_declarations}): {kotlin_return_type}
+        }}{companion_natives}{self._generate_kotlin_dispatcher()}
+    }}{instance_natives}
     
     /**
      * Public wrapper method
      */
     fun {function_name}({param_declarations}): {kotlin_return_type} {{
         {'' if return_type == 'void' else 'return '}{function_name}Native({param_names})
-    }}
+    }}{self._generate_kotlin_async_method(parsed_interface)}{self._generate_kotlin_batch_methods(parsed_interface)}
 }}"""
 
-    def _generate_cmake_lists(self, parsed_interface: ParsedFunction) -> str:
-        """Generate CMakeLists.txt."""
-        function_name = parsed_interface.function_name
-        library_name = self.class_name.lower()
+    def _get_class_natives(self, parsed_class: ParsedClass) -> List[Dict[str, Any]]:
+        """
+        Get the native methods binding a C++ class.
 
-        return f"""cmake_minimum_required(VERSION 3.10.2)
+        Args:
+            parsed_class: Parsed C++ class
 
-project("{library_name}")
+        Returns:
+            One entry per native method: kind ("constructor", "destructor"
+            or "method"), name (the Java native is ``<name>Native``) and
+            function (its parameters and result). Overloads and names taken
+            by the constructors and destructor get a numeric suffix.
+        """
+        natives: List[Dict[str, Any]] = []
+        used_names = set()
 
-# Set C++ standard
-set(CMAKE_CXX_STANDARD 17)
+        def add(kind: str, base_name: str, function: ParsedFunction) -> None:
+            name = base_name
+            index = 1
+            while name in used_names:
+                name = f"{base_name}{index}"
+                index += 1
+            used_names.add(name)
+            natives.append({"kind": kind, "name": name, "function": function})
 
-# Add library
-add_library({library_name} SHARED
-    {function_name}_jni.cpp
-    # Add your C++ source files here
-)
+        for constructor in parsed_class.constructors:
+            # Returns the handle of the new instance
+            add("constructor", "create", dataclasses.replace(constructor, return_type='long'))
+        add("destructor", "destroy", ParsedFunction(
+            function_name=f"~{parsed_class.class_name}",
+            return_type='void',
+            parameters=[Parameter(type='long', name='nativeHandle')],
+        ))
+        for method in parsed_class.methods:
+            add("method", method.function_name, method)
+        return natives
 
-# Find required packages
-find_library(log-lib log)
+    def _get_qualified_class_name(self, parsed_class: ParsedClass) -> str:
+        """Get the C++ class name qualified with its namespace."""
+        namespace = parsed_class.namespace
+        return f"{namespace + '::' if namespace else ''}{parsed_class.class_name}"
 
-# Link libraries
-target_link_libraries({library_name}
-    ${{log-lib}}
-    # Add other libraries you need to link here
-)
+    def _get_class_native_annotation(self, native: Dict[str, Any]) -> str:
+        """Get the annotation of a class native; constructors allocate and may throw, so get none."""
+        if native["kind"] == "constructor":
+            return NO_ANNOTATION
+        return self._get_native_annotation(native["function"])
 
-# Include directories
-target_include_directories({library_name} PRIVATE
-    .
-    # Add your header file directories here
-)"""
+    def _generate_class_jni_cpp(self, parsed_class: ParsedClass, natives: List[Dict[str, Any]]) -> str:
+        """Generate the JNI C++ code binding a C++ class."""
+        receiver = self._get_qualified_class_name(parsed_class)
+        functions = parsed_class.constructors + parsed_class.methods
+        includes = self._generate_jni_includes(
+            parsed_class.class_name, parsed_class.namespace, functions, batch=False
+        )
+        support_code = self._generate_support_code(functions, batch=False)
 
-    def _generate_gradle_config(self) -> str:
-        """Generate Gradle configuration."""
-        return """// Add to your app/build.gradle file
+        if self.registration == DYNAMIC_REGISTRATION:
+            thunks = "\n\n".join(
+                self._generate_class_thunk(native, receiver, f"{native['name']}Native") for native in natives
+            )
+            entries = "\n".join(
+                f'    {{"{native["name"]}Native", "{self._get_class_native_signature(native, receiver)}", '
+                f'reinterpret_cast<void *>({native["name"]}Native)}},'
+                for native in natives
+            )
+            return f"""{includes}
 
-android {
-    compileSdk 33
+namespace {{
 
-    defaultConfig {
-        minSdk 21
-        targetSdk 33
+{support_code}
 
-        ndk {
-            abiFilters 'arm64-v8a', 'armeabi-v7a', 'x86', 'x86_64'
-        }
-    }
+// Internal linkage: bound through the RegisterNatives table below instead
+// of exported Java_ symbols looked up with dlsym on first call
+{thunks}
 
-    externalNativeBuild {
-        cmake {
+const JNINativeMethod kNativeMethods[] = {{
+{entries}
+}};
+
+}} // namespace
+
+jint {self._get_register_function_name()}(JNIEnv *env) {{
+    return env->RegisterNatives(
+        gJniCache.nativeClass, kNativeMethods, sizeof(kNativeMethods) / sizeof(kNativeMethods[0]));
+}}
+
+{self._generate_jni_onload(parsed_class)}"""
+
+        thunks = "\n\n".join(
+            f"JNIEXPORT {self._generate_class_thunk(native, receiver, self._get_jni_function_name(native['name']))}"
+            for native in natives
+        )
+        return f"""{includes}
+
+namespace {{
+
+{support_code}
+
+}} // namespace
+
+extern "C" {{
+
+{thunks}
+
+}} // extern "C"
+
+{self._generate_jni_onload(parsed_class)}"""
+
+    def _generate_class_thunk(self, native: Dict[str, Any], receiver: str, jni_function_name: str) -> str:
+        """Generate the JNI function of a class native."""
+        function = native["function"]
+        if native["kind"] == "method":
+            return self._generate_jni_function(function, jni_function_name, receiver)
+
+        if native["kind"] == "destructor":
+            env_declarations = "JNIEnv *env, jclass clazz, "
+            if self._get_class_native_annotation(native) == CRITICAL_NATIVE:
+                env_declarations = ""
+            return f"""void JNICALL
+{jni_function_name}({env_declarations}jlong nativeHandle) {{
+    // Called once per instance, by close() or by the Cleaner
+    delete reinterpret_cast<{receiver} *>(nativeHandle);
+}}"""
+
+        parameters = function.parameters
+        param_declarations = self._get_jni_param_declarations(function)
+        param_conversions = "\n    ".join(
+            self._generate_param_conversion(param, "return 0;")
+            for param in self._get_native_parameters(function)
+        )
+        param_names = ", ".join(self._get_call_argument(param, parameters) for param in parameters)
+        call = self._generate_pinned_call(parameters, f"new {receiver}({param_names})")
+        return f"""jlong JNICALL
+{jni_function_name}(JNIEnv *env, jclass clazz{', ' + param_declarations if param_declarations else ''}) {{
+    {param_conversions}
+    
+    try {{
+        // The address of the instance is its handle
+        return reinterpret_cast<jlong>({call});
+    }}{self._generate_pending_exception_catch(parameters, "return 0;")} catch (const std::exception& e) {{
+        // Throw Java exception
+        env->ThrowNew(gJniCache.runtimeExceptionClass, e.what());
+        return 0;
+    }}
+}}"""
+
+    def _get_class_native_signature(self, native: Dict[str, Any], receiver: str) -> str:
+        """Get the JNI type signature of a class native."""
+        if native["kind"] == "method":
+            return self._get_jni_method_signature(native["function"], receiver)
+        return self._get_jni_method_signature(native["function"])
+
+    def _generate_class_jni_header(self, parsed_class: ParsedClass, natives: List[Dict[str, Any]]) -> str:
+        """Generate the JNI header of a bound C++ class."""
+        header_guard = f"{parsed_class.class_name.upper()}_JNI_H"
+        receiver = self._get_qualified_class_name(parsed_class)
+
+        if self.registration == DYNAMIC_REGISTRATION:
+            return f"""#ifndef {header_guard}
+#define {header_guard}
+
+#include <jni.h>
+
+/**
+ * Register the native methods of {self.package_name}.{self.class_name}
+ * Called from the generated JNI_OnLoad
+ */
+jint {self._get_register_function_name()}(JNIEnv *env);
+
+#endif // {header_guard}"""
+
+        declarations = []
+        for native in natives:
+            function = native["function"]
+            if native["kind"] == "method":
+                return_type = self._get_jni_type(function.return_type)
+                param_declarations = self._get_jni_param_declarations(function, receiver)
+                description = f"JNI wrapper for {receiver}::{function.function_name}"
+            else:
+                return_type = "jlong" if native["kind"] == "constructor" else "void"
+                param_declarations = self._get_jni_param_declarations(function)
+                description = (
+                    f"JNI wrapper creating a {receiver}" if native["kind"] == "constructor"
+                    else f"JNI wrapper deleting a {receiver}"
+                )
+            declarations.append(f"""/**
+ * {description}
+ */
+JNIEXPORT {return_type} JNICALL
+{self._get_jni_function_name(native['name'])}(JNIEnv *env, jclass clazz{', ' + param_declarations if param_declarations else ''});""")
+
+        declarations_code = "\n\n".join(declarations)
+        return f"""#ifndef {header_guard}
+#define {header_guard}
+
+#include <jni.h>
+
+extern "C" {{
+
+{declarations_code}
+
+}} // extern "C"
+
+#endif // {header_guard}"""
+
+    def _get_class_native_parameters(self, native: Dict[str, Any]) -> List[Parameter]:
+        """Get the parameters of a class native, the instance's handle first for a member function."""
+        function = native["function"]
+        parameters = self._get_native_parameters(function)
+        if native["kind"] == "method" and not function.is_static:
+            parameters = [Parameter(type='long', name='nativeHandle')] + parameters
+        return parameters
+
+    def _generate_java_class_wrapper(self, parsed_class: ParsedClass, natives: List[Dict[str, Any]]) -> str:
+        """Generate the Java class owning an instance of a C++ class."""
+        receiver = self._get_qualified_class_name(parsed_class)
+        annotations = set()
+        native_declarations = []
+        members = []
+        for native in natives:
+            function = native["function"]
+            native_name = f"{native['name']}Native"
+            parameters = self._get_native_parameters(function)
+            param_declarations = ", ".join(
+                f"{self._get_param_java_type(param)} {param.name}" for param in parameters
+            )
+            param_names = ", ".join(param.name for param in parameters)
+            annotation = self._get_class_native_annotation(native)
+            annotations.add(annotation)
+            native_modifiers = "private static native"
+            if annotation == FAST_NATIVE:
+                native_modifiers = "@FastNative\n    private static native"
+            elif annotation == CRITICAL_NATIVE:
+                native_modifiers = "@CriticalNative\n    private static native"
+            native_declarations.append(
+                f"    {native_modifiers} {self._get_java_type(function.return_type)} {native_name}("
+                f"{', '.join(f'{self._get_param_java_type(param)} {param.name}' for param in self._get_class_native_parameters(native))});"
+            )
+
+            if native["kind"] == "constructor":
+                members.append(f"""    /**
+     * Creates a {receiver}
+     */
+    public {self.class_name}({param_declarations}) {{
+        nativeHandle = {native_name}({param_names});
+        cleanable = CLEANER.register(this, new NativeRelease(nativeHandle));
+    }}""")
+            elif native["kind"] == "method" and function.is_static:
+                return_type = self._get_java_type(function.return_type)
+                members.append(f"""    /**
+     * Calls {receiver}::{function.function_name}
+     */
+    public static {return_type} {function.function_name}({param_declarations}) {{
+        {'' if function.return_type == 'void' else 'return '}{native_name}({param_names});
+    }}""")
+            elif native["kind"] == "method":
+                return_type = self._get_java_type(function.return_type)
+                members.append(f"""    /**
+     * Calls {receiver}::{function.function_name}
+     */
+    public {return_type} {function.function_name}({param_declarations}) {{
+        try {{
+            {'' if function.return_type == 'void' else 'return '}{native_name}({', '.join(['checkedHandle()'] + [param.name for param in parameters])});
+        }} finally {{
+            // Keep this wrapper, and so the instance, alive until the call returns
+            Reference.reachabilityFence(this);
+        }}
+    }}""")
+
+        java_imports = ["import java.lang.ref.Cleaner;", "import java.lang.ref.Reference;"]
+        if any(self._is_direct_buffer(param) for function in parsed_class.constructors + parsed_class.methods
+               for param in function.parameters):
+            java_imports.append("import java.nio.ByteBuffer;")
+        if FAST_NATIVE in annotations:
+            java_imports.append("import dalvik.annotation.optimization.FastNative;")
+        if CRITICAL_NATIVE in annotations:
+            java_imports.append("import dalvik.annotation.optimization.CriticalNative;")
+
+        members_code = "\n\n".join(members)
+        natives_code = "\n".join(native_declarations)
+        imports_code = "\n".join(java_imports)
+        return f"""package {self.package_name};
+
+{imports_code}
+
+/**
+ * JNI wrapper class owning an instance of {receiver}
+ * Call close() when done with it; otherwise the instance is deleted once
+ * the wrapper is unreachable
+ * Generated automatically - do not modify
+ */
+public class {self.class_name} implements AutoCloseable {{
+    
+    static {{
+        System.loadLibrary("{self.class_name.lower()}");
+    }}
+
+    // Deletes the instances of wrappers that become unreachable unclosed
+    private static final Cleaner CLEANER = Cleaner.create();
+
+    /**
+     * Deletes an instance; holds its handle rather than the wrapper, which
+     * could then never become unreachable
+     */
+    private static final class NativeRelease implements Runnable {{
+        private final long nativeHandle;
+
+        NativeRelease(long nativeHandle) {{
+            this.nativeHandle = nativeHandle;
+        }}
+
+        @Override
+        public void run() {{
+            destroyNative(nativeHandle);
+        }}
+    }}
+
+    // Address of the C++ instance, 0 once closed
+    private long nativeHandle;
+    private final Cleaner.Cleanable cleanable;
+
+{members_code}
+
+    /**
+     * Delete the C++ instance now rather than once unreachable
+     */
+    @Override
+    public void close() {{
+        cleanable.clean();
+        nativeHandle = 0;
+    }}
+
+    // Handle of the instance, checked not to be closed
+    private long checkedHandle() {{
+        if (nativeHandle == 0) {{
+            throw new IllegalStateException("{self.class_name} is closed");
+        }}
+        return nativeHandle;
+    }}
+
+    /**
+     * Native method declarations
+     */
+{natives_code}
+}}"""
+
+    def _generate_kotlin_class_wrapper(self, parsed_class: ParsedClass, natives: List[Dict[str, Any]]) -> str:
+        """Generate the Kotlin class owning an instance of a C++ class."""
+        receiver = self._get_qualified_class_name(parsed_class)
+        annotations = set()
+        native_declarations = []
+        static_members = []
+        members = []
+        for native in natives:
+            function = native["function"]
+            native_name = f"{native['name']}Native"
+            parameters = self._get_native_parameters(function)
+            param_declarations = ", ".join(
+                f"{param.name}: {self._get_param_kotlin_type(param)}" for param in parameters
+            )
+            param_names = ", ".join(param.name for param in parameters)
+            return_type = self._get_kotlin_type(function.return_type)
+            annotation = self._get_class_native_annotation(native)
+            annotations.add(annotation)
+            native_params = [
+                f"{param.name}: {self._get_param_kotlin_type(param)}"
+                for param in self._get_class_native_parameters(native)
+            ]
+            annotation_line = ""
+            if annotation == FAST_NATIVE:
+                annotation_line = "@FastNative\n        "
+            elif annotation == CRITICAL_NATIVE:
+                annotation_line = "@CriticalNative\n        "
+            native_declarations.append(
+                f"""        @JvmStatic
+        {annotation_line}private external fun {native_name}({', '.join(native_params)}): {return_type}"""
+            )
+
+            if native["kind"] == "constructor":
+                members.append(f"""    /**
+     * Creates a {receiver}
+     */
+    constructor({param_declarations}) {{
+        nativeHandle = {native_name}({param_names})
+        cleanable = CLEANER.register(this, NativeRelease(nativeHandle))
+    }}""")
+            elif native["kind"] == "method" and function.is_static:
+                static_members.append(f"""        /**
+         * Calls {receiver}::{function.function_name}
+         */
+        @JvmStatic
+        fun {function.function_name}({param_declarations}): {return_type} {{
+            {'' if function.return_type == 'void' else 'return '}{native_name}({param_names})
+        }}""")
+            elif native["kind"] == "method":
+                members.append(f"""    /**
+     * Calls {receiver}::{function.function_name}
+     */
+    fun {function.function_name}({param_declarations}): {return_type} {{
+        check(nativeHandle != 0L) {{ "{self.class_name} is closed" }}
+        try {{
+            {'' if function.return_type == 'void' else 'return '}{native_name}({', '.join(['nativeHandle'] + [param.name for param in parameters])})
+        }} finally {{
+            // Keep this wrapper, and so the instance, alive until the call returns
+            Reference.reachabilityFence(this)
+        }}
+    }}""")
+
+        imports = ["import java.lang.ref.Cleaner", "import java.lang.ref.Reference"]
+        if any(self._is_direct_buffer(param) for function in parsed_class.constructors + parsed_class.methods
+               for param in function.parameters):
+            imports.append("import java.nio.ByteBuffer")
+        if FAST_NATIVE in annotations:
+            imports.append("import dalvik.annotation.optimization.FastNative")
+        if CRITICAL_NATIVE in annotations:
+            imports.append("import dalvik.annotation.optimization.CriticalNative")
+
+        static_code = "".join(f"\n\n{member}" for member in static_members)
+        members_code = "\n\n".join(members)
+        natives_code = "\n\n".join(native_declarations)
+        imports_code = "\n".join(imports)
+        return f"""package {self.package_name}
+
+{imports_code}
+
+/**
+ * JNI wrapper class owning an instance of {receiver}
+ * Call close() when done with it; otherwise the instance is deleted once
+ * the wrapper is unreachable
+ * Generated automatically - do not modify
+ */
+class {self.class_name} : AutoCloseable {{
+    
+    companion object {{
+        init {{
+            System.loadLibrary("{self.class_name.lower()}")
+        }}
+
+        // Deletes the instances of wrappers that become unreachable unclosed
+        private val CLEANER: Cleaner = Cleaner.create(){static_code}
+
+        /**
+         * Native method declarations
+         */
+{natives_code}
+    }}
+
+    /**
+     * Deletes an instance; holds its handle rather than the wrapper, which
+     * could then never become unreachable
+     */
+    private class NativeRelease(private val nativeHandle: Long) : Runnable {{
+        override fun run() = destroyNative(nativeHandle)
+    }}
+
+    // Address of the C++ instance, 0 once closed
+    private var nativeHandle: Long
+    private val cleanable: Cleaner.Cleanable
+
+{members_code}
+
+    /**
+     * Delete the C++ instance now rather than once unreachable
+     */
+    override fun close() {{
+        cleanable.clean()
+        nativeHandle = 0
+    }}
+}}"""
+
+    def _get_thread_pool_size(self) -> str:
+        """Get the expression giving the size of the native thread pool."""
+        if self.native_thread_pool_size is not None:
+            return str(self.native_thread_pool_size)
+        return "Runtime.getRuntime().availableProcessors()"
+
+    def _generate_java_executor(self) -> str:
+        """Generate the bounded executor running asynchronous native calls."""
+        if not self.async_wrappers:
+            return ""
+        return f"""
+    
+    /**
+     * Bounded pool running asynchronous native calls, shared by all
+     * instances: threads are reused and at most NATIVE_THREAD_POOL_SIZE
+     * calls run in parallel
+     */
+    private static final int NATIVE_THREAD_POOL_SIZE = {self._get_thread_pool_size()};
+    private static final AtomicInteger nativeThreadCount = new AtomicInteger();
+    private static final ExecutorService nativeExecutor = Executors.newFixedThreadPool(
+            NATIVE_THREAD_POOL_SIZE, runnable -> {{
+                Thread thread = new Thread(runnable, "{self.class_name}-native-" + nativeThreadCount.incrementAndGet());
+                thread.setDaemon(true);
+                return thread;
+            }});"""
+
+    def _generate_java_async_method(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the CompletableFuture wrapper running the call on the native pool."""
+        if not self.async_wrappers:
+            return ""
+        function_name = parsed_interface.function_name
+        return_type = parsed_interface.return_type
+        parameters = self._get_native_parameters(parsed_interface)
+        param_declarations = ", ".join(
+            f"{self._get_param_java_type(param)} {param.name}" for param in parameters
+        )
+        param_names = ", ".join(param.name for param in parameters)
+        if return_type == 'void':
+            future = f"CompletableFuture.runAsync(() -> {function_name}({param_names}), nativeExecutor)"
+        else:
+            future = f"CompletableFuture.supplyAsync(() -> {function_name}({param_names}), nativeExecutor)"
+        return f"""
+    
+    /**
+     * Asynchronous wrapper method, run on the native thread pool
+     */
+    public CompletableFuture<{self._get_java_boxed_type(return_type)}> {function_name}Async({param_declarations}) {{
+        return {future};
+    }}"""
+
+    def _generate_kotlin_dispatcher(self) -> str:
+        """Generate the bounded coroutine dispatcher running suspending native calls."""
+        if not self.async_wrappers:
+            return ""
+        return f"""
+        
+        /**
+         * Bounded dispatcher running suspending native calls, shared by all
+         * instances: threads are reused and at most NATIVE_THREAD_POOL_SIZE
+         * calls run in parallel
+         */
+        private val NATIVE_THREAD_POOL_SIZE = {self._get_thread_pool_size()}
+        private val nativeThreadCount = AtomicInteger()
+        private val nativeDispatcher: CoroutineDispatcher = Executors.newFixedThreadPool(NATIVE_THREAD_POOL_SIZE) {{ runnable ->
+            Thread(runnable, "{self.class_name}-native-${{nativeThreadCount.incrementAndGet()}}").apply {{ isDaemon = true }}
+        }}.asCoroutineDispatcher()"""
+
+    def _generate_kotlin_async_method(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the suspend wrapper running the call on the native dispatcher."""
+        if not self.async_wrappers:
+            return ""
+        function_name = parsed_interface.function_name
+        parameters = self._get_native_parameters(parsed_interface)
+        param_declarations = ", ".join(
+            f"{param.name}: {self._get_param_kotlin_type(param)}" for param in parameters
+        )
+        param_names = ", ".join(param.name for param in parameters)
+        return f"""
+    
+    /**
+     * Suspending wrapper method, run on the native dispatcher
+     */
+    suspend fun {function_name}Async({param_declarations}): {self._get_kotlin_type(parsed_interface.return_type)} =
+        withContext(nativeDispatcher) {{ {function_name}({param_names}) }}"""
+
+    def _generate_java_batch_methods(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the Java batch native method and its wrapper."""
+        if not self._has_batch(parsed_interface):
+            return ""
+        function_name = parsed_interface.function_name
+        parameters = parsed_interface.parameters
+        results_type = self._get_java_type(f"{parsed_interface.return_type}[]")
+        param_declarations = ", ".join(
+            f"{self._get_java_type(f'{param.type}[]')} {param.name}" for param in parameters
+        )
+        param_names = ", ".join(param.name for param in parameters)
+        length_checks = "".join(
+            f"""
+        if ({param.name}.length != {parameters[0].name}.length) {{
+            throw new IllegalArgumentException("{param.name} must have as many elements as {parameters[0].name}");
+        }}"""
+            for param in parameters[1:]
+        )
+        return f"""
+    
+    /**
+     * Native batch method declaration
+     */
+    private native {results_type} {function_name}BatchNative({param_declarations});
+    
+    /**
+     * Batch wrapper: {function_name} for each element, in one native call
+     */
+    public {results_type} {function_name}Batch({param_declarations}) {{{length_checks}
+        return {function_name}BatchNative({param_names});
+    }}"""
+
+    def _generate_kotlin_batch_methods(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the Kotlin batch native method and its wrapper."""
+        if not self._has_batch(parsed_interface):
+            return ""
+        function_name = parsed_interface.function_name
+        parameters = parsed_interface.parameters
+        results_type = self._get_kotlin_type(f"{parsed_interface.return_type}[]")
+        param_declarations = ", ".join(
+            f"{param.name}: {self._get_kotlin_type(f'{param.type}[]')}" for param in parameters
+        )
+        param_names = ", ".join(param.name for param in parameters)
+        length_checks = "".join(
+            f"""
+        require({param.name}.size == {parameters[0].name}.size) {{ "{param.name} must have as many elements as {parameters[0].name}" }}"""
+            for param in parameters[1:]
+        )
+        return f"""
+    
+    /**
+     * Native batch method declaration
+     */
+    private external fun {function_name}BatchNative({param_declarations}): {results_type}
+    
+    /**
+     * Batch wrapper: {function_name} for each element, in one native call
+     */
+    fun {function_name}Batch({param_declarations}): {results_type} {{{length_checks}
+        return {function_name}BatchNative({param_names})
+    }}"""
+
+    def _generate_benchmark(self, parsed_interface: ParsedFunction) -> str:
+        """Generate an instrumented microbenchmark reporting calls per second."""
+        function_name = parsed_interface.function_name
+        test_name = f"benchmark{function_name[:1].upper()}{function_name[1:]}"
+        long_string_length = self.string_buffer_size * 4
+        kotlin = self.language == "kotlin"
+
+        cases = [("", False)]
+        parameters = self._get_native_parameters(parsed_interface)
+        if any(param.type == 'string' for param in parameters):
+            # Exercise both the stack buffer and the heap fallback
+            cases = [(" (short strings)", False), (" (long strings)", True)]
+        measurements = []
+        for label, long_strings in cases:
+            arguments = ", ".join(
+                self._get_benchmark_argument(param, long_strings) for param in parameters
+            )
+            call = f"target.{function_name}({arguments})"
+            if kotlin:
+                measurements.append(f'measure("{function_name}{label}", 1) {{ {call} }}')
+            else:
+                measurements.append(f'measure("{function_name}{label}", 1, () -> {call});')
+        if self._has_batch(parsed_interface):
+            # Same work per element through the batch variant, to compare
+            # the per-element cost with one transition per call
+            for param in parameters:
+                value = self._get_benchmark_argument(param, False)
+                if kotlin:
+                    measurements.append(
+                        f"val {param.name}Values = {self._get_kotlin_type(f'{param.type}[]')}(BATCH_SIZE) {{ {value} }}"
+                    )
+                else:
+                    measurements.append(
+                        f"{self._get_java_type(f'{param.type}[]')} {param.name}Values = "
+                        f"new {self._get_java_type(param.type)}[BATCH_SIZE];"
+                    )
+                    measurements.append(f"Arrays.fill({param.name}Values, {value});")
+            batch_arguments = ", ".join(f"{param.name}Values" for param in parameters)
+            batch_call = f"target.{function_name}Batch({batch_arguments})"
+            if kotlin:
+                measurements.append(f'measure("{function_name}Batch", BATCH_SIZE) {{ {batch_call} }}')
+            else:
+                measurements.append(f'measure("{function_name}Batch", BATCH_SIZE, () -> {batch_call});')
+        measurements_code = "\n        ".join(measurements)
+
+        if kotlin:
+            return f"""package {self.package_name}
+
+import android.os.Bundle
+import android.util.Log
+import androidx.test.ext.junit.runners.AndroidJUnit4
+import androidx.test.platform.app.InstrumentationRegistry
+import org.junit.Test
+import org.junit.runner.RunWith
+import java.util.Locale
+
+/**
+ * Microbenchmark of {self.class_name}.{function_name}: calls per second through JNI
+ * Generated automatically - run with ./gradlew connectedAndroidTest
+ */
+@RunWith(AndroidJUnit4::class)
+class {self.class_name}Benchmark {{
+
+    private val target = {self.class_name}()
+
+    @Test
+    fun {test_name}() {{
+        {measurements_code}
+    }}
+
+    private fun measure(name: String, elementsPerCall: Int, call: () -> Unit) {{
+        val warmupEnd = System.nanoTime() + WARMUP_NANOS
+        while (System.nanoTime() < warmupEnd) {{
+            call()
+        }}
+
+        var calls = 0L
+        val start = System.nanoTime()
+        var elapsed: Long
+        do {{
+            repeat(BATCH_CALLS) {{ call() }}
+            calls += BATCH_CALLS
+            elapsed = System.nanoTime() - start
+        }} while (elapsed < MEASURE_NANOS)
+
+        val report = String.format(
+            Locale.US, "%s: %.0f calls/s (%.1f ns/element)",
+            name, calls * 1e9 / elapsed, elapsed.toDouble() / (calls * elementsPerCall)
+        )
+        Log.i(TAG, report)
+        val status = Bundle()
+        status.putString(name, report)
+        InstrumentationRegistry.getInstrumentation().sendStatus(0, status)
+    }}
+
+    companion object {{
+        private const val TAG = "{self.class_name}Benchmark"
+        private const val WARMUP_NANOS = 1_000_000_000L
+        private const val MEASURE_NANOS = 2_000_000_000L
+        private const val BATCH_CALLS = 1000
+        private const val BATCH_SIZE = 4096
+        private const val SHORT_TEXT = "benchmark text"
+        private val LONG_TEXT = "x".repeat({long_string_length})
+    }}
+}}"""
+
+        return f"""package {self.package_name};
+
+import android.os.Bundle;
+import android.util.Log;
+
+import androidx.test.ext.junit.runners.AndroidJUnit4;
+import androidx.test.platform.app.InstrumentationRegistry;
+
+import org.junit.Test;
+import org.junit.runner.RunWith;
+
+import java.util.Arrays;
+import java.util.Locale;
+
+/**
+ * Microbenchmark of {self.class_name}.{function_name}: calls per second through JNI
+ * Generated automatically - run with ./gradlew connectedAndroidTest
+ */
+@RunWith(AndroidJUnit4.class)
+public class {self.class_name}Benchmark {{
+
+    private static final String TAG = "{self.class_name}Benchmark";
+    private static final long WARMUP_NANOS = 1_000_000_000L;
+    private static final long MEASURE_NANOS = 2_000_000_000L;
+    private static final int BATCH_CALLS = 1000;
+    private static final int BATCH_SIZE = 4096;
+    private static final String SHORT_TEXT = "benchmark text";
+    private static final String LONG_TEXT = repeat('x', {long_string_length});
+
+    private final {self.class_name} target = new {self.class_name}();
+
+    @Test
+    public void {test_name}() {{
+        {measurements_code}
+    }}
+
+    private static void measure(String name, int elementsPerCall, Runnable call) {{
+        long warmupEnd = System.nanoTime() + WARMUP_NANOS;
+        while (System.nanoTime() < warmupEnd) {{
+            call.run();
+        }}
+
+        long calls = 0;
+        long start = System.nanoTime();
+        long elapsed;
+        do {{
+            for (int i = 0; i < BATCH_CALLS; i++) {{
+                call.run();
+            }}
+            calls += BATCH_CALLS;
+            elapsed = System.nanoTime() - start;
+        }} while (elapsed < MEASURE_NANOS);
+
+        String report = String.format(Locale.US, "%s: %.0f calls/s (%.1f ns/element)",
+                name, calls * 1e9 / elapsed, (double) elapsed / ((double) calls * elementsPerCall));
+        Log.i(TAG, report);
+        Bundle status = new Bundle();
+        status.putString(name, report);
+        InstrumentationRegistry.getInstrumentation().sendStatus(0, status);
+    }}
+
+    private static String repeat(char c, int count) {{
+        char[] chars = new char[count];
+        Arrays.fill(chars, c);
+        return new String(chars);
+    }}
+}}"""
+
+    def _get_benchmark_argument(self, param: Parameter, long_strings: bool) -> str:
+        """Get a sample argument for the benchmark in the wrapper's language."""
+        if param.type == 'string':
+            return "LONG_TEXT" if long_strings else "SHORT_TEXT"
+        if self._is_string_array(param.type):
+            text = "LONG_TEXT" if long_strings else "SHORT_TEXT"
+            if self.language == "kotlin":
+                return f"Array(1024) {{ {text} }}"
+            return f"java.util.Collections.nCopies(1024, {text}).toArray(new String[0])"
+        if self._is_direct_buffer(param):
+            return "java.nio.ByteBuffer.allocateDirect(4096)"
+        if self._is_array(param):
+            element_type = param.type[:-2]
+            if self.language == "kotlin":
+                return f"{self._get_kotlin_type(param.type)}(1024)"
+            return f"new {self._get_java_type(element_type)}[1024]"
+        if self.language == "kotlin":
+            kotlin_values = {
+                'boolean': 'true', 'byte': '42.toByte()', 'short': '42.toShort()', 'int': '42',
+                'long': '42L', 'float': '1.5f', 'double': '1.5'
+            }
+            return kotlin_values.get(param.type, 'Any()')
+        java_values = {
+            'boolean': 'true', 'byte': '(byte) 42', 'short': '(short) 42', 'int': '42',
+            'long': '42L', 'float': '1.5f', 'double': '1.5'
+        }
+        return java_values.get(param.type, 'new Object()')
+
+    def _generate_stress_test(self, parsed_interface: ParsedFunction) -> str:
+        """Generate an instrumented test passing STRESS_TEST_ELEMENTS-element collections."""
+        function_name = parsed_interface.function_name
+        test_name = f"{function_name}HandlesLargeCollections"
+        parameters = self._get_native_parameters(parsed_interface)
+        kotlin = self.language == "kotlin"
+
+        declarations = []
+        for param in parameters:
+            value = self._get_stress_test_argument(param)
+            if kotlin:
+                declarations.append(f"val {param.name} = {value}")
+            else:
+                declarations.append(f"{self._get_param_java_type(param)} {param.name} = {value};")
+        declarations_code = "\n        ".join(declarations)
+        arguments = ", ".join(param.name for param in parameters)
+        strings_helper = ""
+        if any(self._is_string_array(param.type) for param in parameters):
+            strings_helper = """
+
+    private static String[] strings(int count) {
+        String[] values = new String[count];
+        for (int i = 0; i < count; i++) {
+            values[i] = "element " + i;
+        }
+        return values;
+    }"""
+
+        if kotlin:
+            return f"""package {self.package_name}
+
+import androidx.test.ext.junit.runners.AndroidJUnit4
+import org.junit.Test
+import org.junit.runner.RunWith
+
+/**
+ * Stress test of {self.class_name}.{function_name} with {STRESS_TEST_ELEMENTS}-element collections
+ * A leaked local reference per element overflows the local reference table
+ * and aborts the test; run with CheckJNI (adb shell setprop debug.checkjni 1)
+ * to also catch smaller leaks
+ * Generated automatically - run with ./gradlew connectedAndroidTest
+ */
+@RunWith(AndroidJUnit4::class)
+class {self.class_name}StressTest {{
+
+    private val target = {self.class_name}()
+
+    @Test
+    fun {test_name}() {{
+        {declarations_code}
+        repeat(ROUNDS) {{
+            target.{function_name}({arguments})
+        }}
+    }}
+
+    companion object {{
+        private const val ELEMENTS = {STRESS_TEST_ELEMENTS:_}
+        private const val ROUNDS = 3
+    }}
+}}"""
+
+        return f"""package {self.package_name};
+
+import androidx.test.ext.junit.runners.AndroidJUnit4;
+
+import org.junit.Test;
+import org.junit.runner.RunWith;
+
+/**
+ * Stress test of {self.class_name}.{function_name} with {STRESS_TEST_ELEMENTS}-element collections
+ * A leaked local reference per element overflows the local reference table
+ * and aborts the test; run with CheckJNI (adb shell setprop debug.checkjni 1)
+ * to also catch smaller leaks
+ * Generated automatically - run with ./gradlew connectedAndroidTest
+ */
+@RunWith(AndroidJUnit4.class)
+public class {self.class_name}StressTest {{
+
+    private static final int ELEMENTS = {STRESS_TEST_ELEMENTS:_};
+    private static final int ROUNDS = 3;
+
+    private final {self.class_name} target = new {self.class_name}();
+
+    @Test
+    public void {test_name}() {{
+        {declarations_code}
+        for (int round = 0; round < ROUNDS; round++) {{
+            target.{function_name}({arguments});
+        }}
+    }}{strings_helper}
+}}"""
+
+    def _get_stress_test_argument(self, param: Parameter) -> str:
+        """Get the stress test argument: ELEMENTS elements for a collection."""
+        kotlin = self.language == "kotlin"
+        if self._is_string_array(param.type):
+            return 'Array(ELEMENTS) { "element $it" }' if kotlin else "strings(ELEMENTS)"
+        if self._is_direct_buffer(param):
+            element_bytes = {'boolean': 1, 'byte': 1, 'short': 2, 'int': 4, 'long': 8, 'float': 4, 'double': 8}
+            size = f"ELEMENTS * {element_bytes[param.type[:-2]]}"
+            return f"java.nio.ByteBuffer.allocateDirect({size})"
+        if self._is_array(param):
+            if kotlin:
+                return f"{self._get_kotlin_type(param.type)}(ELEMENTS)"
+            return f"new {self._get_java_type(param.type[:-2])}[ELEMENTS]"
+        if param.type == 'string':
+            return '"stress test"'
+        return self._get_benchmark_argument(param, False)
+
+    def _generate_benchmark_module(self, parsed: Union[ParsedFunction, ParsedClass]) -> Dict[str, str]:
+        """
+        Generate a Jetpack Microbenchmark module measuring each binding.
+
+        The module builds the generated wrapper and JNI library from their
+        generated locations, plus a library with a no-op native method. It
+        holds one benchmark per bound function, called with representative
+        arguments, and a baseline calling the no-op: the difference is the
+        binding's own overhead on top of the JNI transition.
+
+        Args:
+            parsed: Parsed C++ function or class
+
+        Returns:
+            Mapping of relative file path to file content
+        """
+        kotlin = self.language == "kotlin"
+        source_dir = "kotlin" if kotlin else "java"
+        extension = "kt" if kotlin else "java"
+        package_path = f"{self.package_name.replace('.', '/')}/benchmark"
+        source_name = parsed.class_name if isinstance(parsed, ParsedClass) else parsed.function_name
+
+        return {
+            "android/benchmark/build.gradle": self._generate_benchmark_module_gradle(
+                isinstance(parsed, ParsedClass)
+            ),
+            "android/benchmark/src/main/cpp/CMakeLists.txt": self._generate_benchmark_module_cmake(source_name),
+            "android/benchmark/src/main/cpp/jni_baseline.cpp": self._generate_jni_baseline_cpp(),
+            f"android/benchmark/src/main/{source_dir}/{package_path}/JniBaseline.{extension}":
+                self._generate_jni_baseline_class(),
+            f"android/benchmark/src/androidTest/{source_dir}/{package_path}/"
+            f"{self.class_name}JniBenchmark.{extension}": self._generate_microbenchmark(parsed),
+        }
+
+    def _get_microbenchmark_cases(self, parsed: Union[ParsedFunction, ParsedClass]) -> List[Dict[str, Any]]:
+        """
+        Get the benchmarks of the bound functions.
+
+        Returns:
+            One entry per benchmark: name, parameters (hoisted out of the
+            measured loop with their value) and call
+        """
+        target_class = self.class_name
+        cases: List[Dict[str, Any]] = []
+
+        def arguments(function: ParsedFunction) -> List[Any]:
+            return [
+                (param, self._get_benchmark_argument(param, False))
+                for param in self._get_native_parameters(function)
+            ]
+
+        def call(receiver: str, name: str, function: ParsedFunction) -> str:
+            names = ", ".join(param.name for param in self._get_native_parameters(function))
+            return f"{receiver}.{name}({names})"
+
+        if isinstance(parsed, ParsedClass):
+            for native in self._get_class_natives(parsed):
+                function = native["function"]
+                if native["kind"] == "destructor":
+                    continue
+                names = ", ".join(param.name for param in self._get_native_parameters(function))
+                if native["kind"] == "constructor":
+                    # Creates and deletes an instance
+                    if self.language == "kotlin":
+                        measured = f"{target_class}({names}).close()"
+                    else:
+                        measured = f"new {target_class}({names}).close()"
+                    cases.append({"name": native["name"], "parameters": arguments(function), "call": measured})
+                else:
+                    receiver = target_class if function.is_static else "target"
+                    cases.append({
+                        "name": native["name"],
+                        "parameters": arguments(function),
+                        "call": call(receiver, function.function_name, function),
+                    })
+            return cases
+
+        function_name = parsed.function_name
+        cases.append({
+            "name": function_name,
+            "parameters": arguments(parsed),
+            "call": call("target", function_name, parsed),
+        })
+        if self._has_batch(parsed):
+            batch_parameters = [
+                (
+                    Parameter(type=f"{param.type}[]", name=f"{param.name}Values"),
+                    self._get_benchmark_argument(param, False),
+                )
+                for param in parsed.parameters
+            ]
+            batch_names = ", ".join(param.name for param, _ in batch_parameters)
+            cases.append({
+                "name": f"{function_name}Batch",
+                "parameters": batch_parameters,
+                "call": f"target.{function_name}Batch({batch_names})",
+                "batch": True,
+            })
+        return cases
+
+    def _get_microbenchmark_target(self, parsed: Union[ParsedFunction, ParsedClass]) -> str:
+        """Get the arguments constructing the benchmarked wrapper."""
+        if not isinstance(parsed, ParsedClass):
+            return ""
+        return ", ".join(
+            self._get_benchmark_argument(param, False)
+            for param in self._get_native_parameters(parsed.constructors[0])
+        )
+
+    def _generate_microbenchmark(self, parsed: Union[ParsedFunction, ParsedClass]) -> str:
+        """Generate the Jetpack Microbenchmark class of the bound functions."""
+        kotlin = self.language == "kotlin"
+        is_class = isinstance(parsed, ParsedClass)
+        cases = self._get_microbenchmark_cases(parsed)
+        has_batch = any(case.get("batch") for case in cases)
+        target_arguments = self._get_microbenchmark_target(parsed)
+        uses_text = "SHORT_TEXT" in target_arguments or any(
+            "SHORT_TEXT" in value for case in cases for _, value in case["parameters"]
+        )
+
+        tests = []
+        for case in cases:
+            setup = []
+            for param, value in case["parameters"]:
+                if case.get("batch") and kotlin:
+                    setup.append(f"val {param.name} = {self._get_kotlin_type(param.type)}(BATCH_SIZE) {{ {value} }}")
+                elif case.get("batch"):
+                    setup.append(f"{self._get_java_type(param.type)} {param.name} = "
+                                 f"new {self._get_java_type(param.type[:-2])}[BATCH_SIZE];")
+                    setup.append(f"Arrays.fill({param.name}, {value});")
+                elif kotlin:
+                    setup.append(f"val {param.name} = {value}")
+                else:
+                    setup.append(f"{self._get_param_java_type(param)} {param.name} = {value};")
+            if kotlin:
+                setup_code = "".join(f"        {line}\n" for line in setup)
+                tests.append(f"""    @Test
+    fun {case['name']}() {{
+{setup_code}        benchmarkRule.measureRepeated {{
+            {case['call']}
+        }}
+    }}""")
+            else:
+                setup_code = "".join(f"        {line}\n" for line in setup)
+                tests.append(f"""    @Test
+    public void {case['name']}() {{
+{setup_code}        BenchmarkState state = benchmarkRule.getState();
+        while (state.keepRunning()) {{
+            {case['call']};
+        }}
+    }}""")
+        tests_code = "\n\n".join(tests)
+
+        if kotlin:
+            close_target = """
+
+    @After
+    fun closeTarget() {
+        target.close()
+    }""" if is_class else ""
+            after_import = "\nimport org.junit.After" if is_class else ""
+            constants = []
+            if uses_text:
+                constants.append('private const val SHORT_TEXT = "benchmark text"')
+            if has_batch:
+                constants.append("private const val BATCH_SIZE = 4096")
+            companion = ""
+            if constants:
+                constants_code = "".join(f"\n        {line}" for line in constants)
+                companion = f"""
+
+    companion object {{{constants_code}
+    }}"""
+            return f"""package {self.package_name}.benchmark
+
+import androidx.benchmark.junit4.BenchmarkRule
+import androidx.benchmark.junit4.measureRepeated
+import androidx.test.ext.junit.runners.AndroidJUnit4
+import {self.package_name}.{self.class_name}{after_import}
+import org.junit.Rule
+import org.junit.Test
+import org.junit.runner.RunWith
+
+/**
+ * Jetpack Microbenchmark of each binding of {self.class_name}
+ * baselineNoopNative measures a bare JNI call; the difference with each
+ * binding is the cost of its argument and result marshalling
+ * Generated automatically - run with ./gradlew :benchmark:connectedReleaseAndroidTest
+ */
+@RunWith(AndroidJUnit4::class)
+class {self.class_name}JniBenchmark {{
+
+    @get:Rule
+    val benchmarkRule = BenchmarkRule()
+
+    private val target = {self.class_name}({target_arguments}){close_target}
+
+    @Test
+    fun baselineNoopNative() {{
+        benchmarkRule.measureRepeated {{
+            JniBaseline.noop()
+        }}
+    }}
+
+{tests_code}{companion}
+}}"""
+
+        close_target = """
+
+    @After
+    public void closeTarget() {
+        target.close();
+    }""" if is_class else ""
+        imports = [
+            "import androidx.benchmark.BenchmarkState;",
+            "import androidx.benchmark.junit4.BenchmarkRule;",
+            "import androidx.test.ext.junit.runners.AndroidJUnit4;",
+            "",
+            f"import {self.package_name}.{self.class_name};",
+            "",
+        ]
+        if is_class:
+            imports.append("import org.junit.After;")
+        imports += ["import org.junit.Rule;", "import org.junit.Test;", "import org.junit.runner.RunWith;"]
+        if has_batch:
+            imports += ["", "import java.util.Arrays;"]
+        imports_code = "\n".join(imports)
+        constants = []
+        if uses_text:
+            constants.append('private static final String SHORT_TEXT = "benchmark text";')
+        if has_batch:
+            constants.append("private static final int BATCH_SIZE = 4096;")
+        constants_code = "".join(f"    {line}\n" for line in constants)
+        if constants_code:
+            constants_code += "\n"
+        return f"""package {self.package_name}.benchmark;
+
+{imports_code}
+
+/**
+ * Jetpack Microbenchmark of each binding of {self.class_name}
+ * baselineNoopNative measures a bare JNI call; the difference with each
+ * binding is the cost of its argument and result marshalling
+ * Generated automatically - run with ./gradlew :benchmark:connectedReleaseAndroidTest
+ */
+@RunWith(AndroidJUnit4.class)
+public class {self.class_name}JniBenchmark {{
+
+{constants_code}    @Rule
+    public BenchmarkRule benchmarkRule = new BenchmarkRule();
+
+    private final {self.class_name} target = new {self.class_name}({target_arguments});{close_target}
+
+    @Test
+    public void baselineNoopNative() {{
+        BenchmarkState state = benchmarkRule.getState();
+        while (state.keepRunning()) {{
+            JniBaseline.noop();
+        }}
+    }}
+
+{tests_code}
+}}"""
+
+    def _generate_jni_baseline_class(self) -> str:
+        """Generate the class declaring the no-op native method of the benchmarks."""
+        if self.language == "kotlin":
+            return f"""package {self.package_name}.benchmark
+
+/**
+ * Baseline of the JNI benchmarks: a native method returning immediately
+ * Generated automatically - do not modify
+ */
+object JniBaseline {{
+    init {{
+        System.loadLibrary("jnibaseline")
+    }}
+
+    @JvmStatic
+    external fun noop()
+}}"""
+
+        return f"""package {self.package_name}.benchmark;
+
+/**
+ * Baseline of the JNI benchmarks: a native method returning immediately
+ * Generated automatically - do not modify
+ */
+public final class JniBaseline {{
+
+    static {{
+        System.loadLibrary("jnibaseline");
+    }}
+
+    private JniBaseline() {{
+    }}
+
+    public static native void noop();
+}}"""
+
+    def _generate_jni_baseline_cpp(self) -> str:
+        """Generate the no-op native method of the benchmarks."""
+        package_path = self._mangle_jni_name(self.package_name).replace('.', '_')
+        return f"""#include <jni.h>
+
+// Baseline of the JNI benchmarks: the cost of the JNI transition alone
+extern "C" JNIEXPORT void JNICALL
+Java_{package_path}_benchmark_JniBaseline_noop(JNIEnv *env, jclass clazz) {{
+}}
+"""
+
+    def _generate_benchmark_module_cmake(self, source_name: str) -> str:
+        """Generate the CMakeLists.txt of the benchmark module."""
+        return f"""cmake_minimum_required(VERSION 3.10.2)
+
+project("jnibaseline")
+
+# Set C++ standard
+set(CMAKE_CXX_STANDARD 17)
+
+# No-op native method of the baseline benchmark
+add_library(jnibaseline SHARED
+    jni_baseline.cpp
+)
+
+# The benchmarked JNI library, built from the generated {source_name}_jni.cpp
+add_subdirectory(${{CMAKE_CURRENT_SOURCE_DIR}}/../../../../jni {self.class_name.lower()})"""
+
+    def _generate_benchmark_module_gradle(self, class_handles: bool) -> str:
+        """Generate the build.gradle of the benchmark module."""
+        kotlin = self.language == "kotlin"
+        kotlin_plugin = "\n    id 'org.jetbrains.kotlin.android'" if kotlin else ""
+        dependencies = ""
+        if self.async_wrappers and kotlin and not class_handles:
+            dependencies = """
+    implementation 'org.jetbrains.kotlinx:kotlinx-coroutines-android:1.7.3'"""
+        return f"""// Benchmark module: add include ':benchmark' to settings.gradle and run
+// ./gradlew :benchmark:connectedReleaseAndroidTest
+
+plugins {{
+    id 'com.android.library'
+    id 'androidx.benchmark'{kotlin_plugin}
+}}
+
+android {{
+    namespace '{self.package_name}.benchmark'
+    compileSdk 34
+
+    defaultConfig {{
+        minSdk {self._get_min_sdk(class_handles)}
+        targetSdk 34
+        testInstrumentationRunner "androidx.benchmark.junit4.AndroidBenchmarkRunner"
+    }}
+
+    // Measure an optimized, non-debuggable build
+    testBuildType = "release"
+    buildTypes {{
+        release {{
+            minifyEnabled false
+        }}
+    }}
+
+    // Build the generated wrapper from where it was generated
+    sourceSets {{
+        main {{
+            java.srcDirs += '../src/main/{'kotlin' if kotlin else 'java'}'
+        }}
+    }}
+
+    externalNativeBuild {{
+        cmake {{
             path "src/main/cpp/CMakeLists.txt"
             version "3.10.2"
-        }
-    }
-}
+        }}
+    }}
+}}
+
+dependencies {{{dependencies}
+    androidTestImplementation 'androidx.benchmark:benchmark-junit4:1.2.4'
+    androidTestImplementation 'androidx.test.ext:junit:1.1.5'
+}}"""
+
+    def _generate_cmake_lists(self, source_name: str) -> str:
+        """Generate CMakeLists.txt building ``<source_name>_jni.cpp``."""
+        library_name = self.class_name.lower()
+
+        return f"""cmake_minimum_required(VERSION 3.10.2)
+
+project("{library_name}")
+
+# Set C++ standard
+set(CMAKE_CXX_STANDARD 17)
+
+# Add library
+add_library({library_name} SHARED
+    {source_name}_jni.cpp
+    # Add your C++ source files here
+)
+
+# Find required packages
+find_library(log-lib log)
+
+# Link libraries
+target_link_libraries({library_name}
+    ${{log-lib}}
+    # Add other libraries you need to link here
+)
+
+# Include directories
+target_include_directories({library_name} PRIVATE
+    .
+    # Add your header file directories here
+){self._generate_cmake_visibility(library_name)}"""
+
+    def _generate_cmake_visibility(self, library_name: str) -> str:
+        """Generate CMake settings hiding symbols not needed with RegisterNatives."""
+        if self.registration != DYNAMIC_REGISTRATION:
+            return ""
+        return f"""
+
+# Natives are bound by RegisterNatives: export only JNI_OnLoad/OnUnload and drop
+# unused code for a smaller dynamic symbol table and .so
+set_target_properties({library_name} PROPERTIES
+    CXX_VISIBILITY_PRESET hidden
+    VISIBILITY_INLINES_HIDDEN ON
+    LINK_FLAGS "-Wl,--exclude-libs,ALL -Wl,--gc-sections"
+)
+target_compile_options({library_name} PRIVATE -ffunction-sections -fdata-sections)"""
+
+    def _generate_gradle_config(self, class_handles: bool = False) -> str:
+        """Generate Gradle configuration."""
+        min_sdk = self._get_min_sdk(class_handles)
+        test_runner = ""
+        dependencies = ""
+        if self.async_wrappers and self.language == "kotlin" and not class_handles:
+            dependencies += """
+    implementation 'org.jetbrains.kotlinx:kotlinx-coroutines-android:1.7.3'"""
+        if (self.benchmark or self.stress_test) and not class_handles:
+            test_runner = """
+        testInstrumentationRunner "androidx.test.runner.AndroidJUnitRunner"
+"""
+            dependencies += """
+    androidTestImplementation 'androidx.test:runner:1.5.2'
+    androidTestImplementation 'androidx.test.ext:junit:1.1.5'"""
+        return f"""// Add to your app/build.gradle file
+
+android {{
+    compileSdk 33
+
+    defaultConfig {{
+        minSdk {min_sdk}
+        targetSdk 33
+{test_runner}
+        ndk {{
+            abiFilters 'arm64-v8a', 'armeabi-v7a', 'x86', 'x86_64'
+        }}
+    }}
 
-dependencies {
-    // Add your dependencies here
-}"""
+    externalNativeBuild {{
+        cmake {{
+            path "src/main/cpp/CMakeLists.txt"
+            version "3.10.2"
+        }}
+    }}
+}}
+
+dependencies {{
+    // Add your dependencies here{dependencies}
+}}"""
+
+    def _get_min_sdk(self, class_handles: bool = False) -> int:
+        """Get the minimum API level of the generated code."""
+        # java.lang.ref.Cleaner needs API level 33, CompletableFuture 24
+        if class_handles:
+            return 33
+        if self.async_wrappers and self.language != "kotlin":
+            return 24
+        return 21
 
     def _get_jni_function_name(self, function_name: str) -> str:
         """Get JNI function name."""
-        package_path = self.package_name.replace('.', '_')
-        return f"Java_{package_path}_{self.class_name}_{function_name}Native"
+        package_path = self._mangle_jni_name(self.package_name).replace('.', '_')
+        return (
+            f"Java_{package_path}_{self._mangle_jni_name(self.class_name)}_"
+            f"{self._mangle_jni_name(function_name)}Native"
+        )
+
+    def _mangle_jni_name(self, name: str) -> str:
+        """Escape a Java name for a JNI symbol: an underscore is written _1."""
+        return name.replace('_', '_1')
+
+    def _get_register_function_name(self) -> str:
+        """Get the name of the function registering the class's native methods."""
+        return f"Register{self.class_name}Natives"
+
+    def _get_jni_method_signature(self, parsed_interface: ParsedFunction, receiver: Optional[str] = None) -> str:
+        """Get the JNI type signature of the native method, e.g. ``(II)I``."""
+        param_descriptors = "".join(
+            self._get_param_jni_type_descriptor(param)
+            for param in self._get_native_parameters(parsed_interface)
+        )
+        if receiver is not None and not parsed_interface.is_static:
+            # Handle of the instance
+            param_descriptors = f"J{param_descriptors}"
+        return f"({param_descriptors}){self._get_jni_type_descriptor(parsed_interface.return_type)}"
+
+    def _get_native_annotation(self, parsed_interface: ParsedFunction) -> str:
+        """
+        Get the annotation applied to the native method.
+
+        The requested annotation falls back when the signature does not
+        qualify: annotated methods must take and return primitives only, and
+        @CriticalNative falls back to @FastNative with static registration,
+        as the runtime binds env-less Java_ symbols only from Android 12.
+
+        Args:
+            parsed_interface: Parsed C++ interface
+
+        Returns:
+            NO_ANNOTATION, FAST_NATIVE or CRITICAL_NATIVE
+        """
+        if self.native_annotation == NO_ANNOTATION:
+            return NO_ANNOTATION
+        types = [param.type for param in self._get_native_parameters(parsed_interface)]
+        if parsed_interface.return_type != 'void':
+            types.append(parsed_interface.return_type)
+        if not all(cpp_type in _PRIMITIVE_TYPES for cpp_type in types):
+            return NO_ANNOTATION
+        if self.native_annotation == CRITICAL_NATIVE and self.registration != DYNAMIC_REGISTRATION:
+            return FAST_NATIVE
+        return self.native_annotation
+
+    def _get_jni_param_declarations(self, parsed_interface: ParsedFunction, receiver: Optional[str] = None) -> str:
+        """Get the JNI function's parameter declarations following JNIEnv and jobject/jclass."""
+        declarations = [
+            f"{self._get_param_jni_type(param)} {param.name}"
+            for param in self._get_native_parameters(parsed_interface)
+        ]
+        if receiver is not None and not parsed_interface.is_static:
+            declarations.insert(0, "jlong nativeHandle")
+        return ", ".join(declarations)
+
+    def _get_native_parameters(self, parsed_interface: ParsedFunction) -> List[Parameter]:
+        """Get the parameters of the native method, without array length parameters."""
+        length_params = {param.length_param for param in parsed_interface.parameters if param.length_param}
+        return [param for param in parsed_interface.parameters if param.name not in length_params]
+
+    def _is_array(self, param: Parameter) -> bool:
+        """Check whether the parameter is a primitive array (pointer with length or vector)."""
+        return param.type.endswith('[]') and param.type[:-2] in _PRIMITIVE_TYPES
+
+    def _is_mutable_vector(self, param: Parameter) -> bool:
+        """Check whether the array parameter is a std::vector taken by non-const reference."""
+        return self._is_array(param) and param.is_reference and not param.is_const
+
+    def _get_vector_element_type(self, param: Parameter) -> str:
+        """Get the declared element type of a std::vector parameter."""
+        return param.cpp_type[param.cpp_type.index('<') + 1:param.cpp_type.rindex('>')].strip()
+
+    def _is_string_array(self, cpp_type: str) -> bool:
+        """Check whether the type is an array of strings, a String[] of local references."""
+        return cpp_type == 'string[]'
+
+    def _has_collections(self, parsed_interface: ParsedFunction) -> bool:
+        """Check whether the function takes arrays or String[]."""
+        return any(
+            self._is_array(param) or self._is_string_array(param.type)
+            for param in parsed_interface.parameters
+        )
+
+    def _is_direct_buffer(self, param: Parameter) -> bool:
+        """Check whether the array parameter is bound as a direct ByteBuffer."""
+        return self._is_array(param) and self.array_binding.get(param.name) == DIRECT_BUFFER_BINDING
+
+    def _get_param_jni_type(self, param: Parameter) -> str:
+        """Get the JNI type of a native method parameter."""
+        return 'jobject' if self._is_direct_buffer(param) else self._get_jni_type(param.type)
+
+    def _get_param_java_type(self, param: Parameter) -> str:
+        """Get the Java type of a native method parameter."""
+        return 'ByteBuffer' if self._is_direct_buffer(param) else self._get_java_type(param.type)
+
+    def _get_param_kotlin_type(self, param: Parameter) -> str:
+        """Get the Kotlin type of a native method parameter."""
+        return 'ByteBuffer' if self._is_direct_buffer(param) else self._get_kotlin_type(param.type)
+
+    def _get_param_jni_type_descriptor(self, param: Parameter) -> str:
+        """Get the JNI type descriptor of a native method parameter."""
+        if self._is_direct_buffer(param):
+            return 'Ljava/nio/ByteBuffer;'
+        return self._get_jni_type_descriptor(param.type)
+
+    def _has_batch(self, parsed_interface: ParsedFunction) -> bool:
+        """Check whether a batch variant is generated: scalar parameters and result only."""
+        return (
+            self.batch
+            and parsed_interface.return_type in _PRIMITIVE_TYPES
+            and bool(parsed_interface.parameters)
+            and all(param.type in _PRIMITIVE_TYPES for param in parsed_interface.parameters)
+        )
+
+    def _get_batch_method_signature(self, parsed_interface: ParsedFunction) -> str:
+        """Get the JNI type signature of the batch native method, e.g. ``([I[I)[I``."""
+        param_descriptors = "".join(
+            self._get_jni_type_descriptor(f"{param.type}[]") for param in parsed_interface.parameters
+        )
+        return f"({param_descriptors}){self._get_jni_type_descriptor(f'{parsed_interface.return_type}[]')}"
+
+    def _get_jni_type_descriptor(self, cpp_type: str) -> str:
+        """Get JNI type descriptor."""
+        if cpp_type.endswith('[]'):
+            return '[' + self._get_jni_type_descriptor(cpp_type[:-2])
+        descriptor_mapping = {
+            'void': 'V',
+            'boolean': 'Z',
+            'byte': 'B',
+            'short': 'S',
+            'int': 'I',
+            'long': 'J',
+            'float': 'F',
+            'double': 'D',
+            'string': 'Ljava/lang/String;'
+        }
+        return descriptor_mapping.get(cpp_type, 'Ljava/lang/Object;')
 
     def _get_jni_type(self, cpp_type: str) -> str:
         """Get JNI type."""
+        if self._is_string_array(cpp_type):
+            return 'jobjectArray'
+        if cpp_type.endswith('[]'):
+            return self._get_jni_type(cpp_type[:-2]) + 'Array'
         jni_type_mapping = {
             'void': 'void',
             'boolean': 'jboolean',
@@ -318,6 +2586,8 @@ dependencies {
 
     def _get_java_type(self, cpp_type: str) -> str:
         """Get Java type."""
+        if cpp_type.endswith('[]'):
+            return self._get_java_type(cpp_type[:-2]) + '[]'
         java_type_mapping = {
             'void': 'void',
             'boolean': 'boolean',
@@ -331,8 +2601,26 @@ dependencies {
         }
         return java_type_mapping.get(cpp_type, 'Object')
 
+    def _get_java_boxed_type(self, cpp_type: str) -> str:
+        """Get the Java type of a generic type argument, boxing primitives."""
+        boxed_types = {
+            'void': 'Void',
+            'boolean': 'Boolean',
+            'byte': 'Byte',
+            'short': 'Short',
+            'int': 'Integer',
+            'long': 'Long',
+            'float': 'Float',
+            'double': 'Double'
+        }
+        return boxed_types.get(cpp_type, self._get_java_type(cpp_type))
+
     def _get_kotlin_type(self, cpp_type: str) -> str:
         """Get Kotlin type."""
+        if self._is_string_array(cpp_type):
+            return 'Array<String>'
+        if cpp_type.endswith('[]'):
+            return self._get_kotlin_type(cpp_type[:-2]) + 'Array'
         kotlin_type_mapping = {
             'void': 'Unit',
             'boolean': 'Boolean',
@@ -346,13 +2634,31 @@ dependencies {
         }
         return kotlin_type_mapping.get(cpp_type, 'Any')
 
-    def _generate_param_conversion(self, param: Parameter) -> str:
+    def _generate_param_conversion(self, param: Parameter, default_return: str) -> str:
         """Generate parameter conversion code."""
-        if param.type == 'string':
-            return f"""// Convert jstring to std::string
-    const char* {param.name}_chars = env->GetStringUTFChars({param.name}, nullptr);
-    std::string {param.name}_cpp({param.name}_chars);
-    env->ReleaseStringUTFChars({param.name}, {param.name}_chars);"""
+        if self._is_direct_buffer(param):
+            return f"""// Access the direct ByteBuffer {param.name} in place
+    JniDirectBuffer<{self._get_jni_type(param.type[:-2])}> {param.name}_buffer(env, {param.name});
+    if (!{param.name}_buffer.valid()) {{
+        env->ThrowNew(gJniCache.illegalArgumentExceptionClass, "{param.name} must be a direct ByteBuffer");
+        {default_return}
+    }}"""
+        elif self._is_mutable_vector(param):
+            return (
+                f"// {param.name} is pinned with GetPrimitiveArrayCritical for the call and passed as "
+                "a vector written back to it"
+            )
+        elif self._is_array(param):
+            return f"// {param.name} is pinned with GetPrimitiveArrayCritical for the call"
+        elif self._is_string_array(param.type):
+            return f"""// Copy the String[] elements, a local reference frame at a time
+    std::vector<std::string> {param.name}_strings;
+    if (!CopyJStringArray(env, {param.name}, {param.name}_strings)) {{
+        {default_return}
+    }}"""
+        elif param.type == 'string':
+            return f"""// Copy jstring into a stack (or, when long, heap) buffer
+    JniUtfString {param.name}_utf(env, {param.name});"""
         else:
             return f"// {param.name} can be used directly as {param.type}"
 
@@ -360,11 +2666,53 @@ dependencies {
         """Generate return value conversion code."""
         if return_type == 'void':
             return ''
+        elif self._is_string_array(return_type):
+            return '        return NewJStringArray(env, result);'
+        elif return_type.endswith('[]'):
+            element_type = return_type[:-2]
+            jni_element_type = self._get_jni_type(element_type)
+            array_kind = self._get_kotlin_type(element_type)
+            if element_type == 'boolean':
+                # std::vector<bool> packs its elements and has no data()
+                elements = "std::vector<jboolean> elements(result.begin(), result.end());\n            "
+                data = "elements.data()"
+            else:
+                elements = ""
+                data = f"reinterpret_cast<const {jni_element_type} *>(result.data())"
+            return f"""        {jni_element_type}Array array = env->New{array_kind}Array(static_cast<jsize>(result.size()));
+        if (array != nullptr) {{
+            {elements}env->Set{array_kind}ArrayRegion(
+                array, 0, static_cast<jsize>(result.size()), {data});
+        }}
+        return array;"""
         elif return_type == 'string':
-            return '        return env->NewStringUTF(result.c_str());'
+            return '        return NewJString(env, result);'
         else:
             return '        return result;'
 
+    def _get_call_argument(self, param: Parameter, parameters: List[Parameter]) -> str:
+        """Get the expression passing a converted parameter to the C++ function."""
+        for array_param in parameters:
+            if array_param.length_param == param.name:
+                return f"{self._get_call_argument(array_param, parameters)}.size()"
+        if self._is_mutable_vector(param):
+            return f"{param.name}_vector.values()"
+        if self._is_direct_buffer(param):
+            return f"{param.name}_buffer"
+        if self._is_array(param):
+            return f"{param.name}_elements"
+        if param.type == 'string':
+            return f"{param.name}_utf"
+        if self._is_string_array(param.type):
+            return f"{param.name}_strings"
+        return param.name
+
+    def _uses_strings(self, parsed_interface: ParsedFunction) -> bool:
+        """Check whether the function takes or returns strings or String[]."""
+        return parsed_interface.return_type in ('string', 'string[]') or any(
+            param.type in ('string', 'string[]') for param in parsed_interface.parameters
+        )
+
     def _get_default_value(self, type_name: str) -> str:
         """Get default value for type."""
         default_values = {
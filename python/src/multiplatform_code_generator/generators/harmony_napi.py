@@ -9,6 +9,19 @@ from ..parsers.cpp_parser import ParsedFunction, Parameter
 from ..utils.file_manager import FileManager
 
 
+# Typed array of each scalar type in batch variants: TypeScript type, NAPI
+# typed array type and C++ element type
+_TYPED_ARRAYS = {
+    'boolean': ('Uint8Array', 'napi_uint8_array', 'uint8_t'),
+    'byte': ('Int8Array', 'napi_int8_array', 'int8_t'),
+    'short': ('Int16Array', 'napi_int16_array', 'int16_t'),
+    'int': ('Int32Array', 'napi_int32_array', 'int32_t'),
+    'long': ('BigInt64Array', 'napi_bigint64_array', 'int64_t'),
+    'float': ('Float32Array', 'napi_float32_array', 'float'),
+    'double': ('Float64Array', 'napi_float64_array', 'double'),
+}
+
+
 class HarmonyNapiGenerator:
     """HarmonyOS NAPI code generator."""
 
@@ -21,6 +34,7 @@ class HarmonyNapiGenerator:
         """
         self.module_name = config.get("module_name", "CppBridge")
         self.namespace = config.get("namespace", "cppbridge")
+        self.batch = config.get("batch", False)
 
     async def generate(self, parsed_interface: ParsedFunction, file_manager: FileManager) -> List[str]:
         """
@@ -33,55 +47,71 @@ class HarmonyNapiGenerator:
         Returns:
             List of generated file paths
         """
-        files = []
+        files = self.render(parsed_interface)
+        for file_path, content in files.items():
+            await file_manager.write_file(file_path, content)
+        return list(files)
+
+    def render(self, parsed_interface: ParsedFunction) -> Dict[str, str]:
+        """
+        Render HarmonyOS NAPI code without writing it.
+        
+        Args:
+            parsed_interface: Parsed C++ interface
+            
+        Returns:
+            Mapping of relative file path to file content, in generation order
+        """
+        files: Dict[str, str] = {}
 
         # Generate NAPI C++ code
         napi_cpp_code = self._generate_napi_cpp(parsed_interface)
         napi_cpp_file = f"harmony/src/main/cpp/napi/{parsed_interface.function_name}_napi.cpp"
-        await file_manager.write_file(napi_cpp_file, napi_cpp_code)
-        files.append(napi_cpp_file)
+        files[napi_cpp_file] = napi_cpp_code
 
         # Generate NAPI header file
         napi_header_code = self._generate_napi_header(parsed_interface)
         napi_header_file = f"harmony/src/main/cpp/napi/{parsed_interface.function_name}_napi.h"
-        await file_manager.write_file(napi_header_file, napi_header_code)
-        files.append(napi_header_file)
+        files[napi_header_file] = napi_header_code
 
         # Generate NAPI module registration file
         module_code = self._generate_napi_module(parsed_interface)
         module_file = "harmony/src/main/cpp/napi/napi_init.cpp"
-        await file_manager.write_file(module_file, module_code)
-        files.append(module_file)
+        files[module_file] = module_code
 
         # Generate TypeScript declaration file
         ts_declaration_code = self._generate_typescript_declaration(parsed_interface)
         ts_declaration_file = f"harmony/src/main/ets/types/{self.module_name}.d.ts"
-        await file_manager.write_file(ts_declaration_file, ts_declaration_code)
-        files.append(ts_declaration_file)
+        files[ts_declaration_file] = ts_declaration_code
 
         # Generate ArkTS wrapper class
         arkts_code = self._generate_arkts_wrapper(parsed_interface)
         arkts_file = f"harmony/src/main/ets/{self.module_name}.ets"
-        await file_manager.write_file(arkts_file, arkts_code)
-        files.append(arkts_file)
+        files[arkts_file] = arkts_code
+
+        # Generate the benchmark comparing single and batch calls
+        if self._has_batch(parsed_interface):
+            benchmark_code = self._generate_batch_benchmark(parsed_interface)
+            benchmark_file = (
+                f"harmony/src/main/ets/benchmark/"
+                f"{self._capitalize_first_letter(parsed_interface.function_name)}Benchmark.ets"
+            )
+            files[benchmark_file] = benchmark_code
 
         # Generate CMakeLists.txt
         cmake_code = self._generate_cmake_lists(parsed_interface)
         cmake_file = "harmony/src/main/cpp/CMakeLists.txt"
-        await file_manager.write_file(cmake_file, cmake_code)
-        files.append(cmake_file)
+        files[cmake_file] = cmake_code
 
         # Generate oh-package.json5
         package_code = self._generate_oh_package(parsed_interface)
         package_file = "harmony/oh-package.json5"
-        await file_manager.write_file(package_file, package_code)
-        files.append(package_file)
+        files[package_file] = package_code
 
         # Generate build-profile.json5
         build_profile_code = self._generate_build_profile()
         build_profile_file = "harmony/build-profile.json5"
-        await file_manager.write_file(build_profile_file, build_profile_code)
-        files.append(build_profile_file)
+        files[build_profile_file] = build_profile_code
 
         return files
 
@@ -93,13 +123,27 @@ class HarmonyNapiGenerator:
         namespace = parsed_interface.namespace
 
         napi_function_name = f"NAPI_{function_name}"
-        
-        param_conversions = "\n        ".join(
-            self._generate_napi_param_conversion(param, i) 
-            for i, param in enumerate(parameters)
-        )
+        js_parameters = self._get_native_parameters(parsed_interface)
+
+        # Length parameters are taken from the typed array before them
+        arrays_by_length = {
+            param.length_param: param for param in parameters if param.length_param
+        }
+        conversions = []
+        for param in parameters:
+            array_param = arrays_by_length.get(param.name)
+            if array_param is not None:
+                length_type = param.cpp_type or 'size_t'
+                conversions.append(f"""// {param.name} is the length of {array_param.name}
+        {length_type} {param.name} = static_cast<{length_type}>({array_param.name}_length);""")
+            else:
+                conversions.append(self._generate_napi_param_conversion(param, js_parameters.index(param)))
+        param_conversions = "\n        ".join(conversions)
         param_names = ", ".join(param.name for param in parameters)
         return_conversion = self._generate_napi_return_conversion(return_type)
+        typed_array_helpers = ""
+        if self._has_batch(parsed_interface) or self._uses_typed_arrays(parsed_interface):
+            typed_array_helpers = self._generate_typed_array_helpers()
 
         return f"""#include "{parsed_interface.function_name}_napi.h"
 #include <hilog/log.h>
@@ -109,12 +153,12 @@ using namespace std;
 
 static constexpr unsigned int LOG_PRINT_DOMAIN = 0xFF00;
 static constexpr char LOG_TAG[] = "{self.module_name}";
-
+{typed_array_helpers}
 napi_value {napi_function_name}(napi_env env, napi_callback_info info) {{
     OH_LOG_Print(LOG_APP, LOG_INFO, LOG_PRINT_DOMAIN, LOG_TAG, "NAPI {function_name} called");
     
-    size_t argc = {len(parameters)};
-    napi_value args[{max(len(parameters), 1)}];
+    size_t argc = {len(js_parameters)};
+    napi_value args[{max(len(js_parameters), 1)}];
     napi_value thisVar = nullptr;
     
     napi_status status = napi_get_cb_info(env, info, &argc, args, &thisVar, nullptr);
@@ -123,7 +167,7 @@ napi_value {napi_function_name}(napi_env env, napi_callback_info info) {{
         return nullptr;
     }}
     
-    if (argc != {len(parameters)}) {{
+    if (argc != {len(js_parameters)}) {{
         napi_throw_error(env, nullptr, "Wrong number of arguments");
         return nullptr;
     }}
@@ -139,13 +183,118 @@ napi_value {napi_function_name}(napi_env env, napi_callback_info info) {{
         napi_throw_error(env, nullptr, e.what());
         return nullptr;
     }}
+}}{self._generate_napi_batch(parsed_interface)}"""
+
+    def _generate_napi_batch(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the NAPI function calling the C++ function for each element of typed arrays."""
+        if not self._has_batch(parsed_interface):
+            return ""
+        function_name = parsed_interface.function_name
+        parameters = parsed_interface.parameters
+        namespace = parsed_interface.namespace
+        result_ts_type, result_napi_type, result_c_type = _TYPED_ARRAYS[parsed_interface.return_type]
+
+        element_conversions = []
+        for index, param in enumerate(parameters):
+            ts_type, napi_type, c_type = _TYPED_ARRAYS[param.type]
+            length_check = "" if index == 0 else f" || {param.name}Length != count"
+            requirement = f"{'an' if ts_type.startswith('I') else 'a'} {ts_type}"
+            if index > 0:
+                requirement += f" as long as {parameters[0].name}"
+            count_declaration = f"\n    size_t count = {param.name}Length;" if index == 0 else ""
+            element_conversions.append(f"""{c_type} *{param.name}Elements = nullptr;
+    size_t {param.name}Length = 0;
+    if (!GetTypedArrayElements(env, args[{index}], {napi_type}, &{param.name}Elements, &{param.name}Length){length_check}) {{
+        napi_throw_type_error(env, nullptr, "{param.name} must be {requirement}");
+        return nullptr;
+    }}{count_declaration}""")
+        element_conversions_code = "\n    ".join(element_conversions)
+        arguments = ", ".join(f"{param.name}Elements[i]" for param in parameters)
+
+        return f"""
+
+napi_value NAPI_{function_name}Batch(napi_env env, napi_callback_info info) {{
+    size_t argc = {len(parameters)};
+    napi_value args[{len(parameters)}];
+    
+    napi_status status = napi_get_cb_info(env, info, &argc, args, nullptr, nullptr);
+    if (status != napi_ok || argc != {len(parameters)}) {{
+        napi_throw_error(env, nullptr, "Wrong number of arguments");
+        return nullptr;
+    }}
+    
+    // One NAPI transition for the whole batch: {function_name} is called for
+    // each element of the typed arrays, accessed in place
+    {element_conversions_code}
+    
+    {result_c_type} *resultElements = nullptr;
+    napi_value resultArray = CreateTypedArray(env, {result_napi_type}, count, &resultElements);
+    if (resultArray == nullptr) {{
+        napi_throw_error(env, nullptr, "Failed to create the {result_ts_type} of results");
+        return nullptr;
+    }}
+    
+    try {{
+        for (size_t i = 0; i < count; ++i) {{
+            resultElements[i] = {namespace + '::' if namespace else ''}{function_name}({arguments});
+        }}
+        return resultArray;
+    }} catch (const std::exception& e) {{
+        OH_LOG_Print(LOG_APP, LOG_ERROR, LOG_PRINT_DOMAIN, LOG_TAG, "Error in {function_name}Batch: %{{public}}s", e.what());
+        napi_throw_error(env, nullptr, e.what());
+        return nullptr;
+    }}
 }}"""
 
+    def _generate_typed_array_helpers(self) -> str:
+        """Generate the helpers accessing typed array elements in place."""
+        return """
+// Elements of a typed array, read and written in place
+template <typename T>
+static bool GetTypedArrayElements(napi_env env, napi_value value, napi_typedarray_type expected,
+                                  T **data, size_t *length) {
+    bool isTypedArray = false;
+    if (napi_is_typedarray(env, value, &isTypedArray) != napi_ok || !isTypedArray) {
+        return false;
+    }
+    napi_typedarray_type type;
+    void *elements = nullptr;
+    if (napi_get_typedarray_info(env, value, &type, length, &elements, nullptr, nullptr) != napi_ok ||
+        type != expected) {
+        return false;
+    }
+    *data = static_cast<T *>(elements);
+    return true;
+}
+
+// New typed array of the given length, its elements written in place
+template <typename T>
+static napi_value CreateTypedArray(napi_env env, napi_typedarray_type type, size_t length, T **data) {
+    void *elements = nullptr;
+    napi_value buffer = nullptr;
+    napi_value array = nullptr;
+    if (napi_create_arraybuffer(env, length * sizeof(T), &elements, &buffer) != napi_ok ||
+        napi_create_typedarray(env, type, length, buffer, 0, &array) != napi_ok) {
+        return nullptr;
+    }
+    *data = static_cast<T *>(elements);
+    return array;
+}
+"""
+
     def _generate_napi_header(self, parsed_interface: ParsedFunction) -> str:
         """Generate NAPI header file."""
         function_name = parsed_interface.function_name
         napi_function_name = f"NAPI_{function_name}"
         header_guard = f"{function_name.upper()}_NAPI_H"
+        batch_declaration = ""
+        if self._has_batch(parsed_interface):
+            batch_declaration = f"""
+
+/**
+ * NAPI batch wrapper for {function_name}
+ */
+napi_value {napi_function_name}Batch(napi_env env, napi_callback_info info);"""
 
         return f"""#ifndef {header_guard}
 #define {header_guard}
@@ -155,7 +304,7 @@ napi_value {napi_function_name}(napi_env env, napi_callback_info info) {{
 /**
  * NAPI wrapper for {function_name}
  */
-napi_value {napi_function_name}(napi_env env, napi_callback_info info);
+napi_value {napi_function_name}(napi_env env, napi_callback_info info);{batch_declaration}
 
 #endif // {header_guard}"""
 
@@ -163,13 +312,19 @@ napi_value {napi_function_name}(napi_env env, napi_callback_info info);
         """Generate NAPI module registration file."""
         function_name = parsed_interface.function_name
         napi_function_name = f"NAPI_{function_name}"
+        batch_descriptor = ""
+        if self._has_batch(parsed_interface):
+            batch_descriptor = (
+                f',\n        {{ "{function_name}Batch", nullptr, {napi_function_name}Batch, '
+                f'nullptr, nullptr, nullptr, napi_default, nullptr }}'
+            )
 
         return f"""#include "napi/native_api.h"
 #include "{parsed_interface.function_name}_napi.h"
 
 static napi_value Init(napi_env env, napi_value exports) {{
     napi_property_descriptor desc[] = {{
-        {{ "{function_name}", nullptr, {napi_function_name}, nullptr, nullptr, nullptr, napi_default, nullptr }}
+        {{ "{function_name}", nullptr, {napi_function_name}, nullptr, nullptr, nullptr, napi_default, nullptr }}{batch_descriptor}
     }};
     
     napi_status status = napi_define_properties(env, exports, sizeof(desc) / sizeof(desc[0]), desc);
@@ -204,9 +359,18 @@ extern "C" __attribute__((constructor)) void RegisterModule(void) {{
         
         param_declarations = ", ".join(
             f"{param.name}: {self._get_typescript_type(param.type)}" 
-            for param in parameters
+            for param in self._get_native_parameters(parsed_interface)
         )
 
+        batch_declaration = ""
+        if self._has_batch(parsed_interface):
+            batch_declaration = f"""
+
+  /**
+   * {function_name} for each element of the typed arrays, in one native call
+   */
+  function {function_name}Batch({self._get_batch_param_declarations(parsed_interface)}): {_TYPED_ARRAYS[return_type][0]};"""
+
         return f"""/**
  * TypeScript declaration for {self.module_name}
  * Generated automatically - do not modify
@@ -216,7 +380,7 @@ declare namespace {self.namespace} {{
   /**
    * {function_name} function
    */
-  function {function_name}({param_declarations}): {ts_return_type};
+  function {function_name}({param_declarations}): {ts_return_type};{batch_declaration}
 }}
 
 export = {self.namespace};"""
@@ -231,10 +395,34 @@ export = {self.namespace};"""
         
         param_declarations = ", ".join(
             f"{param.name}: {self._get_typescript_type(param.type)}" 
-            for param in parameters
+            for param in self._get_native_parameters(parsed_interface)
         )
 
-        param_names = ", ".join(param.name for param in parameters)
+        param_names = ", ".join(param.name for param in self._get_native_parameters(parsed_interface))
+
+        batch_method = ""
+        batch_export = ""
+        if self._has_batch(parsed_interface):
+            batch_param_declarations = self._get_batch_param_declarations(parsed_interface)
+            batch_return_type = _TYPED_ARRAYS[return_type][0]
+            batch_method = f"""
+  
+  /**
+   * Batch version of {function_name}: one native call for every element
+   */
+  static {function_name}Batch({batch_param_declarations}): {batch_return_type} {{
+    try {{
+      return {self.module_name}.{function_name}Batch({param_names});
+    }} catch (error) {{
+      console.error(`Error calling {function_name}Batch: ${{error}}`);
+      throw error;
+    }}
+  }}"""
+            batch_export = f"""
+  
+  export function {function_name}Batch({batch_param_declarations}): {batch_return_type} {{
+    return bridge.{function_name}Batch({param_names});
+  }}"""
 
         return f"""/**
  * ArkTS wrapper for {function_name}
@@ -269,7 +457,7 @@ export class {self._capitalize_first_letter(function_name)}Bridge {{
         reject(error);
       }}
     }});
-  }}
+  }}{batch_method}
 }}
 
 /**
@@ -289,9 +477,76 @@ export namespace {self._capitalize_first_letter(function_name)} {{
   
   export function {function_name}Async({param_declarations}): Promise<{ts_return_type}> {{
     return bridge.{function_name}Async({param_names});
+  }}{batch_export}
+}}"""
+
+    def _generate_batch_benchmark(self, parsed_interface: ParsedFunction) -> str:
+        """Generate an ArkTS benchmark comparing the per-element cost of single and batch calls."""
+        function_name = parsed_interface.function_name
+        parameters = parsed_interface.parameters
+        bridge_name = f"{self._capitalize_first_letter(function_name)}Bridge"
+
+        single_arguments = ", ".join(self._get_benchmark_value(param.type) for param in parameters)
+        typed_arrays = "\n  ".join(
+            f"const {param.name}Values = new {_TYPED_ARRAYS[param.type][0]}(BATCH_SIZE)"
+            f".fill({self._get_benchmark_value(param.type, typed=True)});"
+            for param in parameters
+        )
+        batch_arguments = ", ".join(f"{param.name}Values" for param in parameters)
+
+        return f"""/**
+ * Benchmark of {function_name}: per-element cost of single calls and of {function_name}Batch
+ * Generated automatically - call run{self._capitalize_first_letter(function_name)}Benchmark() and read the log
+ */
+
+import {{ {bridge_name} }} from '../{self.module_name}';
+
+const WARMUP_MS: number = 500;
+const MEASURE_MS: number = 2000;
+const BATCH_CALLS: number = 100;
+const BATCH_SIZE: number = 4096;
+
+function measure(name: string, elementsPerCall: number, call: () => void): string {{
+  const warmupEnd = Date.now() + WARMUP_MS;
+  while (Date.now() < warmupEnd) {{
+    call();
   }}
+
+  let calls = 0;
+  const start = Date.now();
+  let elapsed = 0;
+  do {{
+    for (let i = 0; i < BATCH_CALLS; i++) {{
+      call();
+    }}
+    calls += BATCH_CALLS;
+    elapsed = Date.now() - start;
+  }} while (elapsed < MEASURE_MS);
+
+  const nsPerElement = elapsed * 1e6 / (calls * elementsPerCall);
+  const report = `${{name}}: ${{Math.round(calls * 1000 / elapsed)}} calls/s (${{nsPerElement.toFixed(1)}} ns/element)`;
+  console.info(report);
+  return report;
+}}
+
+export function run{self._capitalize_first_letter(function_name)}Benchmark(): string[] {{
+  {typed_arrays}
+  return [
+    measure('{function_name}', 1, () => {{ {bridge_name}.{function_name}({single_arguments}); }}),
+    measure('{function_name}Batch', BATCH_SIZE, () => {{ {bridge_name}.{function_name}Batch({batch_arguments}); }}),
+  ];
 }}"""
 
+    def _get_benchmark_value(self, cpp_type: str, typed: bool = False) -> str:
+        """Get a sample value of a scalar type, or of its typed array elements."""
+        if cpp_type == 'boolean':
+            return '1' if typed else 'true'
+        if cpp_type == 'long' and typed:
+            return '42n'
+        if cpp_type in ('float', 'double'):
+            return '1.5'
+        return '42'
+
     def _generate_cmake_lists(self, parsed_interface: ParsedFunction) -> str:
         """Generate CMakeLists.txt."""
         function_name = parsed_interface.function_name
@@ -356,6 +611,12 @@ target_link_libraries({library_name} PUBLIC libace_napi.z.so libhilog_ndk.z.so)"
         int32_t {param_name};
         napi_get_value_int32(env, args[{index}], &{param_name});"""
         
+        elif param_type in ('byte', 'short'):
+            return f"""// Convert {param_type} parameter
+        int32_t {param_name}_int;
+        napi_get_value_int32(env, args[{index}], &{param_name}_int);
+        {_TYPED_ARRAYS[param_type][2]} {param_name} = static_cast<{_TYPED_ARRAYS[param_type][2]}>({param_name}_int);"""
+        
         elif param_type == 'long':
             return f"""// Convert long parameter
         int64_t {param_name};
@@ -381,6 +642,45 @@ target_link_libraries({library_name} PUBLIC libace_napi.z.so libhilog_ndk.z.so)"
         std::string {param_name}({param_name}_buffer);
         delete[] {param_name}_buffer;"""
         
+        elif param_type == 'string[]':
+            return f"""// Convert string array parameter
+        uint32_t {param_name}_count = 0;
+        napi_get_array_length(env, args[{index}], &{param_name}_count);
+        std::vector<std::string> {param_name};
+        {param_name}.reserve({param_name}_count);
+        for (uint32_t i = 0; i < {param_name}_count; ++i) {{
+            napi_value element;
+            size_t length = 0;
+            napi_get_element(env, args[{index}], i, &element);
+            napi_get_value_string_utf8(env, element, nullptr, 0, &length);
+            std::string value(length, '\\0');
+            napi_get_value_string_utf8(env, element, &value[0], length + 1, &length);
+            {param_name}.push_back(std::move(value));
+        }}"""
+        
+        elif param_type.endswith('[]') and param_type[:-2] in _TYPED_ARRAYS:
+            ts_type, napi_type, c_type = _TYPED_ARRAYS[param_type[:-2]]
+            if param.is_pointer:
+                # Passed in place, as the declared pointer type
+                pointee = (param.cpp_type or f"{c_type}*").rstrip('*').strip()
+                argument = f"{pointee} *{param_name} = reinterpret_cast<{pointee} *>({param_name}_elements);"
+            else:
+                vector_type = (param.cpp_type or f"std::vector<{c_type}>").rstrip('&').strip()
+                if vector_type.startswith('const '):
+                    vector_type = vector_type[len('const '):]
+                argument = (
+                    f"{vector_type} {param_name}({param_name}_elements, "
+                    f"{param_name}_elements + {param_name}_length);"
+                )
+            return f"""// Convert {param_name} from {'an' if ts_type.startswith('I') else 'a'} {ts_type}
+        {c_type} *{param_name}_elements = nullptr;
+        size_t {param_name}_length = 0;
+        if (!GetTypedArrayElements(env, args[{index}], {napi_type}, &{param_name}_elements, &{param_name}_length)) {{
+            napi_throw_type_error(env, nullptr, "{param_name} must be {'an' if ts_type.startswith('I') else 'a'} {ts_type}");
+            return nullptr;
+        }}
+        {argument}"""
+        
         else:
             return f"// TODO: Handle {param_type} parameter conversion for {param_name}"
 
@@ -394,7 +694,7 @@ target_link_libraries({library_name} PUBLIC libace_napi.z.so libhilog_ndk.z.so)"
         napi_get_boolean(env, result, &napiResult);
         return napiResult;"""
         
-        elif return_type == 'int':
+        elif return_type in ['byte', 'short', 'int']:
             return """        napi_value napiResult;
         napi_create_int32(env, result, &napiResult);
         return napiResult;"""
@@ -414,11 +714,64 @@ target_link_libraries({library_name} PUBLIC libace_napi.z.so libhilog_ndk.z.so)"
         napi_create_string_utf8(env, result.c_str(), NAPI_AUTO_LENGTH, &napiResult);
         return napiResult;"""
         
+        elif return_type == 'string[]':
+            return """        napi_value napiResult;
+        napi_create_array_with_length(env, result.size(), &napiResult);
+        for (size_t i = 0; i < result.size(); ++i) {
+            napi_value element;
+            napi_create_string_utf8(env, result[i].c_str(), result[i].size(), &element);
+            napi_set_element(env, napiResult, static_cast<uint32_t>(i), element);
+        }
+        return napiResult;"""
+        
+        elif return_type.endswith('[]') and return_type[:-2] in _TYPED_ARRAYS:
+            ts_type, napi_type, c_type = _TYPED_ARRAYS[return_type[:-2]]
+            return f"""        {c_type} *resultElements = nullptr;
+        napi_value napiResult = CreateTypedArray(env, {napi_type}, result.size(), &resultElements);
+        if (napiResult == nullptr) {{
+            napi_throw_error(env, nullptr, "Failed to create the {ts_type} of results");
+            return nullptr;
+        }}
+        // Element by element, as std::vector<bool> has no data()
+        for (size_t i = 0; i < result.size(); ++i) {{
+            resultElements[i] = result[i];
+        }}
+        return napiResult;"""
+        
         else:
             return '        // TODO: Handle return type conversion\n        return nullptr;'
 
+    def _has_batch(self, parsed_interface: ParsedFunction) -> bool:
+        """Check whether a batch variant is generated: scalar parameters and result only."""
+        return (
+            self.batch
+            and parsed_interface.return_type in _TYPED_ARRAYS
+            and bool(parsed_interface.parameters)
+            and all(param.type in _TYPED_ARRAYS for param in parsed_interface.parameters)
+        )
+
+    def _get_native_parameters(self, parsed_interface: ParsedFunction) -> List[Parameter]:
+        """Get the parameters passed from ArkTS, without array length parameters."""
+        length_params = {param.length_param for param in parsed_interface.parameters if param.length_param}
+        return [param for param in parsed_interface.parameters if param.name not in length_params]
+
+    def _uses_typed_arrays(self, parsed_interface: ParsedFunction) -> bool:
+        """Check whether the function takes or returns arrays bound as typed arrays."""
+        types = [parsed_interface.return_type] + [param.type for param in parsed_interface.parameters]
+        return any(cpp_type.endswith('[]') and cpp_type[:-2] in _TYPED_ARRAYS for cpp_type in types)
+
+    def _get_batch_param_declarations(self, parsed_interface: ParsedFunction) -> str:
+        """Get the typed array parameter declarations of the batch variant."""
+        return ", ".join(
+            f"{param.name}: {_TYPED_ARRAYS[param.type][0]}" for param in parsed_interface.parameters
+        )
+
     def _get_typescript_type(self, cpp_type: str) -> str:
         """Get TypeScript type."""
+        if cpp_type == 'string[]':
+            return 'string[]'
+        if cpp_type.endswith('[]') and cpp_type[:-2] in _TYPED_ARRAYS:
+            return _TYPED_ARRAYS[cpp_type[:-2]][0]
         ts_type_mapping = {
             'void': 'void',
             'boolean': 'boolean',
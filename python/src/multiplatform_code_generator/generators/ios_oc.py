@@ -9,6 +9,33 @@ from ..parsers.cpp_parser import ParsedFunction, Parameter
 from ..utils.file_manager import FileManager
 
 
+# NSNumber accessor of each array element type
+_NSNUMBER_ACCESSORS = {
+    'boolean': 'boolValue',
+    'byte': 'charValue',
+    'short': 'shortValue',
+    'int': 'intValue',
+    'long': 'longLongValue',
+    'float': 'floatValue',
+    'double': 'doubleValue',
+}
+
+# Swift types of C element types that do not map to a signed Swift integer
+# of the element's width
+_SWIFT_POINTEE_TYPES = {
+    'unsigned char': 'UInt8',
+    'uint8_t': 'UInt8',
+    'unsigned short': 'UInt16',
+    'uint16_t': 'UInt16',
+    'unsigned int': 'UInt32',
+    'uint32_t': 'UInt32',
+    'long': 'Int',
+    'unsigned long': 'UInt',
+    'uint64_t': 'UInt64',
+    'size_t': 'Int',
+}
+
+
 class IosOcGenerator:
     """iOS Objective-C code generator."""
 
@@ -33,50 +60,58 @@ class IosOcGenerator:
         Returns:
             List of generated file paths
         """
-        files = []
+        files = self.render(parsed_interface)
+        for file_path, content in files.items():
+            await file_manager.write_file(file_path, content)
+        return list(files)
+
+    def render(self, parsed_interface: ParsedFunction) -> Dict[str, str]:
+        """
+        Render iOS Objective-C code without writing it.
+        
+        Args:
+            parsed_interface: Parsed C++ interface
+            
+        Returns:
+            Mapping of relative file path to file content, in generation order
+        """
+        files: Dict[str, str] = {}
         class_name = f"{self.class_prefix}{self._capitalize_first_letter(parsed_interface.function_name)}"
 
         # Generate Objective-C header file
         header_code = self._generate_objc_header(parsed_interface, class_name)
         header_file = f"ios/{class_name}.h"
-        await file_manager.write_file(header_file, header_code)
-        files.append(header_file)
+        files[header_file] = header_code
 
         # Generate Objective-C implementation file
         implementation_code = self._generate_objc_implementation(parsed_interface, class_name)
         implementation_file = f"ios/{class_name}.m"
-        await file_manager.write_file(implementation_file, implementation_code)
-        files.append(implementation_file)
+        files[implementation_file] = implementation_code
 
         # Generate C++ bridge header file
         bridge_header_code = self._generate_cpp_bridge_header(parsed_interface, class_name)
         bridge_header_file = f"ios/{class_name}Bridge.hpp"
-        await file_manager.write_file(bridge_header_file, bridge_header_code)
-        files.append(bridge_header_file)
+        files[bridge_header_file] = bridge_header_code
 
         # Generate C++ bridge implementation file
         bridge_implementation_code = self._generate_cpp_bridge_implementation(parsed_interface, class_name)
         bridge_implementation_file = f"ios/{class_name}Bridge.cpp"
-        await file_manager.write_file(bridge_implementation_file, bridge_implementation_code)
-        files.append(bridge_implementation_file)
+        files[bridge_implementation_file] = bridge_implementation_code
 
         # Generate Swift wrapper class (optional)
         swift_code = self._generate_swift_wrapper(parsed_interface, class_name)
         swift_file = f"ios/{class_name}Swift.swift"
-        await file_manager.write_file(swift_file, swift_code)
-        files.append(swift_file)
+        files[swift_file] = swift_code
 
         # Generate Podspec file
         podspec_code = self._generate_podspec(parsed_interface)
         podspec_file = f"ios/{self.framework_name}.podspec"
-        await file_manager.write_file(podspec_file, podspec_code)
-        files.append(podspec_file)
+        files[podspec_file] = podspec_code
 
         # Generate Xcode configuration
         xconfig_code = self._generate_xcode_config()
         xconfig_file = "ios/Config.xcconfig"
-        await file_manager.write_file(xconfig_file, xconfig_code)
-        files.append(xconfig_file)
+        files[xconfig_file] = xconfig_code
 
         return files
 
@@ -181,10 +216,11 @@ NS_ASSUME_NONNULL_END"""
         parameters = parsed_interface.parameters
         namespace = parsed_interface.namespace
 
-        cpp_return_type = return_type
+        cpp_return_type = self._get_bridge_return_type(parsed_interface)
+        vector_include = "\n#include <vector>" if self._has_vectors(parsed_interface) else ""
         
         param_declarations = ", ".join(
-            f"{self._get_cpp_type(param.type)} {param.name}" 
+            f"{self._get_bridge_type(param)} {param.name}" 
             for param in parameters
         )
 
@@ -198,7 +234,7 @@ NS_ASSUME_NONNULL_END"""
 #ifndef {class_name}Bridge_hpp
 #define {class_name}Bridge_hpp
 
-#include <string>
+#include <string>{vector_include}
 {f'#include "{namespace}.h"' if namespace else '// Include your C++ header file here'}
 
 namespace {self.framework_name.lower()}Bridge {{
@@ -241,7 +277,7 @@ void* StdStringToNSString(const std::string& str);
 
 namespace {self.framework_name.lower()}Bridge {{
 
-{return_type} {function_name}Bridge({", ".join(f"{self._get_cpp_type(param.type)} {param.name}" for param in parameters)}) {{
+{self._get_bridge_return_type(parsed_interface)} {function_name}Bridge({", ".join(f"{self._get_bridge_type(param)} {param.name}" for param in parameters)}) {{
     try {{
         {param_conversions}
         
@@ -276,7 +312,7 @@ void* StdStringToNSString(const std::string& str) {{
         swift_return_type = self._get_swift_type(return_type)
         
         param_declarations = ", ".join(
-            f"{param.name}: {self._get_swift_type(param.type)}" 
+            f"{param.name}: {self._get_swift_param_type(param)}" 
             for param in parameters
         )
 
@@ -371,10 +407,10 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
             return f"- ({return_type}){function_name}"
 
         first_param = parameters[0]
-        signature = f"- ({return_type}){function_name}:({self._get_objc_type(first_param.type)}){first_param.name}"
+        signature = f"- ({return_type}){function_name}:({self._get_objc_param_type(first_param)}){first_param.name}"
 
         for param in parameters[1:]:
-            signature += f" {param.name}:({self._get_objc_type(param.type)}){param.name}"
+            signature += f" {param.name}:({self._get_objc_param_type(param)}){param.name}"
 
         return signature
 
@@ -384,10 +420,10 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
             return ""
 
         first_param = parameters[0]
-        signature = f":({self._get_objc_type(first_param.type)}){first_param.name}"
+        signature = f":({self._get_objc_param_type(first_param)}){first_param.name}"
 
         for param in parameters[1:]:
-            signature += f" {param.name}:({self._get_objc_type(param.type)}){param.name}"
+            signature += f" {param.name}:({self._get_objc_param_type(param)}){param.name}"
 
         return signature
 
@@ -398,8 +434,9 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
         
         properties = []
         for param in parameters:
-            prop_attr = self._get_property_attribute(param.type)
-            objc_type = self._get_objc_type(param.type)
+            # Pointer arrays are C pointers, assigned
+            prop_attr = 'assign' if param.is_pointer else self._get_property_attribute(param.type)
+            objc_type = self._get_objc_param_type(param)
             properties.append(f"@property (nonatomic, {prop_attr}) {objc_type} {param.name};")
         
         return "\n".join(properties)
@@ -426,6 +463,8 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
     def _generate_objc_method_implementation(self, parsed_interface: ParsedFunction) -> str:
         """Generate Objective-C method implementation."""
         return_type = parsed_interface.return_type
+        if self._has_vectors(parsed_interface):
+            return self._generate_vector_bridge_call(parsed_interface)
         param_names = ", ".join(param.name for param in parsed_interface.parameters)
         bridge_call = f"{self.framework_name.lower()}Bridge::{parsed_interface.function_name}Bridge({param_names})"
 
@@ -438,6 +477,8 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
         """Generate static method implementation."""
         function_name = parsed_interface.function_name
         return_type = parsed_interface.return_type
+        if self._has_vectors(parsed_interface):
+            return self._generate_vector_bridge_call(parsed_interface)
         param_names = ", ".join(param.name for param in parsed_interface.parameters)
         
         if return_type == 'void':
@@ -445,6 +486,54 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
         else:
             return f"    return {self.framework_name.lower()}Bridge::{function_name}Bridge({param_names});"
 
+    def _generate_vector_bridge_call(self, parsed_interface: ParsedFunction) -> str:
+        """Generate the bridge call converting NSArray arguments and result from and to std::vector."""
+        return_type = parsed_interface.return_type
+        lines = []
+        arguments = []
+        for param in parsed_interface.parameters:
+            if not self._is_vector(param.type, param.is_pointer):
+                arguments.append(param.name)
+                continue
+            element_type = param.type[:-2]
+            if element_type == 'string':
+                element = "value.UTF8String"
+            else:
+                element = f"value.{_NSNUMBER_ACCESSORS[element_type]}"
+            lines += [
+                f"{self._get_value_type(param.cpp_type)} {param.name}_cpp;",
+                f"{param.name}_cpp.reserve({param.name}.count);",
+                f"for ({self._get_objc_element_type(element_type)} value in {param.name}) {{",
+                f"    {param.name}_cpp.push_back({element});",
+                "}",
+            ]
+            arguments.append(f"{param.name}_cpp")
+
+        bridge_call = (
+            f"{self.framework_name.lower()}Bridge::{parsed_interface.function_name}Bridge({', '.join(arguments)})"
+        )
+        if return_type == 'void':
+            lines.append(f"{bridge_call};")
+        elif self._is_vector(return_type, False):
+            element_type = return_type[:-2]
+            if element_type == 'string':
+                element = "@(result[i].c_str())"
+            else:
+                element = f"@(static_cast<{self._get_objc_type(element_type)}>(result[i]))"
+            lines += [
+                f"auto result = {bridge_call};",
+                f"NSMutableArray<{self._get_objc_element_type(element_type)}> *values = "
+                f"[NSMutableArray arrayWithCapacity:result.size()];",
+                "for (size_t i = 0; i < result.size(); ++i) {",
+                f"    [values addObject:{element}];",
+                "}",
+                "return values;",
+            ]
+        else:
+            lines.append(f"return {bridge_call};")
+        # The first line is indented by the method template
+        return "\n    ".join(lines)
+
     def _generate_cpp_param_conversions(self, parameters: List[Parameter]) -> str:
         """Generate C++ parameter conversions."""
         if not parameters:
@@ -468,15 +557,66 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
         else:
             return "        return result;"
 
+    def _is_vector(self, cpp_type: str, is_pointer: bool) -> bool:
+        """Check whether the type is a std::vector, bound as an NSArray."""
+        return cpp_type.endswith('[]') and not is_pointer
+
+    def _has_vectors(self, parsed_interface: ParsedFunction) -> bool:
+        """Check whether the function takes or returns a std::vector."""
+        return self._is_vector(parsed_interface.return_type, False) or any(
+            self._is_vector(param.type, param.is_pointer) for param in parsed_interface.parameters
+        )
+
+    def _get_value_type(self, declared_type: str) -> str:
+        """Get a declared C++ type without its reference and top-level const."""
+        value_type = declared_type.rstrip('&').strip()
+        if value_type.startswith('const ') and not value_type.endswith('*'):
+            value_type = value_type[len('const '):]
+        return value_type
+
+    def _get_bridge_type(self, param: Parameter) -> str:
+        """Get the C++ type of a bridge parameter: the declared type, strings as std::string."""
+        if param.cpp_type and param.type != 'string':
+            return param.cpp_type
+        return self._get_cpp_type(param.type)
+
+    def _get_bridge_return_type(self, parsed_interface: ParsedFunction) -> str:
+        """Get the C++ type returned by the bridge: the declared type by value."""
+        if parsed_interface.cpp_return_type and parsed_interface.return_type != 'string':
+            return self._get_value_type(parsed_interface.cpp_return_type)
+        return self._get_cpp_type(parsed_interface.return_type)
+
+    def _get_objc_param_type(self, param: Parameter) -> str:
+        """Get the Objective-C type of a parameter: pointer arrays are passed as C pointers."""
+        if param.type.endswith('[]') and param.is_pointer and param.cpp_type:
+            return param.cpp_type
+        return self._get_objc_type(param.type)
+
+    def _get_swift_param_type(self, param: Parameter) -> str:
+        """Get the Swift type of a parameter: pointer arrays are passed as pointers."""
+        if param.type.endswith('[]') and param.is_pointer and param.cpp_type:
+            pointee = param.cpp_type.rstrip('*').strip()
+            pointer = 'UnsafePointer' if pointee.startswith('const ') else 'UnsafeMutablePointer'
+            pointee = pointee[len('const '):] if pointee.startswith('const ') else pointee
+            element = _SWIFT_POINTEE_TYPES.get(pointee, self._get_swift_type(param.type[:-2]))
+            return f"{pointer}<{element}>"
+        return self._get_swift_type(param.type)
+
+    def _get_objc_element_type(self, element_type: str) -> str:
+        """Get the Objective-C object type of an NSArray element."""
+        return 'NSString*' if element_type == 'string' else 'NSNumber*'
+
     def _get_objc_type(self, cpp_type: str) -> str:
         """Get Objective-C type."""
+        if cpp_type.endswith('[]'):
+            return f"NSArray<{self._get_objc_element_type(cpp_type[:-2])}>*"
         objc_type_mapping = {
             'void': 'void',
             'boolean': 'BOOL',
             'byte': 'char',
             'short': 'short',
             'int': 'int',
-            'long': 'long',
+            'long': 'int64_t',
             'float': 'float',
             'double': 'double',
             'string': 'NSString*'
@@ -485,6 +625,10 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
 
     def _get_swift_type(self, cpp_type: str) -> str:
         """Get Swift type."""
+        if cpp_type == 'string[]':
+            return '[String]'
+        if cpp_type.endswith('[]'):
+            return '[NSNumber]'
         swift_type_mapping = {
             'void': 'Void',
             'boolean': 'Bool',
@@ -508,7 +652,7 @@ GCC_PREPROCESSOR_DEFINITIONS = $(inherited)"""
 
     def _get_property_attribute(self, type_name: str) -> str:
         """Get property attribute."""
-        if type_name == 'string':
+        if type_name == 'string' or type_name.endswith('[]'):
             return 'strong'
         return 'assign'
 
@@ -3,21 +3,235 @@
 Main entry point for the Multiplatform Code Generator MCP server.
 """
 
+import argparse
 import asyncio
+import os
 import sys
-from typing import Optional
+import time
+from typing import Any, Callable, Dict, List, Optional
 
+from . import tracing
 from .server import MultiplatformCodeGeneratorServer
 
+# Fallback process start for --measure-startup where the OS cannot tell
+_MODULE_LOADED_AT = time.time()
 
-async def main(args: Optional[list[str]] = None) -> None:
+# Cold start budget, in milliseconds from process start to the first
+# tools/list response, checked by --measure-startup
+COLD_START_TARGET_MS = 250.0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the MCP server."""
+    parser = argparse.ArgumentParser(
+        prog="multiplatform-code-generator",
+        description="Multiplatform Code Generator MCP Server",
+    )
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument(
+        "--daemon",
+        metavar="SOCKET",
+        help="Serve many clients as a long-lived daemon on a Unix domain socket",
+    )
+    transport.add_argument(
+        "--connect",
+        metavar="SOCKET",
+        help="Forward stdio to the daemon on SOCKET, starting it if needed",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Serve through N worker processes to use N cores (default: single process)",
+    )
+    parser.add_argument(
+        "--affinity",
+        action="store_true",
+        help="With --workers, prefer a worker by hash of cpp_interface for cache hits",
+    )
+    parser.add_argument(
+        "--max-cpu-concurrency",
+        type=int,
+        default=None,
+        help="Maximum concurrent parse/generate calls (default: CPU count, 1 per worker)",
+    )
+    parser.add_argument(
+        "--max-io-concurrency",
+        type=int,
+        default=None,
+        help="Maximum concurrent lightweight tool calls (default: 32)",
+    )
+    parser.add_argument(
+        "--tool-timeout",
+        action="append",
+        default=[],
+        metavar="TOOL=SECONDS",
+        help="Deadline for calls to a tool; 0 disables it (repeatable)",
+    )
+    parser.add_argument(
+        "--max-queue-depth",
+        type=int,
+        default=None,
+        help="Maximum summed weight of queued and running calls (default: 256)",
+    )
+    parser.add_argument(
+        "--tool-weight",
+        action="append",
+        default=[],
+        metavar="TOOL=WEIGHT",
+        help="Admission queue weight of each call to a tool (repeatable)",
+    )
+    parser.add_argument(
+        "--result-cache-size",
+        type=int,
+        default=None,
+        help="Maximum memoized tool results; 0 disables the cache (default: 256)",
+    )
+    parser.add_argument(
+        "--result-cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds a memoized tool result stays valid; 0 never expires (default: 300)",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Append request/parse/render/write spans to FILE ({pid} expands to the process id)",
+    )
+    parser.add_argument(
+        "--trace-format",
+        choices=tracing.TRACE_FORMATS,
+        default=tracing.CHROME,
+        help="Trace file format: Chrome trace-event JSON or OTLP-JSON lines (default: chrome)",
+    )
+    parser.add_argument(
+        "--measure-startup",
+        action="store_true",
+        help=f"Report the time from process start to the first tools/list response "
+             f"against the {COLD_START_TARGET_MS:.0f} ms cold start target",
+    )
+    return parser
+
+
+def process_start_time() -> float:
+    """Return the start of this process as a time.time() timestamp."""
+    try:
+        # Linux: field 22 of /proc/self/stat is the start time in clock
+        # ticks since boot; the command name before it may contain spaces
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return time.time() - uptime + start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        # Elsewhere the interpreter start is not counted
+        return _MODULE_LOADED_AT
+
+
+def _parse_tool_values(values: List[str], option: str, convert: Callable[[str], Any]) -> Dict[str, Any]:
+    """Parse repeated ``TOOL=VALUE`` options into a mapping."""
+    parsed: Dict[str, Any] = {}
+    for value in values:
+        tool_name, sep, raw = value.partition("=")
+        if not sep or not tool_name:
+            raise ValueError(f"Invalid {option} value: {value!r}, expected TOOL=VALUE")
+        parsed[tool_name] = convert(raw)
+    return parsed
+
+
+def parse_tool_timeouts(values: List[str]) -> Dict[str, Optional[float]]:
+    """Parse ``TOOL=SECONDS`` options into a timeout mapping."""
+    timeouts = _parse_tool_values(values, "--tool-timeout", float)
+    return {name: timeout if timeout > 0 else None for name, timeout in timeouts.items()}
+
+
+def parse_tool_weights(values: List[str]) -> Dict[str, int]:
+    """Parse ``TOOL=WEIGHT`` options into a weight mapping."""
+    return _parse_tool_values(values, "--tool-weight", int)
+
+
+def build_worker_args(options: argparse.Namespace) -> List[str]:
+    """Build the command line options passed on to worker processes."""
+    # Each worker is meant to occupy one core
+    worker_args = ["--max-cpu-concurrency", str(options.max_cpu_concurrency or 1)]
+    if options.max_io_concurrency:
+        worker_args += ["--max-io-concurrency", str(options.max_io_concurrency)]
+    if options.max_queue_depth:
+        worker_args += ["--max-queue-depth", str(options.max_queue_depth)]
+    for value in options.tool_timeout:
+        worker_args += ["--tool-timeout", value]
+    for value in options.tool_weight:
+        worker_args += ["--tool-weight", value]
+    if options.result_cache_size is not None:
+        worker_args += ["--result-cache-size", str(options.result_cache_size)]
+    if options.result_cache_ttl is not None:
+        worker_args += ["--result-cache-ttl", str(options.result_cache_ttl)]
+    if options.trace:
+        # One trace file per worker process
+        root, ext = os.path.splitext(options.trace)
+        trace_path = options.trace if "{pid}" in options.trace else f"{root}.{{pid}}{ext}"
+        worker_args += ["--trace", trace_path, "--trace-format", options.trace_format]
+    return worker_args
+
+
+def build_cache_options(options: argparse.Namespace) -> Dict[str, Any]:
+    """Build result cache keyword arguments from command line options."""
+    cache_options: Dict[str, Any] = {}
+    if options.result_cache_size is not None:
+        cache_options["result_cache_size"] = options.result_cache_size
+    if options.result_cache_ttl is not None:
+        cache_options["result_cache_ttl"] = options.result_cache_ttl or None
+    return cache_options
+
+
+async def main(args: Optional[List[str]] = None) -> None:
     """Main entry point for the MCP server."""
     if args is None:
         args = sys.argv[1:]
+    options = build_arg_parser().parse_args(args)
+    
+    if options.connect:
+        from .daemon import run_stdio_shim
+        
+        await run_stdio_shim(options.connect)
+        return
+    
+    if options.workers > 0:
+        from .daemon import MCPDaemon
+        from .supervisor import Supervisor
+        
+        supervisor = Supervisor(
+            "multiplatform-code-generator",
+            options.workers,
+            worker_args=build_worker_args(options),
+            affinity=options.affinity,
+        )
+        if options.measure_startup:
+            supervisor.measure_startup(process_start_time(), COLD_START_TARGET_MS)
+        if options.daemon:
+            await MCPDaemon(supervisor, options.daemon).serve_forever()
+        else:
+            await supervisor.run_stdio()
+        return
+    
+    if options.trace:
+        tracing.enable(options.trace, options.trace_format)
     
     # Create and run the MCP server
-    server = MultiplatformCodeGeneratorServer()
-    await server.run()
+    server = MultiplatformCodeGeneratorServer(
+        max_cpu_concurrency=options.max_cpu_concurrency,
+        max_io_concurrency=options.max_io_concurrency,
+        tool_timeouts=parse_tool_timeouts(options.tool_timeout),
+        max_queue_depth=options.max_queue_depth,
+        tool_weights=parse_tool_weights(options.tool_weight),
+        **build_cache_options(options),
+    )
+    if options.measure_startup:
+        server.server.measure_startup(process_start_time(), COLD_START_TARGET_MS)
+    if options.daemon:
+        await server.run_daemon(options.daemon)
+    else:
+        await server.run()
 
 
 def cli_main() -> None:
@@ -2,38 +2,150 @@
 Simplified MCP types and protocol implementation.
 """
 
-import json
+import os
 import sys
 import asyncio
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass, asdict
-from pydantic import BaseModel
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass
 
+from . import metrics, tracing
+from .request_context import DeadlineExceeded, RequestCancelled, RequestContext, bind_context
+from .utils import json_codec
+from .utils.result_cache import canonical_key
 
-class Tool(BaseModel):
+
+# Default number of I/O-bound tool calls allowed to run at the same time
+DEFAULT_IO_CONCURRENCY = 32
+
+# Default bound on the summed weight of admitted (queued or running) tool calls
+DEFAULT_MAX_QUEUE_DEPTH = 256
+
+# Bounds of the retry-after hint sent with "server busy" errors, in seconds
+MIN_RETRY_AFTER = 0.05
+MAX_RETRY_AFTER = 30.0
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+# Server-defined errors
+REQUEST_TIMEOUT = -32001
+SERVER_BUSY = -32002
+
+# Leading bytes shared by every success response; the request id follows
+_RESPONSE_PREFIX = b'{"jsonrpc":"2.0","id":'
+
+
+# Plain dataclasses rather than pydantic models: these are built on every
+# call and imported at startup, where pydantic's import cost is not worth it
+
+@dataclass
+class Tool:
     """MCP Tool definition."""
     name: str
     description: str
     inputSchema: Dict[str, Any]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the tool definition as plain data."""
+        return {"name": self.name, "description": self.description, "inputSchema": self.inputSchema}
 
-class TextContent(BaseModel):
+
+@dataclass
+class TextContent:
     """Text content for MCP responses."""
-    type: str = "text"
     text: str
+    type: str = "text"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the content as plain data."""
+        return {"type": self.type, "text": self.text}
 
 
-class CallToolResult(BaseModel):
+@dataclass
+class CallToolResult:
     """Result of a tool call."""
     content: List[TextContent]
+    # Sent as "_meta"; omitted when None
+    meta: Optional[Dict[str, Any]] = None
+    # Set when the tool reports a failure in its content
+    isError: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as plain data."""
+        result: Dict[str, Any] = {"content": [item.to_dict() for item in self.content]}
+        if self.isError:
+            result["isError"] = True
+        if self.meta is not None:
+            result["_meta"] = self.meta
+        return result
+
+
+@dataclass
+class QueueMetrics:
+    """Admission queue depth, wait time, rejection and coalescing counters."""
+    depth: int = 0
+    weighted_depth: int = 0
+    max_weighted_depth: int = 0
+    admitted: int = 0
+    rejected: int = 0
+    # Calls that joined an identical call already in flight
+    coalesced: int = 0
+    # Calls that waited for a concurrency slot; coalesced calls never do
+    waits: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    # Exponentially weighted moving average of handler run time
+    avg_service_time: float = 0.0
+
+    def record_wait(self, wait: float) -> None:
+        """Record the time a call waited for a concurrency slot."""
+        self.waits += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def record_service(self, duration: float) -> None:
+        """Record the run time of a call."""
+        if self.avg_service_time:
+            self.avg_service_time += 0.1 * (duration - self.avg_service_time)
+        else:
+            self.avg_service_time = duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics with times in milliseconds."""
+        mean_wait = self.total_wait / self.waits if self.waits else 0.0
+        return {
+            "depth": self.depth,
+            "weighted_depth": self.weighted_depth,
+            "max_weighted_depth": self.max_weighted_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "coalesced": self.coalesced,
+            "mean_wait_ms": round(mean_wait * 1000, 3),
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "avg_service_ms": round(self.avg_service_time * 1000, 3),
+        }
+
+
+@dataclass
+class _SharedCall:
+    """A tool call in flight on behalf of every caller with the same arguments."""
+    task: asyncio.Future
+    context: RequestContext
+    waiters: int = 0
 
 
 @dataclass
 class MCPRequest:
-    """MCP request message."""
+    """MCP request message (a notification when ``id`` is omitted)."""
     jsonrpc: str
-    id: Union[str, int]
     method: str
+    id: Optional[Union[str, int]] = None
     params: Optional[Dict[str, Any]] = None
 
 
@@ -41,76 +153,540 @@ class MCPRequest:
 class MCPResponse:
     """MCP response message."""
     jsonrpc: str
-    id: Union[str, int]
+    id: Optional[Union[str, int]]
     result: Optional[Dict[str, Any]] = None
     error: Optional[Dict[str, Any]] = None
 
 
+# Writer of the transport connection being served, used for notifications
+_transport_send: contextvars.ContextVar = contextvars.ContextVar(
+    "mcp_transport_send", default=None
+)
+
+_worker_state = threading.local()
+_worker_loops: List[asyncio.AbstractEventLoop] = []
+_worker_loops_lock = threading.Lock()
+
+
+def _run_in_worker_loop(handler: callable, arguments: Dict[str, Any]) -> Any:
+    """Run an async tool handler to completion on the calling worker thread."""
+    loop = getattr(_worker_state, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        _worker_state.loop = loop
+        with _worker_loops_lock:
+            _worker_loops.append(loop)
+    return loop.run_until_complete(handler(arguments))
+
+
+def _close_worker_loops() -> None:
+    """Close the event loops of worker threads that have exited."""
+    with _worker_loops_lock:
+        while _worker_loops:
+            _worker_loops.pop().close()
+
+
 class SimpleMCPServer:
     """Simplified MCP server implementation."""
     
-    def __init__(self, name: str):
-        """Initialize the server."""
+    def __init__(
+        self,
+        name: str,
+        max_cpu_concurrency: Optional[int] = None,
+        max_io_concurrency: Optional[int] = None,
+        max_queue_depth: Optional[int] = None,
+    ):
+        """
+        Initialize the server.
+        
+        Args:
+            name: Server name
+            max_cpu_concurrency: Maximum concurrent CPU-bound tool calls
+                (defaults to the number of CPUs)
+            max_io_concurrency: Maximum concurrent I/O-bound tool calls
+            max_queue_depth: Maximum summed weight of admitted tool calls;
+                calls beyond it are rejected with a "server busy" error
+        """
         self.name = name
         self.tools: List[Tool] = []
         self.tool_handlers: Dict[str, callable] = {}
+        self.cpu_bound_tools: Set[str] = set()
+        self.tool_timeouts: Dict[str, Optional[float]] = {}
+        self.tool_weights: Dict[str, int] = {}
+        self.max_queue_depth = max_queue_depth or DEFAULT_MAX_QUEUE_DEPTH
+        self.queue_metrics = QueueMetrics()
+        self.tool_metrics = metrics.ToolMetrics()
+        self.max_cpu_concurrency = max_cpu_concurrency or os.cpu_count() or 1
+        self.max_io_concurrency = max_io_concurrency or DEFAULT_IO_CONCURRENCY
+        # Created lazily so they bind to the loop that serves requests
+        self._cpu_semaphore: Optional[asyncio.Semaphore] = None
+        self._io_semaphore: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Serialized tail of the tools/list response, built on first use
+        self._tools_list_suffix: Optional[bytes] = None
+        # Running tool calls by (connection writer, request id), for
+        # notifications/cancelled; ids are only unique per connection
+        self._in_flight: Dict[Tuple[Any, Union[str, int]], Tuple[asyncio.Future, RequestContext]] = {}
+        # Wall-clock process start, set while a startup measurement is pending
+        self._startup_started_at: Optional[float] = None
+        self._startup_target_ms: Optional[float] = None
+        # Tools whose identical concurrent calls share one computation, and
+        # those computations by canonical argument hash
+        self.coalesced_tools: Set[str] = set()
+        self._shared_calls: Dict[str, _SharedCall] = {}
+        
+    def add_tool(
+        self,
+        tool: Tool,
+        handler: callable,
+        cpu_bound: bool = False,
+        timeout: Optional[float] = None,
+        weight: int = 1,
+        coalesce: bool = False,
+    ):
+        """
+        Add a tool and its handler.
         
-    def add_tool(self, tool: Tool, handler: callable):
-        """Add a tool and its handler."""
+        Args:
+            tool: Tool definition
+            handler: Async handler called with the tool arguments
+            cpu_bound: Run the handler on a worker thread under the CPU-bound
+                concurrency limit instead of on the event loop
+            timeout: Deadline in seconds for each call, or None for no deadline
+            weight: Share of the admission queue taken by each call
+            coalesce: Let concurrent calls with identical arguments share one
+                computation and result; only for handlers without side effects
+                that differ between such calls
+        """
         self.tools.append(tool)
         self.tool_handlers[tool.name] = handler
+        self.tool_timeouts[tool.name] = timeout
+        self.tool_weights[tool.name] = weight
+        self._tools_list_suffix = None
+        if cpu_bound:
+            self.cpu_bound_tools.add(tool.name)
+        else:
+            self.cpu_bound_tools.discard(tool.name)
+        if coalesce:
+            self.coalesced_tools.add(tool.name)
+        else:
+            self.coalesced_tools.discard(tool.name)
+
+    async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Call a tool handler under the concurrency limit of its kind."""
+        with tracing.span("request", tool=tool_name) as span:
+            result = await self._call_tool_handler(tool_name, arguments)
+            if result.isError:
+                span.set_attribute("error", "tool error")
+            return result
+    
+    async def _call_tool_handler(self, tool_name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Run a tool handler, on a worker thread if it is CPU-bound."""
+        handler = self.tool_handlers[tool_name]
+        queued_at = time.perf_counter()
+        
+        if tool_name in self.cpu_bound_tools:
+            if self._cpu_semaphore is None:
+                self._cpu_semaphore = asyncio.Semaphore(self.max_cpu_concurrency)
+            if self._executor is None:
+                # Headroom beyond the concurrency limit for threads that are
+                # still winding down to a checkpoint after being cancelled
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_cpu_concurrency * 2,
+                    thread_name_prefix=f"{self.name}-cpu",
+                )
+            # Run under a copy of the current context so the worker thread
+            # sees the request context and the request span
+            context = contextvars.copy_context()
+            async with self._cpu_semaphore:
+                started_at = self._record_wait(queued_at)
+                try:
+                    return await asyncio.get_event_loop().run_in_executor(
+                        self._executor,
+                        functools.partial(context.run, _run_in_worker_loop, handler, arguments),
+                    )
+                finally:
+                    self.queue_metrics.record_service(time.perf_counter() - started_at)
+        
+        if self._io_semaphore is None:
+            self._io_semaphore = asyncio.Semaphore(self.max_io_concurrency)
+        async with self._io_semaphore:
+            started_at = self._record_wait(queued_at)
+            try:
+                return await handler(arguments)
+            finally:
+                self.queue_metrics.record_service(time.perf_counter() - started_at)
+    
+    def _record_wait(self, queued_at: float) -> float:
+        """Record the queue wait of a call that got its slot; returns the time now."""
+        now = time.perf_counter()
+        self.queue_metrics.record_wait(now - queued_at)
+        return now
+    
+    def _retry_after(self, tool_name: str) -> float:
+        """Estimate the seconds until a rejected call of the tool could be admitted."""
+        queue = self.queue_metrics
+        if tool_name in self.cpu_bound_tools:
+            concurrency = self.max_cpu_concurrency
+        else:
+            concurrency = self.max_io_concurrency
+        estimate = queue.avg_service_time * max(queue.depth, 1) / concurrency
+        return min(max(estimate, MIN_RETRY_AFTER), MAX_RETRY_AFTER)
+    
+    async def handle_request(self, request_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Handle an MCP request, returning None for notifications."""
+        if isinstance(request_data, dict) and "id" not in request_data:
+            # Notifications never get a response, not even an error
+            await self._handle_single(request_data)
+            return None
+        return await self._handle_single(request_data)
+    
+    async def handle_batch(self, batch: List[Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Handle a JSON-RPC 2.0 batch request.
+        
+        The calls in the batch run concurrently. Returns the list of responses,
+        or None when the batch contains only notifications.
+        """
+        if not batch:
+            return [self._empty_batch_error()]
+        
+        responses = await asyncio.gather(*(self._handle_batch_item(item) for item in batch))
+        responses = [response for response in responses if response is not None]
+        return responses or None
     
-    async def handle_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle an MCP request."""
+    async def handle_message(self, data: bytes) -> Optional[bytes]:
+        """
+        Handle one raw transport message, a request object or a batch.
+        
+        Returns the encoded response, or None when nothing should be sent.
+        """
+        try:
+            message = json_codec.loads(data)
+        except json_codec.JSONDecodeError as e:
+            return json_codec.dumps(
+                self._create_error_response(None, f"Invalid JSON: {e}", PARSE_ERROR)
+            )
+        
+        if not isinstance(message, list):
+            response = await self._encode_request(message)
+            if (
+                self._startup_started_at is not None
+                and isinstance(message, dict)
+                and message.get("method") == "tools/list"
+            ):
+                self._report_startup()
+            return response
+        
+        if not message:
+            return json_codec.dumps([self._empty_batch_error()])
+        
+        # A batch is answered with a single array write
+        parts = await asyncio.gather(*(
+            self._encode_request(item) if isinstance(item, dict)
+            else self._encode_invalid_batch_item(item)
+            for item in message
+        ))
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            return None
+        return b"[" + b",".join(parts) + b"]"
+    
+    def measure_startup(self, started_at: float, target_ms: Optional[float] = None) -> None:
+        """
+        Report the time from process start to the first tools/list response.
+        
+        Args:
+            started_at: Process start as a time.time() timestamp
+            target_ms: Cold start target in milliseconds to compare against
+        """
+        self._startup_started_at = started_at
+        self._startup_target_ms = target_ms
+    
+    def _report_startup(self) -> None:
+        """Print the startup time once, on the first tools/list response."""
+        elapsed_ms = (time.time() - self._startup_started_at) * 1000
+        self._startup_started_at = None
+        message = f"⏱️  Startup: {elapsed_ms:.1f} ms from process start to first tools/list response"
+        if self._startup_target_ms is not None:
+            verdict = "✅ within" if elapsed_ms <= self._startup_target_ms else "⚠️  over"
+            message += f" ({verdict} {self._startup_target_ms:.0f} ms target)"
+        print(message, file=sys.stderr)
+    
+    async def _encode_request(self, request_data: Any) -> Optional[bytes]:
+        """Handle a single request object and encode its response."""
+        if (
+            isinstance(request_data, dict)
+            and request_data.get("method") == "tools/list"
+            and request_data.get("jsonrpc") == "2.0"
+            and "id" in request_data
+        ):
+            return self._tools_list_response(request_data["id"])
+        
+        response = await self.handle_request(request_data)
+        return None if response is None else json_codec.dumps(response)
+    
+    async def _encode_invalid_batch_item(self, item: Any) -> bytes:
+        """Encode the error response for a batch member that is not an object."""
+        return json_codec.dumps(await self._handle_batch_item(item))
+    
+    async def _handle_batch_item(self, item: Any) -> Optional[Dict[str, Any]]:
+        """Handle one batch member, rejecting members that are not objects."""
+        if isinstance(item, dict):
+            return await self.handle_request(item)
+        return self._create_error_response(
+            None, f"Invalid request: expected an object, got {type(item).__name__}", INVALID_REQUEST
+        )
+    
+    def _empty_batch_error(self) -> Dict[str, Any]:
+        """Create the error response for an empty batch."""
+        return self._create_error_response(None, "Invalid request: empty batch", INVALID_REQUEST)
+    
+    def _tools_list_response(self, request_id: Union[str, int]) -> bytes:
+        """Return the encoded tools/list response, serializing the tools once."""
+        if self._tools_list_suffix is None:
+            tools = json_codec.dumps({"tools": [tool.to_dict() for tool in self.tools]})
+            self._tools_list_suffix = b',"result":' + tools + b',"error":null}'
+        return _RESPONSE_PREFIX + json_codec.dumps(request_id) + self._tools_list_suffix
+    
+    async def _handle_single(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single MCP request object."""
+        request_id = request_data.get("id") if isinstance(request_data, dict) else None
         try:
             request = MCPRequest(**request_data)
             
             if request.method == "tools/list":
                 return self._create_response(request.id, {
-                    "tools": [tool.dict() for tool in self.tools]
+                    "tools": [tool.to_dict() for tool in self.tools]
                 })
             
             elif request.method == "tools/call":
                 tool_name = request.params.get("name")
                 arguments = request.params.get("arguments", {})
+                progress_token = (request.params.get("_meta") or {}).get("progressToken")
                 
                 if tool_name not in self.tool_handlers:
                     return self._create_error_response(request.id, f"Unknown tool: {tool_name}")
                 
-                try:
-                    result = await self.tool_handlers[tool_name](arguments)
-                    return self._create_response(request.id, result.dict())
-                except Exception as e:
-                    return self._create_error_response(request.id, str(e))
+                return await self._run_tool_call(request.id, tool_name, arguments, progress_token)
+            
+            elif request.method == "notifications/cancelled":
+                params = request.params or {}
+                self.cancel_request(params.get("requestId"), params.get("reason"))
+                return self._create_response(request.id, {})
             
             else:
                 return self._create_error_response(request.id, f"Unknown method: {request.method}")
                 
         except Exception as e:
-            return self._create_error_response(getattr(request, 'id', 0), f"Invalid request: {e}")
+            return self._create_error_response(request_id, f"Invalid request: {e}", INVALID_REQUEST)
+    
+    async def _run_tool_call(
+        self,
+        request_id: Optional[Union[str, int]],
+        tool_name: str,
+        arguments: Dict[str, Any],
+        progress_token: Optional[Union[str, int]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run a tool call as a cancellable task with the tool's deadline.
+        
+        Returns the response, or None if the call was cancelled by the client.
+        """
+        # Admission control: reject at once rather than queue without bound.
+        # An idle server admits any call, even one heavier than the limit.
+        weight = self.tool_weights.get(tool_name, 1)
+        queue = self.queue_metrics
+        if queue.weighted_depth + weight > self.max_queue_depth and queue.depth > 0:
+            queue.rejected += 1
+            retry_after = self._retry_after(tool_name)
+            return self._create_error_response(
+                request_id,
+                f"Server busy, retry after {retry_after:.2f}s",
+                SERVER_BUSY,
+                data={"retryAfterMs": int(retry_after * 1000)},
+            )
+        queue.admitted += 1
+        queue.depth += 1
+        queue.weighted_depth += weight
+        if queue.weighted_depth > queue.max_weighted_depth:
+            queue.max_weighted_depth = queue.weighted_depth
+        
+        timeout = self.tool_timeouts.get(tool_name)
+        send = _transport_send.get()
+        context = RequestContext(request_id, timeout, progress_token, send)
+        if tool_name in self.coalesced_tools:
+            task = asyncio.ensure_future(
+                self._join_shared_call(tool_name, arguments, timeout, progress_token, send)
+            )
+        else:
+            with bind_context(context):
+                task = asyncio.ensure_future(self._call_tool(tool_name, arguments))
+        key = (send, request_id)
+        if request_id is not None:
+            self._in_flight[key] = (task, context)
+        
+        started_at = time.perf_counter()
+        outcome = metrics.ERROR
+        try:
+            result = await asyncio.wait_for(task, timeout)
+            if not result.isError:
+                outcome = metrics.OK
+            return self._create_response(request_id, result.to_dict())
+        except (asyncio.TimeoutError, DeadlineExceeded):
+            outcome = metrics.TIMEOUT
+            # Stop a worker thread at its next checkpoint
+            context.cancel("deadline exceeded")
+            return self._create_error_response(
+                request_id, f"Tool {tool_name} timed out after {timeout}s", REQUEST_TIMEOUT
+            )
+        except (asyncio.CancelledError, RequestCancelled):
+            outcome = metrics.CANCELLED
+            if context.cancelled:
+                # Cancelled by the client, which expects no response
+                return None
+            raise
+        except Exception as e:
+            return self._create_error_response(request_id, str(e))
+        finally:
+            self.tool_metrics.record(tool_name, time.perf_counter() - started_at, outcome)
+            queue.depth -= 1
+            queue.weighted_depth -= weight
+            if request_id is not None and self._in_flight.get(key, (None,))[0] is task:
+                del self._in_flight[key]
+    
+    async def _join_shared_call(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        timeout: Optional[float],
+        progress_token: Optional[Union[str, int]],
+        send: Any,
+    ) -> CallToolResult:
+        """
+        Wait for the in-flight call with the same tool and arguments, starting
+        it if there is none.
+        
+        The shared call runs under its own context, reporting progress to the
+        caller that started it, and is cancelled only once no caller is left
+        waiting for it.
+        """
+        key = canonical_key(tool_name, arguments)
+        shared = self._shared_calls.get(key)
+        if shared is None:
+            context = RequestContext(None, timeout, progress_token, send)
+            with bind_context(context):
+                task = asyncio.ensure_future(self._call_tool(tool_name, arguments))
+            shared = _SharedCall(task, context)
+            self._shared_calls[key] = shared
+            task.add_done_callback(functools.partial(self._finish_shared_call, key, shared))
+        else:
+            self.queue_metrics.coalesced += 1
+        
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                shared.context.cancel("all callers cancelled")
+                shared.task.cancel()
+    
+    def _finish_shared_call(self, key: str, shared: _SharedCall, task: asyncio.Future) -> None:
+        """Forget a finished shared call so later calls compute afresh."""
+        if self._shared_calls.get(key) is shared:
+            del self._shared_calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller left
+            task.exception()
+    
+    def cancel_request(self, request_id: Optional[Union[str, int]], reason: Optional[str] = None) -> bool:
+        """
+        Cancel an in-flight tool call of the current connection.
+        
+        Args:
+            request_id: JSON-RPC id of the request to cancel
+            reason: Optional reason reported by the client
+            
+        Returns:
+            True if a running request was cancelled
+        """
+        entry = self._in_flight.get((_transport_send.get(), request_id))
+        if entry is None:
+            return False
+        task, context = entry
+        context.cancel(reason)
+        task.cancel()
+        return True
+    
+    def cancel_connection_requests(self, reason: Optional[str] = None) -> int:
+        """
+        Cancel every in-flight tool call of the current connection.
+        
+        Args:
+            reason: Optional cancellation reason
+            
+        Returns:
+            Number of requests cancelled
+        """
+        send = _transport_send.get()
+        request_ids = [request_id for key_send, request_id in self._in_flight if key_send is send]
+        return sum(self.cancel_request(request_id, reason) for request_id in request_ids)
     
     def _create_response(self, request_id: Union[str, int], result: Dict[str, Any]) -> Dict[str, Any]:
         """Create a success response."""
-        response = MCPResponse(jsonrpc="2.0", id=request_id, result=result)
-        return asdict(response)
+        # vars() instead of asdict(): the result is already plain data, so
+        # the recursive deep copy made by asdict() is wasted work
+        return vars(MCPResponse(jsonrpc="2.0", id=request_id, result=result))
     
-    def _create_error_response(self, request_id: Union[str, int], error_message: str) -> Dict[str, Any]:
+    def _create_error_response(
+        self,
+        request_id: Optional[Union[str, int]],
+        error_message: str,
+        code: int = -1,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
         """Create an error response."""
+        error = {"code": code, "message": error_message}
+        if data is not None:
+            error["data"] = data
         response = MCPResponse(
             jsonrpc="2.0", 
             id=request_id, 
-            error={"code": -1, "message": error_message}
+            error=error
         )
-        return asdict(response)
+        return vars(response)
+    
+    @staticmethod
+    def _write_stdout(message: bytes) -> None:
+        """Write one message line to stdout."""
+        stdout = sys.stdout.buffer
+        stdout.write(message + b"\n")
+        stdout.flush()
+    
+    async def _process_line(self, line: bytes) -> None:
+        """Handle one request line and write its response to stdout."""
+        response = await self.handle_message(line)
+        if response is None:
+            return
+        
+        # Responses are written as soon as they complete; clients match
+        # them to requests by JSON-RPC id
+        self._write_stdout(response)
     
     async def run_stdio(self):
         """Run the server using stdio transport."""
         print(f"🚀 {self.name} MCP server started on stdio", file=sys.stderr)
         
+        loop = asyncio.get_event_loop()
+        in_flight: Set[asyncio.Future] = set()
+        # Request tasks inherit the writer for their notifications
+        _transport_send.set(self._write_stdout)
+        
         try:
             while True:
                 # Read request from stdin
-                line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+                line = await loop.run_in_executor(None, sys.stdin.buffer.readline)
                 if not line:
                     break
                 
@@ -118,18 +694,25 @@ class SimpleMCPServer:
                 if not line:
                     continue
                 
-                try:
-                    request_data = json.loads(line)
-                    response = await self.handle_request(request_data)
-                    
-                    # Write response to stdout
-                    print(json.dumps(response), flush=True)
-                    
-                except json.JSONDecodeError as e:
-                    error_response = self._create_error_response(0, f"Invalid JSON: {e}")
-                    print(json.dumps(error_response), flush=True)
+                # Dispatch concurrently so a slow call does not block the
+                # requests queued behind it
+                task = asyncio.ensure_future(self._process_line(line))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            
+            # Let in-flight requests finish before shutting down
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
                 
         except KeyboardInterrupt:
             pass
         finally:
+            self.close()
             print("🛑 MCP server stopped", file=sys.stderr)
+    
+    def close(self) -> None:
+        """Wait for worker threads to finish and release them."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            _close_worker_loops()
@@ -0,0 +1,122 @@
+"""
+Server Metrics
+
+Per-tool call counters and latency histograms. Recording a call is a
+bisect over fixed bucket bounds and a few integer increments on the event
+loop thread, cheap enough to leave on all the time.
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+# Histogram bucket upper bounds in seconds: 10 µs to about 10 min, each
+# bucket 2^(1/4) (~19%) wider than the previous, so percentiles are
+# reported within ~19% of the true latency
+_BUCKET_BOUNDS: List[float] = [1e-5 * 2 ** (i / 4) for i in range(4 * 26)]
+
+# Outcomes of a tool call
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+CANCELLED = "cancelled"
+
+
+class LatencyHistogram:
+    """Latency histogram with logarithmic buckets."""
+
+    def __init__(self):
+        # One count per bucket plus an overflow bucket
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one latency."""
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.99 for p99
+
+        Returns:
+            Upper bound in seconds of the bucket holding the percentile,
+            capped at the largest recorded latency
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS[index] if index < len(_BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+
+@dataclass
+class ToolStats:
+    """Call counters and latencies of one tool."""
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    cancelled: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats with latencies in milliseconds."""
+        latency = self.latency
+        mean = latency.total / latency.count if latency.count else 0.0
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "mean_ms": round(mean * 1000, 3),
+            "p50_ms": round(latency.percentile(0.50) * 1000, 3),
+            "p95_ms": round(latency.percentile(0.95) * 1000, 3),
+            "p99_ms": round(latency.percentile(0.99) * 1000, 3),
+            "max_ms": round(latency.max * 1000, 3),
+        }
+
+
+class ToolMetrics:
+    """Stats of every tool, recorded as calls finish."""
+
+    def __init__(self):
+        self.tools: Dict[str, ToolStats] = {}
+
+    def record(self, tool_name: str, seconds: float, outcome: str = OK) -> None:
+        """
+        Record a finished call.
+
+        Args:
+            tool_name: Name of the tool
+            seconds: Time from admission to completion
+            outcome: OK, ERROR, TIMEOUT or CANCELLED
+        """
+        stats = self.tools.get(tool_name)
+        if stats is None:
+            stats = self.tools[tool_name] = ToolStats()
+        stats.calls += 1
+        stats.latency.record(seconds)
+        if outcome == ERROR:
+            stats.errors += 1
+        elif outcome == TIMEOUT:
+            stats.timeouts += 1
+        elif outcome == CANCELLED:
+            stats.cancelled += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the stats of each tool."""
+        return {name: stats.to_dict() for name, stats in self.tools.items()}
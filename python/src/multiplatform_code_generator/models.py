@@ -0,0 +1,77 @@
+"""
+Request models for the Multiplatform Code Generator tools.
+
+The models are dataclasses derived from the tool schemas in schemas.py, so
+the published input schema, the validation and the model fields cannot
+drift apart.
+"""
+
+import dataclasses
+from typing import Any, Dict, List, Optional
+
+from .schemas import GENERATE_MULTIPLATFORM_CODE_SCHEMA, PARSE_CPP_INTERFACE_SCHEMA
+from .validation import compile_schema
+
+
+# Python type of each JSON schema type, used for the model annotations
+_FIELD_TYPES = {
+    "object": Dict[str, Any],
+    "array": List[Any],
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+}
+
+
+def model_from_schema(name: str, schema: Dict[str, Any], doc: str) -> type:
+    """
+    Build a request dataclass from an object schema.
+
+    Required properties become required fields and the others default to
+    None. The class gets a ``from_arguments`` constructor that validates
+    the arguments with a validator compiled once for the schema.
+
+    Args:
+        name: Class name
+        schema: JSON schema of the tool arguments
+        doc: Class docstring
+
+    Returns:
+        The dataclass
+    """
+    required = schema.get("required", [])
+    fields = []
+    for field_name, field_schema in schema["properties"].items():
+        field_type = _FIELD_TYPES.get(field_schema.get("type"), Any)
+        if field_name in required:
+            fields.append((field_name, field_type))
+        else:
+            fields.append((field_name, Optional[field_type], dataclasses.field(default=None)))
+    # Required fields must precede those with defaults
+    fields.sort(key=lambda field: len(field) == 3)
+
+    validate = compile_schema(schema)
+    names = [field[0] for field in fields]
+
+    def from_arguments(cls, arguments: Dict[str, Any]) -> Any:
+        """Validate tool arguments and build the request; unknown keys are ignored."""
+        validate(arguments)
+        return cls(**{key: arguments[key] for key in names if key in arguments})
+
+    return dataclasses.make_dataclass(
+        name, fields, namespace={"__doc__": doc, "from_arguments": classmethod(from_arguments)}
+    )
+
+
+GenerateMultiplatformCodeRequest = model_from_schema(
+    "GenerateMultiplatformCodeRequest",
+    GENERATE_MULTIPLATFORM_CODE_SCHEMA,
+    "Request model for generate_multiplatform_code tool.",
+)
+
+ParseCppInterfaceRequest = model_from_schema(
+    "ParseCppInterfaceRequest",
+    PARSE_CPP_INTERFACE_SCHEMA,
+    "Request model for parse_cpp_interface tool.",
+)
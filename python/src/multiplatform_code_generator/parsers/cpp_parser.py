@@ -6,7 +6,17 @@ Parses C++ function declarations and extracts function information.
 
 import re
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+
+
+# Element types of array parameters (``T*`` with a length, ``std::vector<T>``)
+ARRAY_ELEMENT_TYPES = ['boolean', 'byte', 'short', 'int', 'long', 'float', 'double']
+
+# Names of the integer parameter following a pointer that passes its length
+_LENGTH_NAMES = {'n', 'len', 'length', 'size', 'count', 'num'}
+
+# Suffixes of a length parameter named after its array: data_len, dataCount
+_LENGTH_SUFFIXES = ['len', 'length', 'size', 'count']
 
 
 @dataclass
@@ -18,6 +28,10 @@ class Parameter:
     is_pointer: bool = False
     is_reference: bool = False
     default_value: Optional[str] = None
+    # Name of the parameter passing the element count of an array parameter
+    length_param: Optional[str] = None
+    # Type as declared in C++, e.g. const std::vector<float>&
+    cpp_type: str = ""
 
 
 @dataclass
@@ -31,6 +45,42 @@ class ParsedFunction:
     is_virtual: bool = False
     is_const: bool = False
     original_code: str = ""
+    # Return type as declared in C++, e.g. std::vector<float>
+    cpp_return_type: str = ""
+
+
+@dataclass
+class ParsedClass:
+    """Represents a parsed C++ class with its public constructors and methods."""
+    class_name: str
+    # Constructors are functions named after the class returning void
+    constructors: List[ParsedFunction]
+    methods: List[ParsedFunction]
+    namespace: Optional[str] = None
+    original_code: str = ""
+
+
+# Start of a class or struct definition, not an enum class
+_CLASS_REGEX = re.compile(
+    r'(?<!enum )\b(class|struct)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:final\s*)?(?::[^{;]*)?\{'
+)
+
+# Free function declaration or definition
+_FUNCTION_REGEX = re.compile(
+    r'(?:(static|virtual|inline)\s+)?'
+    r'(?:(static|virtual|inline)\s+)?'
+    r'([a-zA-Z_][a-zA-Z0-9_:*&<>\s]*)\s+'
+    r'([a-zA-Z_][a-zA-Z0-9_]*)\s*'
+    r'\(([^)]*)\)\s*'
+    r'(?:(const)\s*)?'
+    r'(?:;|{)'
+)
+
+# Access specifier at the start of a member declaration
+_ACCESS_REGEX = re.compile(r'^(public|protected|private)\s*:\s*')
+
+# Specifiers of a member declaration that do not change its binding
+_MEMBER_SPECIFIER_REGEX = re.compile(r'\b(explicit|inline|constexpr|virtual)\s+')
 
 
 class CppInterfaceParser:
@@ -56,7 +106,18 @@ class CppInterfaceParser:
             'char*': 'string',
             'const char*': 'string',
             'std::string': 'string',
-            'string': 'string'
+            'string': 'string',
+            'std::string_view': 'string',
+            'string_view': 'string',
+            'int8_t': 'byte',
+            'uint8_t': 'byte',
+            'int16_t': 'short',
+            'uint16_t': 'short',
+            'int32_t': 'int',
+            'uint32_t': 'int',
+            'int64_t': 'long',
+            'uint64_t': 'long',
+            'size_t': 'long'
         }
 
     def parse(self, cpp_code: str) -> ParsedFunction:
@@ -79,8 +140,9 @@ class CppInterfaceParser:
             # Extract namespace
             namespace = self._extract_namespace(clean_code)
             
-            # Extract function information
-            function_info = self._extract_function_info(clean_code)
+            # Extract function information, skipping the members of helper
+            # classes declared next to the function
+            function_info = self._extract_function_info(self._strip_class_definitions(clean_code))
             
             return ParsedFunction(
                 function_name=function_info["name"],
@@ -90,11 +152,173 @@ class CppInterfaceParser:
                 is_static=function_info["is_static"],
                 is_virtual=function_info["is_virtual"],
                 is_const=function_info["is_const"],
-                original_code=cpp_code.strip()
+                original_code=cpp_code.strip(),
+                cpp_return_type=function_info["cpp_return_type"]
             )
         except Exception as e:
             raise ValueError(f"Failed to parse C++ interface: {e}")
 
+    def is_class_declaration(self, cpp_code: str) -> bool:
+        """
+        Check whether the code declares a class or struct to bind rather than a function.
+
+        A class or struct declared next to a free function, such as a
+        parameter type, is not bound itself: the function is.
+        """
+        clean_code = self._clean_code(cpp_code)
+        if _CLASS_REGEX.search(clean_code) is None:
+            return False
+        return _FUNCTION_REGEX.search(self._strip_class_definitions(clean_code)) is None
+
+    def parse_class(self, cpp_code: str) -> ParsedClass:
+        """
+        Parse a C++ class declaration.
+
+        Public constructors and methods are kept. Destructors, operators,
+        deleted members, copy and move constructors, templates and member
+        variables are skipped. A class declaring no constructor gets its
+        implicit default constructor.
+
+        Args:
+            cpp_code: C++ class code
+
+        Returns:
+            ParsedClass: Parsed class information
+
+        Raises:
+            ValueError: If parsing fails
+        """
+        try:
+            clean_code = self._clean_code(cpp_code)
+            match = _CLASS_REGEX.search(clean_code)
+            if not match:
+                raise ValueError('Could not find a class declaration')
+            kind, class_name = match.groups()
+
+            constructors: List[ParsedFunction] = []
+            methods: List[ParsedFunction] = []
+            declares_constructor = False
+            access = 'public' if kind == 'struct' else 'private'
+            for member in self._split_members(clean_code, match.end()):
+                access_match = _ACCESS_REGEX.match(member)
+                while access_match:
+                    access = access_match.group(1)
+                    member = member[access_match.end():]
+                    access_match = _ACCESS_REGEX.match(member)
+                parsed_member = self._parse_member(member, class_name)
+                if parsed_member is None:
+                    continue
+                function, bindable = parsed_member
+                is_constructor = function.function_name == class_name
+                declares_constructor = declares_constructor or is_constructor
+                if access != 'public' or not bindable:
+                    continue
+                if is_constructor:
+                    constructors.append(function)
+                else:
+                    methods.append(function)
+
+            if not declares_constructor:
+                constructors.append(ParsedFunction(function_name=class_name, return_type='void', parameters=[]))
+            if not constructors:
+                raise ValueError(f'Class {class_name} has no public constructor')
+
+            return ParsedClass(
+                class_name=class_name,
+                constructors=constructors,
+                methods=methods,
+                namespace=self._extract_namespace(clean_code),
+                original_code=cpp_code.strip()
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to parse C++ class: {e}")
+
+    def _split_members(self, code: str, body_start: int) -> List[str]:
+        """Split a class body into member declarations, inline bodies dropped."""
+        members = []
+        current = ''
+        depth = 0
+        for char in code[body_start:]:
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                if depth == 0:
+                    break
+                depth -= 1
+                if depth == 0:
+                    # End of an inline definition
+                    members.append(current.strip())
+                    current = ''
+            elif depth == 0:
+                if char == ';':
+                    members.append(current.strip())
+                    current = ''
+                else:
+                    current += char
+        return [member for member in members if member]
+
+    def _parse_member(self, member: str, class_name: str) -> Optional[Tuple[ParsedFunction, bool]]:
+        """
+        Parse a member function declaration.
+
+        Returns:
+            The function and whether it can be bound, or None for members
+            other than constructors and methods. Deleted, copy and move
+            constructors are returned as not bindable, as they still
+            suppress the implicit default constructor.
+        """
+        open_paren = member.find('(')
+        if open_paren < 0 or re.match(r'^(friend|using|typedef|template)\b', member):
+            return None
+        depth = 0
+        close_paren = -1
+        for index in range(open_paren, len(member)):
+            if member[index] == '(':
+                depth += 1
+            elif member[index] == ')':
+                depth -= 1
+                if depth == 0:
+                    close_paren = index
+                    break
+        if close_paren < 0:
+            return None
+
+        head = member[:open_paren].strip()
+        is_virtual = 'virtual' in head.split()
+        head = _MEMBER_SPECIFIER_REGEX.sub('', head)
+        is_static = head.startswith('static ')
+        if is_static:
+            head = head[len('static '):].strip()
+        name_match = re.match(r'^(.*?)([~a-zA-Z_][a-zA-Z0-9_]*)$', head)
+        # Destructors and operators are not bound
+        if not name_match or 'operator' in head or name_match.group(2).startswith('~'):
+            return None
+        return_type, name = name_match.group(1).strip(), name_match.group(2)
+        if name != class_name and not return_type:
+            return None
+
+        param_str = member[open_paren + 1:close_paren].strip()
+        tail = member[close_paren + 1:].strip()
+        parameters = self._parse_parameters(param_str) if param_str != 'void' else []
+        bindable = not re.search(r'=\s*delete\b', tail)
+        if name == class_name:
+            return_type = 'void'
+            # Copy and move constructors
+            if len(parameters) == 1 and re.search(rf'\b{class_name}\b', param_str):
+                bindable = False
+
+        function = ParsedFunction(
+            function_name=name,
+            return_type=self._normalize_type(return_type),
+            parameters=parameters,
+            is_static=is_static,
+            is_virtual=is_virtual,
+            is_const=tail.startswith('const'),
+            original_code=member,
+            cpp_return_type=self._clean_type(return_type)
+        )
+        return function, bindable
+
     def _clean_code(self, code: str) -> str:
         """Clean the code by removing comments and extra whitespace."""
         # Remove single-line comments
@@ -105,6 +329,28 @@ class CppInterfaceParser:
         code = re.sub(r'\s+', ' ', code).strip()
         return code
 
+    def _strip_class_definitions(self, code: str) -> str:
+        """Remove class and struct definitions, bodies included, from cleaned code."""
+        parts = []
+        position = 0
+        match = _CLASS_REGEX.search(code)
+        while match:
+            parts.append(code[position:match.start()])
+            depth = 1
+            position = match.end()
+            while position < len(code) and depth:
+                if code[position] == '{':
+                    depth += 1
+                elif code[position] == '}':
+                    depth -= 1
+                position += 1
+            # Variables declared with the definition and its semicolon
+            end = code.find(';', position)
+            position = len(code) if end < 0 else end + 1
+            match = _CLASS_REGEX.search(code, position)
+        parts.append(code[position:])
+        return ''.join(parts)
+
     def _extract_namespace(self, code: str) -> Optional[str]:
         """Extract namespace from code."""
         namespace_match = re.search(r'namespace\s+([a-zA-Z_][a-zA-Z0-9_]*)', code)
@@ -113,17 +359,7 @@ class CppInterfaceParser:
     def _extract_function_info(self, code: str) -> Dict[str, Any]:
         """Extract function information from code."""
         # Match function declaration
-        function_regex = (
-            r'(?:(static|virtual|inline)\s+)?'
-            r'(?:(static|virtual|inline)\s+)?'
-            r'([a-zA-Z_][a-zA-Z0-9_:*&<>\s]*)\s+'
-            r'([a-zA-Z_][a-zA-Z0-9_]*)\s*'
-            r'\(([^)]*)\)\s*'
-            r'(?:(const)\s*)?'
-            r'(?:;|{)'
-        )
-        
-        match = re.search(function_regex, code)
+        match = _FUNCTION_REGEX.search(code)
         if not match:
             raise ValueError('Could not parse function declaration')
 
@@ -141,6 +377,7 @@ class CppInterfaceParser:
         return {
             "name": function_name,
             "return_type": self._normalize_type(return_type.strip()),
+            "cpp_return_type": self._clean_type(return_type),
             "parameters": parameters,
             "is_static": is_static,
             "is_virtual": is_virtual,
@@ -160,8 +397,25 @@ class CppInterfaceParser:
             if param_info:
                 parameters.append(param_info)
 
+        # A pointer array followed by an integer named like a length is
+        # bound as one array, the length taken from the array
+        for param, following in zip(parameters, parameters[1:]):
+            if (param.is_pointer and param.type.endswith('[]')
+                    and following.type in ('int', 'long') and not following.is_pointer
+                    and self._is_length_name(following.name, param.name)):
+                param.length_param = following.name
+
         return parameters
 
+    def _is_length_name(self, name: str, array_name: str) -> bool:
+        """Check whether an integer parameter is named as the length of the array before it."""
+        if name.lower() in _LENGTH_NAMES:
+            return True
+        return any(
+            name in (f"{array_name}_{suffix}", f"{array_name}{suffix.capitalize()}")
+            for suffix in _LENGTH_SUFFIXES
+        )
+
     def _split_parameters(self, param_str: str) -> List[str]:
         """Split parameter string handling templates and nested structures."""
         params = []
@@ -218,21 +472,33 @@ class CppInterfaceParser:
                     is_const=False,
                     is_pointer=False,
                     is_reference=False,
-                    default_value=None
+                    default_value=None,
+                    cpp_type=self._clean_type(simple_match.group(1))
                 )
             return None
 
         const_modifier, base_type, ptr_ref, name, default_value = match.groups()
 
+        param_type = self._normalize_type((base_type + (ptr_ref or '')).strip())
+        if ptr_ref == '*' and param_type in ARRAY_ELEMENT_TYPES:
+            # Pointer to primitives: an array of them
+            param_type = f"{param_type}[]"
+
         return Parameter(
-            type=self._normalize_type((base_type + (ptr_ref or '')).strip()),
+            type=param_type,
             name=name or f"param_{id(param) % 10000}",
             is_const=bool(const_modifier),
             is_pointer=ptr_ref == '*',
             is_reference=ptr_ref == '&',
-            default_value=default_value.strip() if default_value else None
+            default_value=default_value.strip() if default_value else None,
+            cpp_type=self._clean_type(f"{'const ' if const_modifier else ''}{base_type}{ptr_ref or ''}")
         )
 
+    def _clean_type(self, type_name: str) -> str:
+        """Get a declared type with single spaces and none before * or &."""
+        type_name = re.sub(r'\s+', ' ', type_name).strip()
+        return re.sub(r'\s+([*&])', r'\1', type_name)
+
     def _normalize_type(self, type_name: str) -> str:
         """Normalize type name."""
         # Remove extra whitespace
@@ -248,11 +514,22 @@ class CppInterfaceParser:
             if base_type in self.type_mapping:
                 return self.type_mapping[base_type]
 
+        # Handle reference types, bound to the referenced type
+        if type_name.endswith('&'):
+            return self._normalize_type(type_name[:-1].strip())
+
         # Handle const types
         if type_name.startswith('const '):
             base_type = type_name[6:].strip()
             return self._normalize_type(base_type)
 
+        # Handle vectors of primitives and of owned strings as arrays
+        vector_match = re.match(r'^(?:std::)?vector\s*<\s*(.+?)\s*>$', type_name)
+        if vector_match:
+            element_type = self._normalize_type(vector_match.group(1))
+            if element_type in ARRAY_ELEMENT_TYPES or vector_match.group(1) in ('std::string', 'string'):
+                return f"{element_type}[]"
+
         # Handle std:: namespace
         if type_name.startswith('std::'):
             base_type = type_name[5:]
@@ -0,0 +1,139 @@
+"""
+Request context for in-flight MCP tool calls.
+
+Carries the cancellation state, deadline and progress reporting of the request
+being served so long-running tool handlers can stop cooperatively at
+checkpoints and report progress, including handlers that run on worker threads.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Union
+
+from .utils import json_codec
+
+
+# Minimum seconds between two progress notifications of the same request
+PROGRESS_INTERVAL = 0.1
+
+
+class RequestCancelled(BaseException):
+    """
+    Raised at a checkpoint when the current request was cancelled.
+    
+    Derives from BaseException, like asyncio.CancelledError, so the generic
+    ``except Exception`` error reporting in tool handlers does not swallow it.
+    """
+
+
+class DeadlineExceeded(RequestCancelled):
+    """Raised at a checkpoint when the current request ran past its deadline."""
+
+
+class RequestContext:
+    """Cancellation state and deadline of a single request."""
+
+    def __init__(
+        self,
+        request_id: Union[str, int],
+        timeout: Optional[float] = None,
+        progress_token: Optional[Union[str, int]] = None,
+        send: Optional[Callable[[bytes], None]] = None,
+    ):
+        """
+        Initialize the context.
+        
+        Args:
+            request_id: JSON-RPC id of the request
+            timeout: Seconds the request may run, or None for no deadline
+            progress_token: Client token for progress notifications, if requested
+            send: Transport writer used for notifications; called on the
+                event loop that creates the context
+        """
+        self.request_id = request_id
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.cancel_reason: Optional[str] = None
+        self.cancelled = False
+        self.progress_token = progress_token if send is not None else None
+        self._send = send
+        self._loop = asyncio.get_event_loop() if self.progress_token is not None else None
+        self._last_progress = 0.0
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Mark the request as cancelled; the handler stops at its next checkpoint."""
+        self.cancel_reason = reason
+        self.cancelled = True
+
+    def checkpoint(self) -> None:
+        """
+        Stop the request if it was cancelled or its deadline has passed.
+        
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+            RequestCancelled: If the request was cancelled
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise DeadlineExceeded(f"Request {self.request_id} exceeded its deadline")
+        if self.cancelled:
+            raise RequestCancelled(self.cancel_reason or f"Request {self.request_id} was cancelled")
+
+    def report_progress(self, progress: float, total: Optional[float] = None) -> None:
+        """
+        Send a progress notification if the client asked for them.
+        
+        Rate limited to one notification per PROGRESS_INTERVAL, except that
+        completion (``progress == total``) is always reported. Safe to call
+        from worker threads.
+        """
+        if self.progress_token is None:
+            return
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_INTERVAL and progress != total:
+            return
+        self._last_progress = now
+        
+        params: Dict[str, Any] = {"progressToken": self.progress_token, "progress": progress}
+        if total is not None:
+            params["total"] = total
+        message = json_codec.dumps(
+            {"jsonrpc": "2.0", "method": "notifications/progress", "params": params}
+        )
+        # Always write from the loop thread so notifications are ordered
+        # before the response, which is also written from that thread
+        self._loop.call_soon_threadsafe(self._send, message)
+
+
+_current_context: contextvars.ContextVar = contextvars.ContextVar(
+    "mcp_request_context", default=None
+)
+
+
+def current_context() -> Optional[RequestContext]:
+    """Return the context of the request being served, if any."""
+    return _current_context.get()
+
+
+def checkpoint() -> None:
+    """Cooperative cancellation point; a no-op outside of a request."""
+    context = _current_context.get()
+    if context is not None:
+        context.checkpoint()
+
+
+def report_progress(progress: float, total: Optional[float] = None) -> None:
+    """Report progress of the current request; a no-op outside of a request."""
+    context = _current_context.get()
+    if context is not None:
+        context.report_progress(progress, total)
+
+
+@contextlib.contextmanager
+def bind_context(context: RequestContext) -> Iterator[RequestContext]:
+    """Make ``context`` current; tasks created inside the block inherit it."""
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
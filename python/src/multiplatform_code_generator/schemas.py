@@ -0,0 +1,201 @@
+"""
+Tool Schemas
+
+JSON schemas of the tool arguments. They are the single source for the
+input schemas published by tools/list, the compiled argument validators and
+the request models.
+"""
+
+from typing import Any, Dict
+
+
+SUPPORTED_PLATFORMS = ["android", "ios", "harmony"]
+
+GENERATE_MULTIPLATFORM_CODE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "cpp_interface": {
+            "type": "string",
+            "description": "C++ interface function code, or a class declaration "
+                           "(android only) bound as a wrapper owning a native instance"
+        },
+        "output_directory": {
+            "type": "string",
+            "description": "Base output directory for generated files"
+        },
+        "platforms": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": SUPPORTED_PLATFORMS
+            },
+            "description": "Target platforms to generate code for"
+        },
+        "android_config": {
+            "type": "object",
+            "properties": {
+                "package_name": {
+                    "type": "string",
+                    "description": "Java/Kotlin package name for Android"
+                },
+                "class_name": {
+                    "type": "string",
+                    "description": "Java/Kotlin class name for Android"
+                },
+                "language": {
+                    "type": "string",
+                    "enum": ["java", "kotlin"],
+                    "description": "Programming language for Android wrapper"
+                },
+                "registration": {
+                    "type": "string",
+                    "enum": ["static", "dynamic"],
+                    "description": "Native method binding: exported Java_ symbols (static, "
+                                   "default) or RegisterNatives in JNI_OnLoad with hidden "
+                                   "symbols (dynamic)"
+                },
+                "native_annotation": {
+                    "type": "string",
+                    "enum": ["none", "fast", "critical"],
+                    "description": "Annotate the native method with @FastNative or "
+                                   "@CriticalNative when it takes and returns only "
+                                   "primitives; critical needs dynamic registration and "
+                                   "otherwise falls back to fast"
+                },
+                "string_buffer_size": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Bytes of a string argument copied into a stack buffer "
+                                   "before falling back to the heap (default 256)"
+                },
+                "benchmark": {
+                    "type": "boolean",
+                    "description": "Also generate an instrumented microbenchmark reporting "
+                                   "calls per second"
+                },
+                "benchmark_module": {
+                    "type": "boolean",
+                    "description": "Also generate a Jetpack Microbenchmark module with a "
+                                   "benchmark per bound function and a baseline no-op "
+                                   "native call"
+                },
+                "stress_test": {
+                    "type": "boolean",
+                    "description": "Also generate an instrumented test passing "
+                                   "100 000-element collections to the function, for "
+                                   "functions taking arrays or std::vector"
+                },
+                "array_binding": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "string",
+                        "enum": ["array", "direct_buffer"]
+                    },
+                    "description": "Binding of each array parameter (T* with a length, "
+                                   "std::vector<T>) by name: a primitive array pinned with "
+                                   "GetPrimitiveArrayCritical (array, default) or a direct "
+                                   "ByteBuffer accessed in place (direct_buffer)"
+                },
+                "batch": {
+                    "type": "boolean",
+                    "description": "Also generate <function>Batch over primitive arrays, "
+                                   "calling the function for every element in one native "
+                                   "call; only for functions of primitives"
+                },
+                "async_wrappers": {
+                    "type": "boolean",
+                    "description": "Also generate <function>Async running the call on a "
+                                   "bounded native thread pool: a suspend function in "
+                                   "Kotlin, a CompletableFuture in Java"
+                },
+                "native_thread_pool_size": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Threads of the pool running async wrappers (default: "
+                                   "the number of CPUs)"
+                }
+            },
+            "description": "Android-specific configuration"
+        },
+        "ios_config": {
+            "type": "object",
+            "properties": {
+                "class_prefix": {
+                    "type": "string",
+                    "description": "Objective-C class prefix"
+                },
+                "framework_name": {
+                    "type": "string",
+                    "description": "iOS framework name"
+                }
+            },
+            "description": "iOS-specific configuration"
+        },
+        "harmony_config": {
+            "type": "object",
+            "properties": {
+                "module_name": {
+                    "type": "string",
+                    "description": "HarmonyOS module name"
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": "NAPI namespace"
+                },
+                "batch": {
+                    "type": "boolean",
+                    "description": "Also generate <function>Batch over typed arrays, "
+                                   "calling the function for every element in one native "
+                                   "call, with a benchmark; only for functions of primitives"
+                }
+            },
+            "description": "HarmonyOS-specific configuration"
+        },
+        "include_timings": {
+            "type": "boolean",
+            "description": "Add a per-stage timing breakdown to result._meta.timings"
+        }
+    },
+    "required": ["cpp_interface", "output_directory", "platforms"],
+    # The Android wrapper cannot be generated without its package and class
+    "if": {
+        "properties": {"platforms": {"contains": {"const": "android"}}},
+        "description": "when targeting android"
+    },
+    "then": {
+        "properties": {
+            "android_config": {"required": ["package_name", "class_name"]}
+        },
+        "required": ["android_config"]
+    }
+}
+
+PARSE_CPP_INTERFACE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "cpp_interface": {
+            "type": "string",
+            "description": "C++ interface function code to parse"
+        }
+    },
+    "required": ["cpp_interface"]
+}
+
+LIST_SUPPORTED_PLATFORMS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+GET_SERVER_STATS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
+TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "generate_multiplatform_code": GENERATE_MULTIPLATFORM_CODE_SCHEMA,
+    "parse_cpp_interface": PARSE_CPP_INTERFACE_SCHEMA,
+    "list_supported_platforms": LIST_SUPPORTED_PLATFORMS_SCHEMA,
+    "get_server_stats": GET_SERVER_STATS_SCHEMA,
+}
@@ -2,48 +2,141 @@
 MCP Server implementation for the Multiplatform Code Generator.
 """
 
+import functools
+import json
 import logging
-from typing import Any, Dict, List, Optional
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
+from . import tracing
 from .mcp_types import SimpleMCPServer, Tool, TextContent, CallToolResult
-from pydantic import BaseModel, Field
+from .request_context import checkpoint, report_progress
+from .parsers.cpp_parser import CppInterfaceParser, ParsedClass, ParsedFunction
+from .schemas import (
+    GENERATE_MULTIPLATFORM_CODE_SCHEMA,
+    GET_SERVER_STATS_SCHEMA,
+    LIST_SUPPORTED_PLATFORMS_SCHEMA,
+    PARSE_CPP_INTERFACE_SCHEMA,
+)
+from .utils.result_cache import ResultCache, canonical_key
 
-from .parsers.cpp_parser import CppInterfaceParser
-from .generators.android_jni import AndroidJniGenerator
-from .generators.ios_oc import IosOcGenerator  
-from .generators.harmony_napi import HarmonyNapiGenerator
-from .utils.file_manager import FileManager
+if TYPE_CHECKING:
+    from .daemon import MCPDaemon
+    from .models import GenerateMultiplatformCodeRequest
+    from .utils.file_manager import FileManager
 
 
-# Request/Response models
-class GenerateMultiplatformCodeRequest(BaseModel):
-    """Request model for generate_multiplatform_code tool."""
-    cpp_interface: str = Field(description="C++ interface function code")
-    output_directory: str = Field(description="Base output directory for generated files")
-    platforms: List[str] = Field(description="Target platforms to generate code for")
-    android_config: Optional[Dict[str, Any]] = Field(
-        default=None, description="Android-specific configuration"
-    )
-    ios_config: Optional[Dict[str, Any]] = Field(
-        default=None, description="iOS-specific configuration"
-    )
-    harmony_config: Optional[Dict[str, Any]] = Field(
-        default=None, description="HarmonyOS-specific configuration"
-    )
+# Number of parsed interfaces kept warm across requests and clients
+PARSE_CACHE_SIZE = 256
 
+# Default size and time to live (seconds) of the tool result cache
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL = 300.0
 
-class ParseCppInterfaceRequest(BaseModel):
-    """Request model for parse_cpp_interface tool."""
-    cpp_interface: str = Field(description="C++ interface function code to parse")
+# Default per-call deadlines in seconds; None disables the deadline
+DEFAULT_TOOL_TIMEOUTS: Dict[str, Optional[float]] = {
+    "generate_multiplatform_code": 300.0,
+    "parse_cpp_interface": 30.0,
+    "list_supported_platforms": None,
+    "get_server_stats": None,
+}
+
+# Default share of the admission queue taken by one call of each tool
+DEFAULT_TOOL_WEIGHTS: Dict[str, int] = {
+    "generate_multiplatform_code": 4,
+    "parse_cpp_interface": 1,
+    "list_supported_platforms": 1,
+    "get_server_stats": 1,
+}
+
+
+@dataclass
+class PlatformTimings:
+    """Render and write time and output bytes of one platform."""
+    render: float = 0.0
+    write: float = 0.0
+    bytes_written: int = 0
+    bytes_skipped: int = 0
+
+
+@dataclass
+class GenerationTimings:
+    """Per-stage timing breakdown of a generate call, sent on request."""
+    parse: float = 0.0
+    platforms: Dict[str, PlatformTimings] = field(default_factory=dict)
+
+    def platform(self, name: str) -> PlatformTimings:
+        """Return the timings of a platform, creating them on first use."""
+        timings = self.platforms.get(name)
+        if timings is None:
+            timings = self.platforms[name] = PlatformTimings()
+        return timings
+
+    def to_dict(self, total: float) -> Dict[str, Any]:
+        """Return the timings in milliseconds, with byte totals over all platforms."""
+        return {
+            "total_ms": round(total * 1000, 3),
+            "parse_ms": round(self.parse * 1000, 3),
+            "platforms": {
+                name: {
+                    "render_ms": round(timings.render * 1000, 3),
+                    "write_ms": round(timings.write * 1000, 3),
+                    "bytes_written": timings.bytes_written,
+                    "bytes_skipped": timings.bytes_skipped,
+                }
+                for name, timings in self.platforms.items()
+            },
+            "bytes_written": sum(timings.bytes_written for timings in self.platforms.values()),
+            "bytes_skipped": sum(timings.bytes_skipped for timings in self.platforms.values()),
+        }
 
 
 class MultiplatformCodeGeneratorServer:
     """MCP Server for the Multiplatform Code Generator."""
 
-    def __init__(self):
-        """Initialize the server."""
+    def __init__(
+        self,
+        max_cpu_concurrency: Optional[int] = None,
+        max_io_concurrency: Optional[int] = None,
+        tool_timeouts: Optional[Dict[str, Optional[float]]] = None,
+        max_queue_depth: Optional[int] = None,
+        tool_weights: Optional[Dict[str, int]] = None,
+        result_cache_size: int = RESULT_CACHE_SIZE,
+        result_cache_ttl: Optional[float] = RESULT_CACHE_TTL,
+    ):
+        """
+        Initialize the server.
+        
+        Args:
+            max_cpu_concurrency: Maximum concurrent parse/generate calls
+            max_io_concurrency: Maximum concurrent lightweight tool calls
+            tool_timeouts: Per-tool deadlines in seconds overriding
+                DEFAULT_TOOL_TIMEOUTS; None disables a tool's deadline
+            max_queue_depth: Maximum summed weight of admitted tool calls
+            tool_weights: Per-tool queue weights overriding DEFAULT_TOOL_WEIGHTS
+            result_cache_size: Maximum cached tool results; 0 disables the cache
+            result_cache_ttl: Seconds a cached result stays valid, None for no expiry
+        """
         self.logger = logging.getLogger(__name__)
-        self.server = SimpleMCPServer("multiplatform-code-generator")
+        self.tool_timeouts = {**DEFAULT_TOOL_TIMEOUTS, **(tool_timeouts or {})}
+        self.tool_weights = {**DEFAULT_TOOL_WEIGHTS, **(tool_weights or {})}
+        # Parsed interfaces are read-only once built, so one cache is shared by
+        # every request (and every client when running as a daemon)
+        self._parse_interface = functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(
+            self._parse_interface_uncached
+        )
+        # Results of deterministic tool calls, keyed by canonical arguments
+        self.result_cache = ResultCache(result_cache_size, result_cache_ttl)
+        self.server = SimpleMCPServer(
+            "multiplatform-code-generator",
+            max_cpu_concurrency=max_cpu_concurrency,
+            max_io_concurrency=max_io_concurrency,
+            max_queue_depth=max_queue_depth,
+        )
+        # Set while serving as a local daemon
+        self.daemon: Optional["MCPDaemon"] = None
         self._setup_tools()
 
     def _setup_tools(self) -> None:
@@ -52,194 +145,304 @@ class MultiplatformCodeGeneratorServer:
         generate_tool = Tool(
             name="generate_multiplatform_code",
             description="Generate cross-platform code from C++ interface",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cpp_interface": {
-                        "type": "string",
-                        "description": "C++ interface function code"
-                    },
-                    "output_directory": {
-                        "type": "string", 
-                        "description": "Base output directory for generated files"
-                    },
-                    "platforms": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["android", "ios", "harmony"]
-                        },
-                        "description": "Target platforms to generate code for"
-                    },
-                    "android_config": {
-                        "type": "object",
-                        "properties": {
-                            "package_name": {
-                                "type": "string",
-                                "description": "Java/Kotlin package name for Android"
-                            },
-                            "class_name": {
-                                "type": "string", 
-                                "description": "Java/Kotlin class name for Android"
-                            },
-                            "language": {
-                                "type": "string",
-                                "enum": ["java", "kotlin"],
-                                "description": "Programming language for Android wrapper"
-                            }
-                        },
-                        "description": "Android-specific configuration"
-                    },
-                    "ios_config": {
-                        "type": "object",
-                        "properties": {
-                            "class_prefix": {
-                                "type": "string",
-                                "description": "Objective-C class prefix"
-                            },
-                            "framework_name": {
-                                "type": "string",
-                                "description": "iOS framework name"
-                            }
-                        },
-                        "description": "iOS-specific configuration"
-                    },
-                    "harmony_config": {
-                        "type": "object",
-                        "properties": {
-                            "module_name": {
-                                "type": "string",
-                                "description": "HarmonyOS module name"
-                            },
-                            "namespace": {
-                                "type": "string",
-                                "description": "NAPI namespace"
-                            }
-                        },
-                        "description": "HarmonyOS-specific configuration"
-                    }
-                },
-                "required": ["cpp_interface", "output_directory", "platforms"]
-            }
+            inputSchema=GENERATE_MULTIPLATFORM_CODE_SCHEMA,
         )
         
         parse_tool = Tool(
             name="parse_cpp_interface",
             description="Parse C++ interface and extract function information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cpp_interface": {
-                        "type": "string",
-                        "description": "C++ interface function code to parse"
-                    }
-                },
-                "required": ["cpp_interface"]
-            }
+            inputSchema=PARSE_CPP_INTERFACE_SCHEMA,
         )
         
         list_platforms_tool = Tool(
             name="list_supported_platforms",
             description="List all supported target platforms",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
+            inputSchema=LIST_SUPPORTED_PLATFORMS_SCHEMA,
+        )
+        
+        stats_tool = Tool(
+            name="get_server_stats",
+            description="Report per-tool call counts and latency percentiles, errors, "
+                        "cache hit ratios, queue depth and bytes written",
+            inputSchema=GET_SERVER_STATS_SCHEMA,
         )
         
         # Register tools with handlers
-        self.server.add_tool(generate_tool, self._generate_multiplatform_code)
-        self.server.add_tool(parse_tool, self._parse_cpp_interface)
-        self.server.add_tool(list_platforms_tool, self._list_supported_platforms)
+        self.server.add_tool(
+            generate_tool, self._generate_multiplatform_code, cpu_bound=True,
+            timeout=self.tool_timeouts.get(generate_tool.name),
+            weight=self.tool_weights.get(generate_tool.name, 1),
+            coalesce=True,
+        )
+        self.server.add_tool(
+            parse_tool, self._parse_cpp_interface, cpu_bound=True,
+            timeout=self.tool_timeouts.get(parse_tool.name),
+            weight=self.tool_weights.get(parse_tool.name, 1),
+            coalesce=True,
+        )
+        self.server.add_tool(
+            list_platforms_tool, self._list_supported_platforms,
+            timeout=self.tool_timeouts.get(list_platforms_tool.name),
+            weight=self.tool_weights.get(list_platforms_tool.name, 1),
+        )
+        self.server.add_tool(
+            stats_tool, self._get_server_stats,
+            timeout=self.tool_timeouts.get(stats_tool.name),
+            weight=self.tool_weights.get(stats_tool.name, 1),
+        )
 
     async def _generate_multiplatform_code(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Generate multiplatform code."""
         try:
-            request = GenerateMultiplatformCodeRequest(**arguments)
+            from .models import GenerateMultiplatformCodeRequest
+            from .utils.file_manager import FileManager
+            
+            started_at = time.perf_counter()
+            request = GenerateMultiplatformCodeRequest.from_arguments(arguments)
+            file_manager = FileManager(request.output_directory)
+            timings = GenerationTimings() if request.include_timings else None
+            
+            # The timings switch does not change the output, so it is not
+            # part of the cache key
+            cache_key = canonical_key(
+                "generate_multiplatform_code",
+                {key: value for key, value in arguments.items() if key != "include_timings"},
+            )
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                message, rendered, hashes = cached
+                with tracing.span("restore", files=len(hashes)) as span:
+                    rewritten = await self._restore_generated_files(
+                        file_manager, rendered, hashes, timings
+                    )
+                    span.set_attribute("rewritten", rewritten)
+                meta = {"cache": "hit", "filesRewritten": rewritten}
+                if timings is not None:
+                    meta["timings"] = timings.to_dict(time.perf_counter() - started_at)
+                return CallToolResult(content=[TextContent(type="text", text=message)], meta=meta)
             
             # Parse C++ interface
-            parser = CppInterfaceParser()
-            parsed_interface = parser.parse(request.cpp_interface)
+            stage_started_at = time.perf_counter()
+            with tracing.span("parse") as span:
+                parsed_interface = self._parse_interface(request.cpp_interface)
+                if span.recording:
+                    self._set_parse_attributes(span, parsed_interface)
+            if timings is not None:
+                timings.parse = time.perf_counter() - stage_started_at
+            checkpoint()
             
-            results = []
-            file_manager = FileManager(request.output_directory)
+            is_class = isinstance(parsed_interface, ParsedClass)
+            if is_class:
+                unsupported = [platform for platform in request.platforms if platform != "android"]
+                if unsupported:
+                    raise ValueError(
+                        f"C++ classes are only supported on android, not {', '.join(unsupported)}"
+                    )
             
-            # Generate code for each platform
+            # Render every platform before writing anything, so an invalid
+            # or cancelled request leaves no partial output behind
+            rendered = []
             for platform in request.platforms:
-                if platform == "android":
-                    if not request.android_config or not all(
-                        k in request.android_config for k in ["package_name", "class_name"]
-                    ):
-                        raise ValueError(
-                            "Android platform requires package_name and class_name in android_config"
+                stage_started_at = time.perf_counter()
+                with tracing.span("render", platform=platform) as span:
+                    generator = self._create_generator(platform, request)
+                    if is_class:
+                        files = generator.render_class(parsed_interface)
+                    else:
+                        files = generator.render(parsed_interface)
+                    if span.recording:
+                        span.set_attribute("files", len(files))
+                        span.set_attribute(
+                            "bytes", sum(len(content.encode("utf-8")) for content in files.values())
                         )
-                    generator = AndroidJniGenerator(request.android_config)
-                    files = await generator.generate(parsed_interface, file_manager)
-                    results.append({"platform": "android", "files": files})
-                    
-                elif platform == "ios":
-                    generator = IosOcGenerator(request.ios_config or {})
-                    files = await generator.generate(parsed_interface, file_manager)
-                    results.append({"platform": "ios", "files": files})
-                    
-                elif platform == "harmony":
-                    generator = HarmonyNapiGenerator(request.harmony_config or {})
-                    files = await generator.generate(parsed_interface, file_manager)
-                    results.append({"platform": "harmony", "files": files})
-                    
-                else:
-                    raise ValueError(f"Unsupported platform: {platform}")
+                if timings is not None:
+                    timings.platform(platform).render += time.perf_counter() - stage_started_at
+                rendered.append((platform, files))
+                checkpoint()
+            
+            # Write the generated files, reporting files done out of total
+            hashes: Dict[str, str] = {}
+            total_files = sum(len(files) for _, files in rendered)
+            files_done = 0
+            for platform, files in rendered:
+                for file_path, content in files.items():
+                    stage_started_at = time.perf_counter()
+                    with tracing.span("write", platform=platform, path=file_path) as span:
+                        size = await file_manager.write_file(file_path, content)
+                        span.set_attribute("bytes", size)
+                    if timings is not None:
+                        platform_timings = timings.platform(platform)
+                        platform_timings.write += time.perf_counter() - stage_started_at
+                        platform_timings.bytes_written += size
+                    hashes[file_path] = FileManager.content_hash(content)
+                    files_done += 1
+                    report_progress(files_done, total_files)
+                    checkpoint()
             
             # Format results
             platforms_str = ", ".join(request.platforms)
             files_summary = []
-            for result in results:
-                platform_files = "\n".join(f"  - {f}" for f in result["files"])
-                files_summary.append(f"\n{result['platform'].upper()}:\n{platform_files}")
+            for platform, files in rendered:
+                platform_files = "\n".join(f"  - {f}" for f in files)
+                files_summary.append(f"\n{platform.upper()}:\n{platform_files}")
             
             message = (
                 f"Successfully generated cross-platform code for {platforms_str}!\n\n"
                 f"Generated files:{''.join(files_summary)}"
             )
             
-            return CallToolResult(content=[TextContent(type="text", text=message)])
+            self.result_cache.put(cache_key, (message, rendered, hashes))
+            meta = {"cache": "miss"}
+            if timings is not None:
+                meta["timings"] = timings.to_dict(time.perf_counter() - started_at)
+            return CallToolResult(content=[TextContent(type="text", text=message)], meta=meta)
             
         except Exception as e:
             self.logger.error(f"Error in generate_multiplatform_code: {e}")
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Error: {str(e)}")]
+                content=[TextContent(type="text", text=f"Error: {str(e)}")], isError=True
             )
 
+    async def _restore_generated_files(
+        self,
+        file_manager: "FileManager",
+        rendered: List[Tuple[str, Dict[str, str]]],
+        hashes: Dict[str, str],
+        timings: Optional["GenerationTimings"] = None,
+    ) -> int:
+        """
+        Rewrite cached output files that are missing or changed on disk.
+        
+        Args:
+            file_manager: File manager of the output directory
+            rendered: Cached files of each platform
+            hashes: Content hash of each file
+            timings: Per-platform write timings to fill in, if requested
+        
+        Returns:
+            Number of files rewritten
+        """
+        rewritten = 0
+        files_done = 0
+        for platform, files in rendered:
+            for file_path, content in files.items():
+                stage_started_at = time.perf_counter()
+                if await file_manager.file_hash(file_path) != hashes[file_path]:
+                    size = await file_manager.write_file(file_path, content)
+                    rewritten += 1
+                    if timings is not None:
+                        timings.platform(platform).bytes_written += size
+                elif timings is not None:
+                    timings.platform(platform).bytes_skipped += len(content.encode("utf-8"))
+                if timings is not None:
+                    timings.platform(platform).write += time.perf_counter() - stage_started_at
+                files_done += 1
+                report_progress(files_done, len(hashes))
+                checkpoint()
+        return rewritten
+
+    @staticmethod
+    def _parse_interface_uncached(cpp_interface: str) -> Union[ParsedFunction, ParsedClass]:
+        """Parse a C++ function or class declaration (cached as ``_parse_interface``)."""
+        parser = CppInterfaceParser()
+        if parser.is_class_declaration(cpp_interface):
+            return parser.parse_class(cpp_interface)
+        return parser.parse(cpp_interface)
+
+    @staticmethod
+    def _set_parse_attributes(span: Any, parsed: Union[ParsedFunction, ParsedClass]) -> None:
+        """Set the attributes of a parse span describing the parsed declaration."""
+        if isinstance(parsed, ParsedClass):
+            span.set_attribute("class", parsed.class_name)
+            span.set_attribute("methods", len(parsed.methods))
+        else:
+            span.set_attribute("function", parsed.function_name)
+            span.set_attribute("parameters", len(parsed.parameters))
+
+    def _create_generator(self, platform: str, request: "GenerateMultiplatformCodeRequest") -> Any:
+        """Create the code generator for a platform, importing it on first use."""
+        # Arguments were validated against the tool schema, which requires
+        # package_name and class_name in android_config for android
+        if platform == "android":
+            from .generators.android_jni import AndroidJniGenerator
+            return AndroidJniGenerator(request.android_config)
+        elif platform == "ios":
+            from .generators.ios_oc import IosOcGenerator
+            return IosOcGenerator(request.ios_config or {})
+        elif platform == "harmony":
+            from .generators.harmony_napi import HarmonyNapiGenerator
+            return HarmonyNapiGenerator(request.harmony_config or {})
+        else:
+            raise ValueError(f"Unsupported platform: {platform}")
+
     async def _parse_cpp_interface(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Parse C++ interface."""
         try:
-            request = ParseCppInterfaceRequest(**arguments)
+            from .models import ParseCppInterfaceRequest
             
-            parser = CppInterfaceParser()
-            parsed = parser.parse(request.cpp_interface)
+            request = ParseCppInterfaceRequest.from_arguments(arguments)
             
-            params_str = "\n".join(f"  - {p.type} {p.name}" for p in parsed.parameters)
+            cache_key = canonical_key("parse_cpp_interface", arguments)
+            message = self.result_cache.get(cache_key)
+            if message is not None:
+                return CallToolResult(
+                    content=[TextContent(type="text", text=message)], meta={"cache": "hit"}
+                )
             
-            message = (
-                f"Parsed C++ interface:\n\n"
-                f"Function: {parsed.function_name}\n"
-                f"Return Type: {parsed.return_type}\n"
-                f"Parameters:\n{params_str}\n\n"
-                f"Namespace: {parsed.namespace or 'global'}"
-            )
+            with tracing.span("parse") as span:
+                parsed = self._parse_interface(request.cpp_interface)
+                if span.recording:
+                    self._set_parse_attributes(span, parsed)
+            
+            if isinstance(parsed, ParsedClass):
+                constructors_str = "\n".join(
+                    f"  - {c.function_name}({', '.join(f'{p.type} {p.name}' for p in c.parameters)})"
+                    for c in parsed.constructors
+                )
+                methods_str = "\n".join(
+                    f"  - {'static ' if m.is_static else ''}{m.return_type} {m.function_name}"
+                    f"({', '.join(f'{p.type} {p.name}' for p in m.parameters)})"
+                    for m in parsed.methods
+                ) or "  (none)"
+                message = (
+                    f"Parsed C++ class:\n\n"
+                    f"Class: {parsed.class_name}\n"
+                    f"Constructors:\n{constructors_str}\n"
+                    f"Methods:\n{methods_str}\n\n"
+                    f"Namespace: {parsed.namespace or 'global'}"
+                )
+            else:
+                params_str = "\n".join(f"  - {p.type} {p.name}" for p in parsed.parameters)
+                
+                message = (
+                    f"Parsed C++ interface:\n\n"
+                    f"Function: {parsed.function_name}\n"
+                    f"Return Type: {parsed.return_type}\n"
+                    f"Parameters:\n{params_str}\n\n"
+                    f"Namespace: {parsed.namespace or 'global'}"
+                )
             
-            return CallToolResult(content=[TextContent(type="text", text=message)])
+            self.result_cache.put(cache_key, message)
+            return CallToolResult(
+                content=[TextContent(type="text", text=message)], meta={"cache": "miss"}
+            )
             
         except Exception as e:
             self.logger.error(f"Error in parse_cpp_interface: {e}")
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Error: {str(e)}")]
+                content=[TextContent(type="text", text=f"Error: {str(e)}")], isError=True
             )
 
     async def _list_supported_platforms(self, arguments: Dict[str, Any]) -> CallToolResult:
         """List supported platforms."""
         try:
+            cache_key = canonical_key("list_supported_platforms", arguments)
+            message = self.result_cache.get(cache_key)
+            if message is not None:
+                return CallToolResult(
+                    content=[TextContent(type="text", text=message)], meta={"cache": "hit"}
+                )
+            
             platforms = [
                 {"name": "android", "description": "Android JNI bindings (Java/Kotlin)"},
                 {"name": "ios", "description": "iOS Objective-C bindings"},
@@ -252,14 +455,60 @@ class MultiplatformCodeGeneratorServer:
             
             message = f"Supported platforms:\n{platforms_str}"
             
-            return CallToolResult(content=[TextContent(type="text", text=message)])
+            self.result_cache.put(cache_key, message)
+            return CallToolResult(
+                content=[TextContent(type="text", text=message)], meta={"cache": "miss"}
+            )
             
         except Exception as e:
             self.logger.error(f"Error in list_supported_platforms: {e}")
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Error: {str(e)}")]
+                content=[TextContent(type="text", text=f"Error: {str(e)}")], isError=True
             )
 
+    def server_stats(self) -> Dict[str, Any]:
+        """Collect the server statistics reported by get_server_stats."""
+        parse_cache = self._parse_interface.cache_info()
+        parse_lookups = parse_cache.hits + parse_cache.misses
+        # Only loaded once something was generated
+        file_manager = sys.modules.get(__package__ + ".utils.file_manager")
+        file_manager_class = file_manager.FileManager if file_manager else None
+        stats = {
+            "tools": self.server.tool_metrics.to_dict(),
+            "caches": {
+                "results": self.result_cache.stats(),
+                "parse": {
+                    "size": parse_cache.currsize,
+                    "hits": parse_cache.hits,
+                    "misses": parse_cache.misses,
+                    "hit_ratio": round(parse_cache.hits / parse_lookups, 4) if parse_lookups else 0.0,
+                },
+            },
+            "queue": self.server.queue_metrics.to_dict(),
+            "file_manager": {
+                "bytes_written": file_manager_class.bytes_written if file_manager_class else 0,
+                "files_written": file_manager_class.files_written if file_manager_class else 0,
+            },
+        }
+        if self.daemon is not None:
+            stats["clients"] = self.daemon.client_stats()
+        return stats
+
+    async def _get_server_stats(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Report server statistics as JSON."""
+        message = json.dumps(self.server_stats(), indent=2)
+        return CallToolResult(content=[TextContent(type="text", text=message)])
+
     async def run(self) -> None:
         """Run the MCP server."""
-        await self.server.run_stdio()
\ No newline at end of file
+        await self.server.run_stdio()
+
+    async def run_daemon(self, socket_path: str) -> None:
+        """Run the MCP server as a local daemon on a Unix domain socket."""
+        from .daemon import MCPDaemon
+        
+        self.daemon = MCPDaemon(self.server, socket_path)
+        try:
+            await self.daemon.serve_forever()
+        finally:
+            self.daemon = None
\ No newline at end of file
@@ -0,0 +1,314 @@
+"""
+Pre-fork multi-worker front end for the MCP server.
+
+Parsing and rendering hold the GIL, so a single server process is limited to
+one core. The Supervisor runs N worker server processes and forwards each
+request to the least-loaded worker, optionally preferring a worker chosen by a
+hash of ``cpp_interface`` so repeated interfaces hit a warm parse cache.
+Workers that exit are restarted and their pending requests fail with an error;
+requests arriving while no worker is running are rejected as busy.
+"""
+
+import asyncio
+import itertools
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .daemon import MAX_MESSAGE_SIZE, child_process_env
+from .mcp_types import SERVER_BUSY, SimpleMCPServer, _transport_send
+from .utils import json_codec
+
+
+# JSON-RPC internal error, used when a worker dies with requests pending
+INTERNAL_ERROR = -32603
+
+# Extra pending requests tolerated on the affinity worker before falling back
+# to the least-loaded one
+AFFINITY_SLACK = 4
+
+# Workers that exit sooner than this after starting are restarted with a delay
+CRASH_LOOP_WINDOW = 1.0
+RESTART_DELAY = 0.5
+
+
+@dataclass
+class _PendingRequest:
+    """A request forwarded to a worker and awaiting its response."""
+    future: asyncio.Future
+    original_id: Union[str, int]
+    send: Any
+    progress_token: Optional[Union[str, int]] = None
+
+
+class WorkerProcess:
+    """A worker server process speaking JSON lines over its stdio."""
+
+    def __init__(self, index: int, command: List[str]):
+        """
+        Initialize the worker.
+        
+        Args:
+            index: Worker slot number
+            command: Command line starting a stdio MCP server
+        """
+        self.index = index
+        self.command = command
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.pending: Dict[int, _PendingRequest] = {}
+        self.started_at = 0.0
+        self.restarts = 0
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self.process is not None and self.process.returncode is None
+
+    @property
+    def load(self) -> int:
+        """Number of requests waiting on this worker."""
+        return len(self.pending)
+
+    async def start(self) -> None:
+        """Start the worker process."""
+        self.process = await asyncio.create_subprocess_exec(
+            *self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env=child_process_env(),
+            limit=MAX_MESSAGE_SIZE,
+        )
+        self.started_at = time.monotonic()
+
+    def send(self, message: bytes) -> None:
+        """Write one message line to the worker."""
+        self.process.stdin.write(message + b"\n")
+
+
+class Supervisor(SimpleMCPServer):
+    """MCP server front end that forwards requests to worker processes."""
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        worker_args: Optional[List[str]] = None,
+        affinity: bool = False,
+    ):
+        """
+        Initialize the supervisor.
+        
+        Args:
+            name: Server name
+            workers: Number of worker processes
+            worker_args: Extra command line arguments for each worker
+            affinity: Prefer a worker by hash of ``cpp_interface``
+        """
+        super().__init__(name)
+        self.affinity = affinity
+        command = [sys.executable, "-m", "multiplatform_code_generator.main", *(worker_args or [])]
+        self.workers = [WorkerProcess(index, command) for index in range(workers)]
+        self._request_ids = itertools.count(1)
+        # (connection writer, client request id) -> (worker, worker request id)
+        self._routes: Dict[Tuple[Any, Union[str, int]], Tuple[WorkerProcess, int]] = {}
+        self._readers: List[asyncio.Future] = []
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._started = False
+        self._closing = False
+
+    async def _ensure_started(self) -> None:
+        """Start the workers on first use, inside the serving event loop."""
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._started:
+                return
+            for worker in self.workers:
+                await self._start_worker(worker)
+            self._started = True
+            print(f"👷 Started {len(self.workers)} worker processes", file=sys.stderr)
+
+    async def _start_worker(self, worker: WorkerProcess) -> None:
+        """Start a worker and the task reading its output."""
+        await worker.start()
+        self._readers.append(asyncio.ensure_future(self._read_worker(worker)))
+
+    async def _encode_request(self, request_data: Any) -> Optional[bytes]:
+        """Forward a single request to a worker and return its encoded response."""
+        if not isinstance(request_data, dict):
+            return await super()._encode_request(request_data)
+        
+        if request_data.get("method") == "notifications/cancelled":
+            params = request_data.get("params") or {}
+            self.cancel_request(params.get("requestId"), params.get("reason"))
+            if "id" not in request_data:
+                return None
+            return json_codec.dumps(self._create_response(request_data["id"], {}))
+        
+        if "id" not in request_data:
+            # Other notifications carry no work for the workers
+            return None
+        
+        await self._ensure_started()
+        return await self._forward(request_data)
+
+    async def _forward(self, request_data: Dict[str, Any]) -> Optional[bytes]:
+        """Send a request to a worker under a supervisor-unique id."""
+        send = _transport_send.get()
+        original_id = request_data["id"]
+        worker_request_id = next(self._request_ids)
+        worker = self._pick_worker(request_data)
+        if worker is None:
+            # Every worker died and is waiting to be restarted
+            return json_codec.dumps(self._create_error_response(
+                original_id,
+                f"No worker available, retry after {RESTART_DELAY:.2f}s",
+                SERVER_BUSY,
+                data={"retryAfterMs": int(RESTART_DELAY * 1000)},
+            ))
+        
+        message = dict(request_data, id=worker_request_id)
+        progress_token = None
+        params = request_data.get("params")
+        meta = params.get("_meta") if isinstance(params, dict) else None
+        if isinstance(meta, dict) and "progressToken" in meta:
+            # Progress notifications come back keyed by the worker request id
+            progress_token = meta["progressToken"]
+            message["params"] = dict(params, _meta=dict(meta, progressToken=worker_request_id))
+        
+        future = asyncio.get_event_loop().create_future()
+        worker.pending[worker_request_id] = _PendingRequest(future, original_id, send, progress_token)
+        route_key = (send, original_id)
+        self._routes[route_key] = (worker, worker_request_id)
+        try:
+            worker.send(json_codec.dumps(message))
+            return await future
+        finally:
+            worker.pending.pop(worker_request_id, None)
+            if self._routes.get(route_key) == (worker, worker_request_id):
+                del self._routes[route_key]
+
+    def _pick_worker(self, request_data: Dict[str, Any]) -> Optional[WorkerProcess]:
+        """Choose the least-loaded worker, or the affinity worker if not much busier."""
+        # Skip workers that died and are waiting to be restarted
+        candidates = [worker for worker in self.workers if worker.alive]
+        if not candidates:
+            return None
+        least_loaded = min(candidates, key=lambda worker: worker.load)
+        if self.affinity:
+            params = request_data.get("params")
+            arguments = params.get("arguments") if isinstance(params, dict) else None
+            cpp_interface = arguments.get("cpp_interface") if isinstance(arguments, dict) else None
+            if isinstance(cpp_interface, str):
+                preferred = self.workers[zlib.crc32(cpp_interface.encode("utf-8")) % len(self.workers)]
+                if preferred.alive and preferred.load <= least_loaded.load + AFFINITY_SLACK:
+                    return preferred
+        return least_loaded
+
+    async def _read_worker(self, worker: WorkerProcess) -> None:
+        """Route a worker's responses and notifications back to their clients."""
+        stdout = worker.process.stdout
+        while True:
+            try:
+                line = await stdout.readline()
+            except ConnectionError:
+                break
+            except ValueError:
+                # A line over the stream limit; the stream cannot be resumed,
+                # so stop the worker to fail its requests and restart it
+                print(f"⚠️  Worker {worker.index} sent a message over the size limit", file=sys.stderr)
+                if worker.alive:
+                    worker.process.kill()
+                break
+            if not line:
+                break
+            try:
+                message = json_codec.loads(line)
+            except json_codec.JSONDecodeError:
+                continue
+            if not isinstance(message, dict):
+                continue
+            
+            if "id" in message:
+                pending = worker.pending.get(message["id"])
+                if pending is not None and not pending.future.done():
+                    message["id"] = pending.original_id
+                    pending.future.set_result(json_codec.dumps(message))
+            elif message.get("method") == "notifications/progress":
+                params = message.get("params") or {}
+                pending = worker.pending.get(params.get("progressToken"))
+                if pending is not None and pending.send is not None:
+                    params["progressToken"] = pending.progress_token
+                    pending.send(json_codec.dumps(message))
+        
+        await self._handle_worker_exit(worker)
+
+    async def _handle_worker_exit(self, worker: WorkerProcess) -> None:
+        """Fail the requests of an exited worker and restart it."""
+        returncode = await worker.process.wait()
+        for worker_request_id, pending in list(worker.pending.items()):
+            if not pending.future.done():
+                pending.future.set_result(json_codec.dumps(self._create_error_response(
+                    pending.original_id,
+                    f"Worker {worker.index} exited with code {returncode}",
+                    INTERNAL_ERROR,
+                )))
+        worker.pending.clear()
+        
+        if self._closing:
+            return
+        print(f"⚠️  Worker {worker.index} exited with code {returncode}, restarting", file=sys.stderr)
+        if time.monotonic() - worker.started_at < CRASH_LOOP_WINDOW:
+            await asyncio.sleep(RESTART_DELAY)
+        worker.restarts += 1
+        await self._start_worker(worker)
+
+    def cancel_request(self, request_id: Optional[Union[str, int]], reason: Optional[str] = None) -> bool:
+        """Forward a cancellation of the current connection's request to its worker."""
+        route = self._routes.get((_transport_send.get(), request_id))
+        if route is None:
+            return False
+        worker, worker_request_id = route
+        params: Dict[str, Any] = {"requestId": worker_request_id}
+        if reason is not None:
+            params["reason"] = reason
+        worker.send(json_codec.dumps(
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": params}
+        ))
+        # Workers send no response for cancelled requests
+        pending = worker.pending.get(worker_request_id)
+        if pending is not None and not pending.future.done():
+            pending.future.set_result(None)
+        return True
+
+    def cancel_connection_requests(self, reason: Optional[str] = None) -> int:
+        """Cancel every forwarded request of the current connection."""
+        send = _transport_send.get()
+        request_ids = [request_id for route_send, request_id in self._routes if route_send is send]
+        return sum(self.cancel_request(request_id, reason) for request_id in request_ids)
+
+    def worker_stats(self) -> List[Dict[str, Any]]:
+        """Return the load and restart count of each worker."""
+        return [
+            {
+                "worker": worker.index,
+                "pid": worker.process.pid if worker.process else None,
+                "pending": worker.load,
+                "restarts": worker.restarts,
+            }
+            for worker in self.workers
+        ]
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._closing = True
+        for reader in self._readers:
+            reader.cancel()
+        for worker in self.workers:
+            if worker.process is not None and worker.process.returncode is None:
+                worker.process.terminate()
+        super().close()
@@ -0,0 +1,252 @@
+"""
+Tracing
+
+Optional span tracing of tool calls (request → parse → per-platform render
+→ per-file write), exported to a local file as Chrome trace-event JSON or
+OTLP-JSON. Tracing is off by default; while off, ``span()`` returns a shared
+no-op span, so instrumented code pays one function call per span.
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+CHROME = "chrome"
+OTLP = "otlp"
+TRACE_FORMATS = [CHROME, OTLP]
+
+# Instrumentation scope and service name reported in OTLP exports
+_SCOPE_NAME = "multiplatform_code_generator"
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar(
+    "multiplatform_current_span", default=None
+)
+
+
+class _NoopSpan:
+    """Span returned while tracing is off."""
+
+    recording = False
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """A timed operation with attributes, nested under the current span."""
+
+    recording = True
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        parent = _current_span.get()
+        self.parent_id: Optional[str] = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.thread_id = threading.get_native_id()
+        self.start_ns = 0
+        self.duration_ns = 0
+        self._started_at = 0
+        self._token: Optional[contextvars.Token] = None
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        self._started_at = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.duration_ns = time.perf_counter_ns() - self._started_at
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        _current_span.reset(self._token)
+        self.tracer.finish(self)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+
+class Tracer:
+    """Collects finished spans and appends them to a trace file."""
+
+    def __init__(self, path: str, trace_format: str = CHROME):
+        """
+        Initialize the tracer.
+
+        Args:
+            path: Trace file, appended to; ``{pid}`` is replaced by the process id
+            trace_format: CHROME for a trace-event array (open in
+                chrome://tracing or Perfetto), OTLP for OTLP-JSON lines
+        """
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {trace_format}")
+        self.path = path.replace("{pid}", str(os.getpid()))
+        self.trace_format = trace_format
+        self.pid = os.getpid()
+        self._pending: List[Span] = []
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+        if trace_format == CHROME and self._file.tell() == 0:
+            # Trace viewers accept the array without its closing bracket,
+            # so events can be appended as they finish
+            self._file.write("[\n")
+            self._file.flush()
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        """Create a span; it starts when entered."""
+        return Span(self, name, attributes)
+
+    def finish(self, span: Span) -> None:
+        """Record a finished span, writing out the batch when a request ends."""
+        with self._lock:
+            self._pending.append(span)
+            if span.parent_id is None:
+                self._write(self._pending)
+                self._pending = []
+
+    def flush(self) -> None:
+        """Write out spans whose request has not finished yet."""
+        with self._lock:
+            if self._pending:
+                self._write(self._pending)
+                self._pending = []
+
+    def close(self) -> None:
+        """Flush pending spans and close the trace file."""
+        self.flush()
+        with self._lock:
+            self._file.close()
+
+    def _write(self, spans: List[Span]) -> None:
+        """Append spans to the trace file."""
+        if self._file.closed:
+            return
+        if self.trace_format == CHROME:
+            self._file.write("".join(json.dumps(self._chrome_event(span)) + ",\n" for span in spans))
+        else:
+            self._file.write(json.dumps(self._otlp_request(spans)) + "\n")
+        self._file.flush()
+
+    def _chrome_event(self, span: Span) -> Dict[str, Any]:
+        """Encode a span as a complete ("X") trace event."""
+        args = dict(span.attributes, span_id=span.span_id)
+        if span.parent_id:
+            args["parent_id"] = span.parent_id
+        return {
+            "name": span.name,
+            "cat": _SCOPE_NAME,
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": self.pid,
+            "tid": span.thread_id,
+            "args": args,
+        }
+
+    def _otlp_request(self, spans: List[Span]) -> Dict[str, Any]:
+        """Encode spans as an OTLP ExportTraceServiceRequest."""
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.start_ns + span.duration_ns),
+                "attributes": [
+                    {"key": key, "value": _otlp_value(value)}
+                    for key, value in span.attributes.items()
+                ],
+            }
+            if span.parent_id:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": _SCOPE_NAME}},
+                        {"key": "process.pid", "value": {"intValue": str(self.pid)}},
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": _SCOPE_NAME}, "spans": otlp_spans}],
+            }]
+        }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+# Active tracer, None while tracing is off
+_tracer: Optional[Tracer] = None
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """
+    Start a span as a context manager, nested under the current span.
+
+    Args:
+        name: Span name
+        **attributes: Span attributes
+
+    Returns:
+        The span, or a shared no-op span while tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.start_span(name, attributes)
+
+
+def enable(path: str, trace_format: str = CHROME) -> Tracer:
+    """
+    Turn tracing on for this process, exporting spans to ``path``.
+
+    Args:
+        path: Trace file; ``{pid}`` is replaced by the process id
+        trace_format: CHROME or OTLP
+
+    Returns:
+        The active tracer, closed at interpreter exit
+    """
+    global _tracer
+    disable()
+    _tracer = Tracer(path, trace_format)
+    atexit.register(_tracer.close)
+    return _tracer
+
+
+def disable() -> None:
+    """Turn tracing off, closing the active trace file."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        atexit.unregister(tracer.close)
+        tracer.close()
@@ -2,6 +2,26 @@
 Utilities module for the Multiplatform Code Generator.
 """
 
-from .file_manager import FileManager
+import importlib
+from typing import Any
 
-__all__ = ["FileManager"]
+# Exported names and their submodules, imported on first access so that
+# startup only pays for the utilities it uses
+_LAZY_IMPORTS = {
+    "FileManager": ".file_manager",
+    "ResultCache": ".result_cache",
+    "canonical_key": ".result_cache",
+}
+
+__all__ = ["FileManager", "ResultCache", "canonical_key", "json_codec"]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        if name == "json_codec":
+            return importlib.import_module(".json_codec", __name__)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,15 +4,22 @@ File Manager
 Handles file creation, writing, and directory management.
 """
 
+import hashlib
 import os
 import shutil
+import threading
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 
 class FileManager:
     """File manager for handling file operations."""
 
+    # Totals over every instance in the process, reported by server stats
+    bytes_written = 0
+    files_written = 0
+    _stats_lock = threading.Lock()
+
     def __init__(self, base_directory: Union[str, Path]):
         """
         Initialize the file manager.
@@ -22,22 +29,30 @@ class FileManager:
         """
         self.base_directory = Path(base_directory)
 
-    async def write_file(self, file_path: Union[str, Path], content: str) -> None:
+    async def write_file(self, file_path: Union[str, Path], content: str) -> int:
         """
         Write content to a file.
         
         Args:
             file_path: Relative path to the file
             content: Content to write to the file
+            
+        Returns:
+            Number of bytes written
         """
         full_path = self.base_directory / file_path
         
         # Ensure directory exists
         await self.ensure_directory(full_path.parent)
         
-        # Write file
-        with open(full_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write file; as bytes so the file matches content_hash() on every OS
+        data = content.encode('utf-8')
+        with open(full_path, 'wb') as f:
+            f.write(data)
+        with FileManager._stats_lock:
+            FileManager.bytes_written += len(data)
+            FileManager.files_written += 1
+        return len(data)
 
     async def ensure_directory(self, directory: Union[str, Path]) -> None:
         """
@@ -119,6 +134,35 @@ class FileManager:
         # Copy file
         shutil.copy2(source_full_path, target_full_path)
 
+    async def file_hash(self, file_path: Union[str, Path]) -> Optional[str]:
+        """
+        Hash the content of a file.
+        
+        Args:
+            file_path: Relative path to the file
+            
+        Returns:
+            SHA-256 hex digest of the file, or None if it does not exist
+        """
+        full_path = self.base_directory / file_path
+        try:
+            return hashlib.sha256(full_path.read_bytes()).hexdigest()
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """
+        Hash content the way it is stored by write_file.
+        
+        Args:
+            content: File content
+            
+        Returns:
+            SHA-256 hex digest of the UTF-8 encoded content
+        """
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     def get_full_path(self, relative_path: Union[str, Path]) -> Path:
         """
         Get full path from relative path.
@@ -0,0 +1,46 @@
+"""
+JSON Codec
+
+Bytes-in/bytes-out JSON encoding used on the MCP transport hot path.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# Set MULTIPLATFORM_JSON_BACKEND=json to force the standard library backend
+_requested_backend = os.environ.get("MULTIPLATFORM_JSON_BACKEND", "auto")
+
+# Raised for malformed input by both backends (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None and _requested_backend != "json":
+    BACKEND = "orjson"
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+    BACKEND = "json"
+
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        return _encoder.encode(obj).encode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
@@ -0,0 +1,91 @@
+"""
+Result Cache
+
+LRU + TTL cache for tool results, keyed by a canonical hash of the tool
+arguments so equivalent argument objects share an entry.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+def canonical_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """
+    Build the cache key of a tool call.
+    
+    Args:
+        tool_name: Name of the tool
+        arguments: Tool arguments
+        
+    Returns:
+        Hex digest identifying the tool and its arguments, independent of key order
+    """
+    canonical = json.dumps(
+        [tool_name, arguments], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache whose entries expire after a time to live."""
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 300.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of entries; 0 disables caching
+            ttl: Seconds an entry stays valid, or None to never expire
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the entry count, hit and miss counters and hit ratio."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,201 @@
+"""
+Argument Validation
+
+Compiles the subset of JSON Schema used by the tool schemas into nested
+closures, once per schema, so validating a call is a few type checks and
+dictionary lookups instead of a walk over the schema.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+
+# A compiled check takes a value and its path in the arguments and returns
+# an error message, or None when the value is valid
+Check = Callable[[Any, str], Optional[str]]
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+class ValidationError(ValueError):
+    """Tool arguments that do not match the tool's input schema."""
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], None]:
+    """
+    Compile a JSON schema into a validator.
+
+    Args:
+        schema: JSON schema using type, enum, const, properties,
+            additionalProperties, required, items, contains, minItems and
+            if/then/else
+
+    Returns:
+        Function raising ValidationError when its argument does not match
+    """
+    check = _compile(schema)
+
+    def validate(value: Any) -> None:
+        error = check(value, "arguments")
+        if error is not None:
+            raise ValidationError(f"Invalid arguments: {error}")
+
+    return validate
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    """Compile one schema node into a check."""
+    checks: List[Check] = []
+
+    if "type" in schema:
+        type_names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        type_checks = [_TYPE_CHECKS[name] for name in type_names]
+        expected = " or ".join(type_names)
+
+        def check_type(value: Any, path: str) -> Optional[str]:
+            if not any(type_check(value) for type_check in type_checks):
+                return f"{path} must be of type {expected}, got {type(value).__name__}"
+            return None
+        checks.append(check_type)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value: Any, path: str) -> Optional[str]:
+            if value not in allowed:
+                return f"{path} must be one of {allowed}, got {value!r}"
+            return None
+        checks.append(check_enum)
+
+    if "const" in schema:
+        constant = schema["const"]
+
+        def check_const(value: Any, path: str) -> Optional[str]:
+            if value != constant:
+                return f"{path} must be {constant!r}"
+            return None
+        checks.append(check_const)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value: Any, path: str) -> Optional[str]:
+            if _TYPE_CHECKS["number"](value) and value < minimum:
+                return f"{path} must be at least {minimum}, got {value!r}"
+            return None
+        checks.append(check_minimum)
+
+    if schema.get("required"):
+        required = list(schema["required"])
+
+        def check_required(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, dict):
+                for name in required:
+                    if name not in value:
+                        return f"{path}.{name} is required"
+            return None
+        checks.append(check_required)
+
+    if schema.get("properties"):
+        properties = [(name, _compile(sub)) for name, sub in schema["properties"].items()]
+
+        def check_properties(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, dict):
+                for name, check in properties:
+                    if name in value:
+                        error = check(value[name], f"{path}.{name}")
+                        if error is not None:
+                            return error
+            return None
+        checks.append(check_properties)
+
+    if isinstance(schema.get("additionalProperties"), dict):
+        known = set(schema.get("properties", {}))
+        check_additional = _compile(schema["additionalProperties"])
+
+        def check_additional_properties(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, dict):
+                for name, item in value.items():
+                    if name not in known:
+                        error = check_additional(item, f"{path}.{name}")
+                        if error is not None:
+                            return error
+            return None
+        checks.append(check_additional_properties)
+    elif schema.get("additionalProperties") is False:
+        known = set(schema.get("properties", {}))
+
+        def check_no_additional_properties(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, dict):
+                for name in value:
+                    if name not in known:
+                        return f"{path}.{name} is not allowed"
+            return None
+        checks.append(check_no_additional_properties)
+
+    if "items" in schema:
+        check_item = _compile(schema["items"])
+
+        def check_items(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    error = check_item(item, f"{path}[{index}]")
+                    if error is not None:
+                        return error
+            return None
+        checks.append(check_items)
+
+    if "minItems" in schema:
+        min_items = schema["minItems"]
+
+        def check_min_items(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, list) and len(value) < min_items:
+                return f"{path} must have at least {min_items} items"
+            return None
+        checks.append(check_min_items)
+
+    if "contains" in schema:
+        check_contained = _compile(schema["contains"])
+
+        def check_contains(value: Any, path: str) -> Optional[str]:
+            if isinstance(value, list) and all(
+                check_contained(item, path) is not None for item in value
+            ):
+                return f"{path} must contain a matching item"
+            return None
+        checks.append(check_contains)
+
+    if "if" in schema:
+        check_if = _compile(schema["if"])
+        check_then = _compile(schema["then"]) if "then" in schema else None
+        check_else = _compile(schema["else"]) if "else" in schema else None
+        condition = schema["if"].get("description")
+
+        def check_conditional(value: Any, path: str) -> Optional[str]:
+            matched = check_if(value, path) is None
+            check = check_then if matched else check_else
+            error = check(value, path) if check is not None else None
+            if error is not None and matched and condition:
+                error = f"{error} {condition}"
+            return error
+        checks.append(check_conditional)
+
+    if not checks:
+        return lambda value, path: None
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value: Any, path: str) -> Optional[str]:
+        for check in checks:
+            error = check(value, path)
+            if error is not None:
+                return error
+        return None
+    return check_all
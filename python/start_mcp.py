@@ -31,6 +31,22 @@ Options:
   -t, --test     Run tests before starting server
   -v, --version  Show version information
 
+Server options:
+  --daemon SOCKET          Serve many clients on a Unix domain socket
+  --connect SOCKET         Forward stdio to the daemon on SOCKET
+  --workers N              Serve through N worker processes
+  --affinity               Route by hash of cpp_interface (with --workers)
+  --max-cpu-concurrency N  Maximum concurrent parse/generate calls
+  --max-io-concurrency N   Maximum concurrent lightweight tool calls
+  --tool-timeout TOOL=SEC  Deadline for calls to a tool, 0 disables it
+  --max-queue-depth N      Maximum summed weight of queued and running calls
+  --tool-weight TOOL=W     Admission queue weight of each call to a tool
+  --result-cache-size N    Maximum memoized tool results (0 disables)
+  --result-cache-ttl SECS  Seconds a memoized result stays valid (0 never expires)
+  --trace FILE             Append request/parse/render/write spans to FILE
+  --trace-format FORMAT    chrome (trace-event JSON, default) or otlp (OTLP-JSON)
+  --measure-startup        Report time from process start to first tools/list
+
 Examples:
   python start_mcp.py              # Start server directly
   python start_mcp.py --test       # Run tests then start server
@@ -74,7 +90,8 @@ async def main():
     parser.add_argument("-t", "--test", action="store_true", help="Run tests")
     parser.add_argument("-v", "--version", action="store_true", help="Show version")
     
-    args = parser.parse_args()
+    # Remaining arguments are server options handled by the MCP entry point
+    args, server_args = parser.parse_known_args()
     
     print_header()
     
@@ -96,7 +113,7 @@ async def main():
     print("🛑 Use Ctrl+C to stop the server\n")
     
     try:
-        await mcp_main()
+        await mcp_main(server_args)
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
         return 0
@@ -4,15 +4,24 @@ Test script for the Multiplatform Code Generator Python version.
 """
 
 import asyncio
+import os
+import re
+import subprocess
+import sys
 import tempfile
 import shutil
+import time
 from pathlib import Path
 
 from src.multiplatform_code_generator.parsers.cpp_parser import CppInterfaceParser
 from src.multiplatform_code_generator.generators.android_jni import AndroidJniGenerator
 from src.multiplatform_code_generator.generators.ios_oc import IosOcGenerator
 from src.multiplatform_code_generator.generators.harmony_napi import HarmonyNapiGenerator
+from src.multiplatform_code_generator.mcp_types import CallToolResult, SimpleMCPServer, TextContent, Tool
+from src.multiplatform_code_generator.schemas import TOOL_SCHEMAS
+from src.multiplatform_code_generator.validation import ValidationError, compile_schema
 from src.multiplatform_code_generator.utils.file_manager import FileManager
+from src.multiplatform_code_generator.utils.result_cache import ResultCache, canonical_key
 
 
 # Test C++ interface
@@ -25,6 +34,338 @@ namespace MathUtils {
 }
 """
 
+# Modules the server must not import before a tool call needs them; keeps
+# the cold start to the first tools/list response fast
+LAZY_MODULES = [
+    "multiplatform_code_generator.models",
+    "multiplatform_code_generator.generators.android_jni",
+    "multiplatform_code_generator.generators.ios_oc",
+    "multiplatform_code_generator.generators.harmony_napi",
+    "multiplatform_code_generator.utils.file_manager",
+    "multiplatform_code_generator.daemon",
+    "multiplatform_code_generator.supervisor",
+]
+
+
+# Array signatures every platform must bind to valid native types
+ARRAY_INTERFACES = {
+    "float sum(const std::vector<float>& v);": {
+        "android/src/main/java/com/example/arrays/Arrays.java": "sum(float[] v)",
+        "ios/MUSumBridge.hpp": "sumBridge(const std::vector<float>& v)",
+        "harmony/src/main/ets/types/Arrays.d.ts": "sum(v: Float32Array)",
+    },
+    # A temporary vector cannot bind to the non-const reference; the JNI
+    # glue passes a named copy written back to the Java array
+    "void scale(std::vector<float>& v, float k);": {
+        "android/src/main/java/com/example/arrays/Arrays.java": "scale(float[] v, float k)",
+        "android/jni/scale_jni.cpp": "JniVectorArgument<jfloat, float> v_vector(v_elements);",
+        "ios/MUScaleBridge.hpp": "scaleBridge(std::vector<float>& v, float k)",
+        "harmony/src/main/ets/types/Arrays.d.ts": "scale(v: Float32Array, k: number)",
+    },
+    "void fill(int* data, int n);": {
+        "android/src/main/java/com/example/arrays/Arrays.java": "fill(int[] data)",
+        "ios/MUFillBridge.hpp": "fillBridge(int* data, int n)",
+        "harmony/src/main/ets/types/Arrays.d.ts": "fill(data: Int32Array)",
+    },
+}
+
+# An array type of the parser leaking into C++ or Objective-C code
+_PARSER_ARRAY_TYPE_REGEX = re.compile(r'\b(boolean|byte|short|int|long|float|double|string)\[\]')
+
+
+def find_array_binding_errors():
+    """Return the problems of the code generated from array signatures."""
+    parser = CppInterfaceParser()
+    generators = [
+        AndroidJniGenerator({"package_name": "com.example.arrays", "class_name": "Arrays"}),
+        IosOcGenerator({"class_prefix": "MU", "framework_name": "Arrays"}),
+        HarmonyNapiGenerator({"module_name": "Arrays", "namespace": "arrays"}),
+    ]
+    errors = []
+    for interface, expected in ARRAY_INTERFACES.items():
+        parsed = parser.parse(interface)
+        files = {}
+        for generator in generators:
+            files.update(generator.render(parsed))
+        for path, snippet in expected.items():
+            if snippet not in files.get(path, ""):
+                errors.append(f"{interface} {path}: missing {snippet}")
+        for path, content in files.items():
+            if path.startswith(("ios/", "harmony/")) and path.endswith((".h", ".hpp", ".m", ".cpp")):
+                if _PARSER_ARRAY_TYPE_REGEX.search(content) or "TODO" in content:
+                    errors.append(f"{interface} {path}: unconverted array type")
+    return errors
+
+
+# Class declaration exercising every kind of member the parser skips
+TEST_CPP_CLASS = """
+namespace Geometry {
+class Counter final : public Base {
+    int secret();
+public:
+    explicit Counter(int start);
+    Counter(const Counter& other) = delete;
+    Counter(Counter&& other);
+    ~Counter();
+    Counter& operator=(const Counter& other);
+    int value() const { if (count_ > 0) { return count_; } return 0; }
+    static Counter* create(const std::string& name);
+    virtual void add(int amount);
+    template <typename T> void visit(T visitor);
+    friend void swap(Counter& a, Counter& b);
+private:
+    void reset();
+    int count_;
+};
+}
+"""
+
+
+def find_class_parsing_errors():
+    """Return the problems of parsing class declarations into bindable members."""
+    parser = CppInterfaceParser()
+    errors = []
+
+    body = "class A { int f() { if (x) { return 1; } return 0; } int g(); public: A(); };"
+    members = parser._split_members(body, body.index("{") + 1)
+    if members != ["int f()", "int g()", "public: A()"]:
+        errors.append(f"_split_members returned {members}")
+
+    parsed = parser.parse_class(TEST_CPP_CLASS)
+    if (parsed.class_name, parsed.namespace) != ("Counter", "Geometry"):
+        errors.append(f"class parsed as {parsed.namespace}::{parsed.class_name}")
+    constructors = [[param.name for param in function.parameters] for function in parsed.constructors]
+    if constructors != [["start"]]:
+        errors.append(f"constructors parsed as {constructors}, expected only Counter(int start)")
+    methods = [
+        (function.function_name, function.return_type, function.is_static, function.is_virtual, function.is_const)
+        for function in parsed.methods
+    ]
+    expected_methods = [
+        ("value", "int", False, False, True),
+        ("create", "Counter*", True, False, False),
+        ("add", "void", False, True, False),
+    ]
+    if methods != expected_methods:
+        errors.append(f"methods parsed as {methods}, expected {expected_methods}")
+
+    parsed = parser.parse_class("struct Point { double x; double y; double length() const; };")
+    if [len(function.parameters) for function in parsed.constructors] != [0]:
+        errors.append("a struct without constructors did not get its implicit default constructor")
+    if [function.function_name for function in parsed.methods] != ["length"]:
+        errors.append("struct members were not public by default")
+
+    # A helper struct declared next to a function does not make a class binding
+    interface = (
+        "struct Options { int level; bool verbose() const { return level > 0; } };\n"
+        "int compress(const std::string& data, int level);"
+    )
+    if parser.is_class_declaration(interface):
+        errors.append("a function declared next to a struct was taken for a class")
+    elif parser.parse(interface).function_name != "compress":
+        errors.append("a member of a helper struct was parsed as the function")
+    if not parser.is_class_declaration(TEST_CPP_CLASS):
+        errors.append("a class declaration was taken for a function")
+
+    try:
+        parser.parse_class("class Singleton { Singleton(); public: static Singleton* instance(); };")
+        errors.append("a class without a public constructor was accepted")
+    except ValueError as e:
+        if "has no public constructor" not in str(e):
+            errors.append(f"wrong error for a class without a public constructor: {e}")
+    return errors
+
+
+# Tool arguments and the error expected from the tool's schema, None when valid
+_ANDROID_CONFIG = {"package_name": "com.example.math", "class_name": "MathUtils"}
+VALIDATION_CASES = [
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out",
+      "platforms": ["android"], "android_config": _ANDROID_CONFIG},
+     None),
+    ("generate_multiplatform_code",
+     {"output_directory": "out", "platforms": ["ios"]},
+     "Invalid arguments: arguments.cpp_interface is required"),
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out", "platforms": "ios"},
+     "Invalid arguments: arguments.platforms must be of type array, got str"),
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out",
+      "platforms": ["ios", "windows"]},
+     "Invalid arguments: arguments.platforms[1] must be one of "
+     "['android', 'ios', 'harmony'], got 'windows'"),
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out",
+      "platforms": ["android"],
+      "android_config": dict(_ANDROID_CONFIG, array_binding={"data": "pointer"})},
+     "Invalid arguments: arguments.android_config.array_binding.data must be one of "
+     "['array', 'direct_buffer'], got 'pointer'"),
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out",
+      "platforms": ["android"]},
+     "Invalid arguments: arguments.android_config is required when targeting android"),
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out",
+      "platforms": ["android"], "android_config": dict(_ANDROID_CONFIG, native_thread_pool_size=0)},
+     "Invalid arguments: arguments.android_config.native_thread_pool_size must be at least 1, got 0"),
+    ("generate_multiplatform_code",
+     {"cpp_interface": "int add(int a, int b);", "output_directory": "out",
+      "platforms": ["android"], "android_config": dict(_ANDROID_CONFIG, string_buffer_size=-1)},
+     "Invalid arguments: arguments.android_config.string_buffer_size must be at least 1, got -1"),
+    ("parse_cpp_interface", {"cpp_interface": 42},
+     "Invalid arguments: arguments.cpp_interface must be of type string, got int"),
+]
+
+# A closed object schema, which the tool schemas avoid so unknown keys are ignored
+_CLOSED_SCHEMA = {"type": "object", "properties": {"name": {"type": "string"}},
+                  "additionalProperties": False}
+
+
+def find_validation_errors():
+    """Return the tool arguments the compiled schemas validate incorrectly."""
+    cases = [(TOOL_SCHEMAS[tool], arguments, expected) for tool, arguments, expected in VALIDATION_CASES]
+    cases += [
+        (_CLOSED_SCHEMA, {"name": "add"}, None),
+        (_CLOSED_SCHEMA, {"name": "add", "extra": 1}, "Invalid arguments: arguments.extra is not allowed"),
+    ]
+    errors = []
+    for schema, arguments, expected in cases:
+        try:
+            compile_schema(schema)(arguments)
+            message = None
+        except ValidationError as e:
+            message = str(e)
+        if message != expected:
+            errors.append(f"{arguments}: expected {expected!r}, got {message!r}")
+    return errors
+
+
+def find_result_cache_errors():
+    """Return the problems of the result cache's keys, eviction and expiry."""
+    errors = []
+    arguments = {"cpp_interface": "int add(int a, int b);", "platforms": ["ios", "android"],
+                 "ios_config": {"class_prefix": "MU", "framework_name": "MathUtils"}}
+    reordered = {"ios_config": {"framework_name": "MathUtils", "class_prefix": "MU"},
+                 "platforms": ["ios", "android"], "cpp_interface": "int add(int a, int b);"}
+    key = canonical_key("generate_multiplatform_code", arguments)
+    if canonical_key("generate_multiplatform_code", reordered) != key:
+        errors.append("canonical_key depends on key order")
+    if canonical_key("parse_cpp_interface", arguments) == key:
+        errors.append("canonical_key ignores the tool name")
+    if canonical_key("generate_multiplatform_code", dict(arguments, platforms=["android", "ios"])) == key:
+        errors.append("canonical_key ignores list order")
+
+    cache = ResultCache(max_entries=2, ttl=None)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    if cache.get("b") is not None:
+        errors.append("the least recently used entry was not evicted")
+    if cache.get("a") != 1 or cache.get("c") != 3:
+        errors.append("recently used entries were evicted")
+    stats = cache.stats()
+    if (stats["size"], stats["hits"], stats["misses"]) != (2, 3, 1):
+        errors.append(f"wrong LRU stats {stats}")
+
+    cache = ResultCache(max_entries=2, ttl=0.05)
+    cache.put("a", 1)
+    if cache.get("a") != 1:
+        errors.append("an entry expired before its time to live")
+    time.sleep(0.1)
+    if cache.get("a") is not None or len(cache) != 0:
+        errors.append("an expired entry was returned or kept")
+
+    cache = ResultCache(max_entries=0)
+    cache.put("a", 1)
+    if cache.get("a") is not None:
+        errors.append("a disabled cache stored an entry")
+    return errors
+
+
+async def find_single_flight_errors():
+    """Return the problems of coalescing identical concurrent tool calls."""
+    server = SimpleMCPServer("single-flight-test")
+    started = []
+    cancelled = []
+    release = asyncio.Event()
+
+    async def handler(arguments):
+        started.append(arguments["value"])
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(arguments["value"])
+            raise
+        return CallToolResult(content=[TextContent(type="text", text=arguments["value"])])
+
+    server.add_tool(Tool("echo", "Echo a value", {"type": "object"}), handler, coalesce=True)
+
+    def call(request_id, value):
+        return asyncio.ensure_future(server.handle_request({
+            "jsonrpc": "2.0", "id": request_id, "method": "tools/call",
+            "params": {"name": "echo", "arguments": {"value": value}},
+        }))
+
+    errors = []
+    # Identical calls share one computation; a caller leaving does not stop it
+    shared = [call(1, "a"), call(2, "a"), call(3, "a"), call(4, "b")]
+    await asyncio.sleep(0.01)
+    if sorted(started) != ["a", "b"]:
+        errors.append(f"identical calls were not coalesced: handler ran for {started}")
+    if server.queue_metrics.coalesced != 2:
+        errors.append(f"coalesced count is {server.queue_metrics.coalesced}, expected 2")
+    if server.queue_metrics.waits != 2:
+        errors.append(f"{server.queue_metrics.waits} queue waits recorded, expected one per computation")
+    if not server.cancel_request(1):
+        errors.append("cancel_request did not find a coalesced call")
+    await asyncio.sleep(0.01)
+    if cancelled:
+        errors.append("the shared call was cancelled while callers were still waiting")
+    release.set()
+    responses = await asyncio.gather(*shared, return_exceptions=True)
+    if responses[0] is not None:
+        errors.append("the cancelled caller got a response")
+    texts = [
+        response["result"]["content"][0]["text"] if isinstance(response, dict) else repr(response)
+        for response in responses[1:]
+    ]
+    if texts != ["a", "a", "b"]:
+        errors.append(f"callers got {texts}, expected ['a', 'a', 'b']")
+
+    # The computation is cancelled once its last caller leaves, and forgotten
+    release.clear()
+    started.clear()
+    lone = call(5, "c")
+    await asyncio.sleep(0.01)
+    server.cancel_request(5)
+    if await lone is not None:
+        errors.append("the cancelled caller got a response")
+    await asyncio.sleep(0.01)
+    if cancelled != ["c"]:
+        errors.append(f"cancelled computations are {cancelled}, expected ['c']")
+    if server._shared_calls:
+        errors.append("finished shared calls were not forgotten")
+    release.set()
+    response = await call(6, "c")
+    if started != ["c", "c"] or response["result"]["content"][0]["text"] != "c":
+        errors.append("a call after a cancelled computation did not compute afresh")
+    server.close()
+    return errors
+
+
+def find_eager_imports():
+    """Return the lazy modules loaded by importing the server entry point."""
+    src_dir = Path(__file__).parent / "src"
+    env = dict(os.environ, PYTHONPATH=str(src_dir))
+    output = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, multiplatform_code_generator.main; print(*sys.modules, sep='\\n')"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    loaded = set(output.split())
+    return [module for module in LAZY_MODULES if module in loaded]
+
 
 async def main():
     """Run the tests."""
@@ -121,6 +462,66 @@ async def main():
 
             print(f"\n📁 Test files were created in: {temp_dir}")
 
+        # Test 5: Array signatures
+        print("\n📐 Test 5: Array Signatures on Every Platform")
+        array_errors = find_array_binding_errors()
+        if array_errors:
+            print("❌ Array signatures bound incorrectly:")
+            for error in array_errors:
+                print(f"   - {error}")
+            return 1
+        print("✅ Arrays map to native types on Android, iOS and HarmonyOS")
+
+        # Test 6: Class declarations
+        print("\n🏛️  Test 6: C++ Class Parsing")
+        class_errors = find_class_parsing_errors()
+        if class_errors:
+            print("❌ Class declarations parsed incorrectly:")
+            for error in class_errors:
+                print(f"   - {error}")
+            return 1
+        print("✅ Public constructors and methods are kept, other members skipped")
+
+        # Test 7: Argument validation
+        print("\n🧾 Test 7: Tool Argument Validation")
+        validation_errors = find_validation_errors()
+        if validation_errors:
+            print("❌ Arguments validated incorrectly:")
+            for error in validation_errors:
+                print(f"   - {error}")
+            return 1
+        print("✅ Required fields, types, enums, minimums and additional properties are checked")
+
+        # Test 8: Result cache
+        print("\n🗃️  Test 8: Result Cache")
+        cache_errors = find_result_cache_errors()
+        if cache_errors:
+            print("❌ Result cache misbehaved:")
+            for error in cache_errors:
+                print(f"   - {error}")
+            return 1
+        print("✅ Keys are canonical, entries evict in LRU order and expire after their TTL")
+
+        # Test 9: Single-flight tool calls
+        print("\n🔀 Test 9: Coalesced Tool Calls")
+        single_flight_errors = await find_single_flight_errors()
+        if single_flight_errors:
+            print("❌ Identical tool calls misbehaved:")
+            for error in single_flight_errors:
+                print(f"   - {error}")
+            return 1
+        print("✅ Identical calls share one computation, cancelled once no caller is left")
+
+        # Test 10: Startup imports
+        print("\n⏱️  Test 10: Lazy Imports at Startup")
+        eager_imports = find_eager_imports()
+        if eager_imports:
+            print("❌ Modules imported eagerly at startup:")
+            for module in eager_imports:
+                print(f"   - {module}")
+            return 1
+        print("✅ Generators, request models and file I/O are loaded on first use")
+
     except Exception as e:
         print(f"❌ Test failed: {e}")
         import traceback